@@ -1,7 +1,6 @@
+from dataclasses import replace
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config, pool
-
 from alembic import context
 
 # this is the Alembic Config object, which provides
@@ -15,11 +14,21 @@ if config.config_file_name is not None:
 
 # Import Base and all models so Alembic can detect them
 import app.models  # noqa: E402, F401
-from app.database import Base  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.database import Base, create_db_engine  # noqa: E402
+
+config.set_main_option("sqlalchemy.url", settings.database_url)
 
 target_metadata = Base.metadata
 
 
+def include_object(obj, name, type_, reflected, compare_to):
+    # The card search indexes and shadow tables are created with raw DDL.
+    if type_ == "table":
+        return not name.startswith("cards_fts")
+    return not (type_ == "index" and name == "ix_cards_search")
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -38,6 +47,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -51,14 +61,23 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    # The app's engine factory picks the same blocking driver for each backend
+    # (psycopg2 for PostgreSQL) and applies the SQLite pragmas. Index builds on
+    # big tables may run long, so the statement timeout is lifted.
+    connectable = create_db_engine(replace(settings, postgres_statement_timeout_ms=0))
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        if connection.dialect.name == "sqlite":
+            # Batch operations rebuild a table by copying and dropping it,
+            # which must not cascade to the rows that reference it. The pragma
+            # only takes effect outside a transaction.
+            connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            connection.commit()
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,90 @@
+"""cascade_deletes_on_foreign_keys
+
+Revision ID: 9a11d4732556
+Revises: b58f7a7a7f76
+Create Date: 2026-10-18 02:00:51.639461
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "9a11d4732556"
+down_revision: Union[str, Sequence[str], None] = "b58f7a7a7f76"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table, column and referred table of each foreign key that gets the cascade.
+FOREIGN_KEYS = [
+    ("columns", "board_id", "boards"),
+    ("cards", "column_id", "columns"),
+    ("board_changes", "board_id", "boards"),
+]
+
+# PostgreSQL named the constraints like this; SQLite left them unnamed, and
+# batch mode finds them under the same names through this convention.
+NAMING_CONVENTION = {"fk": "%(table_name)s_%(column_0_name)s_fkey"}
+
+# SQLite used to leave foreign keys unenforced; rows orphaned before they were
+# would fail the new constraints' checks.
+DELETE_ORPHANS = [
+    "DELETE FROM board_changes WHERE board_id NOT IN (SELECT id FROM boards)",
+    "DELETE FROM columns WHERE board_id NOT IN (SELECT id FROM boards)",
+    "DELETE FROM cards WHERE column_id NOT IN (SELECT id FROM columns)",
+]
+
+# Rebuilding ``cards`` on SQLite drops the triggers that keep ``cards_fts`` in
+# step (see d2a6f0e8c417).
+CARD_SEARCH_TRIGGERS = [
+    """
+    CREATE TRIGGER cards_fts_insert AFTER INSERT ON cards BEGIN
+        INSERT INTO cards_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER cards_fts_delete AFTER DELETE ON cards BEGIN
+        INSERT INTO cards_fts(cards_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER cards_fts_update AFTER UPDATE OF title, description ON cards
+    BEGIN
+        INSERT INTO cards_fts(cards_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO cards_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+
+def _replace_foreign_keys(ondelete: str | None) -> None:
+    sqlite = op.get_bind().dialect.name == "sqlite"
+    if sqlite:
+        for statement in DELETE_ORPHANS:
+            op.execute(statement)
+    for table, column, referred in FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        with op.batch_alter_table(
+            table, naming_convention=NAMING_CONVENTION
+        ) as batch_op:
+            batch_op.drop_constraint(name, type_="foreignkey")
+            batch_op.create_foreign_key(
+                name, referred, [column], ["id"], ondelete=ondelete
+            )
+    if sqlite:
+        for statement in CARD_SEARCH_TRIGGERS:
+            op.execute(statement)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _replace_foreign_keys("CASCADE")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_foreign_keys(None)
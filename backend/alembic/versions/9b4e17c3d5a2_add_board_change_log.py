@@ -0,0 +1,53 @@
+"""add_board_change_log
+
+Revision ID: 9b4e17c3d5a2
+Revises: 3f8d2c61a0b7
+Create Date: 2026-10-18 14:22:09.184305
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "9b4e17c3d5a2"
+down_revision: Union[str, Sequence[str], None] = "3f8d2c61a0b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "board_changes",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("board_id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("entity", sa.String(), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["board_id"], ["boards.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_board_changes_board_id_version",
+        "board_changes",
+        ["board_id", "version"],
+        unique=False,
+    )
+    op.add_column(
+        "boards",
+        sa.Column(
+            "compacted_version", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+    # Existing boards have no history, so deltas can only start from now.
+    op.execute("UPDATE boards SET compacted_version = version")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("boards", "compacted_version")
+    op.drop_index("ix_board_changes_board_id_version", table_name="board_changes")
+    op.drop_table("board_changes")
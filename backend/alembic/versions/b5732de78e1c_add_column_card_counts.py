@@ -0,0 +1,43 @@
+"""add_column_card_counts
+
+Revision ID: b5732de78e1c
+Revises: c6e914f0b7cd
+Create Date: 2026-10-18 02:12:17.443285
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "b5732de78e1c"
+down_revision: Union[str, Sequence[str], None] = "c6e914f0b7cd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "columns",
+        sa.Column("card_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        "UPDATE columns SET card_count = "
+        "(SELECT count(*) FROM cards WHERE cards.column_id = columns.id)"
+    )
+    op.create_index(
+        "ix_cards_column_id_due_date",
+        "cards",
+        ["column_id", "due_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_cards_column_id_due_date", table_name="cards")
+    with op.batch_alter_table("columns") as batch_op:
+        batch_op.drop_column("card_count")
@@ -0,0 +1,38 @@
+"""add_postgres_card_search_index
+
+Revision ID: b58f7a7a7f76
+Revises: 5a7c9e1f3b26
+Create Date: 2026-10-18 18:04:21.266197
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "b58f7a7a7f76"
+down_revision: Union[str, Sequence[str], None] = "5a7c9e1f3b26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UPGRADE = """
+    CREATE INDEX ix_cards_search ON cards USING gin ((
+        setweight(to_tsvector('simple', cards.title), 'A') ||
+        setweight(to_tsvector('simple', coalesce(cards.description, '')), 'B')
+    ))
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite searches through its FTS5 table instead.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(UPGRADE)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_cards_search", table_name="cards")
@@ -0,0 +1,81 @@
+"""never_reuse_card_ids
+
+Revision ID: b66deaa6201c
+Revises: b5732de78e1c
+Create Date: 2026-10-18 02:27:04.364272
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "b66deaa6201c"
+down_revision: Union[str, Sequence[str], None] = "b5732de78e1c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rebuilding ``cards`` on SQLite drops the triggers that keep ``cards_fts`` in
+# step (see d2a6f0e8c417).
+CARD_SEARCH_TRIGGERS = [
+    """
+    CREATE TRIGGER cards_fts_insert AFTER INSERT ON cards BEGIN
+        INSERT INTO cards_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER cards_fts_delete AFTER DELETE ON cards BEGIN
+        INSERT INTO cards_fts(cards_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER cards_fts_update AFTER UPDATE OF title, description ON cards
+    BEGIN
+        INSERT INTO cards_fts(cards_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO cards_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+# Archived cards keep their ids, so new ids must start above those too.
+SEED_CARD_SEQUENCE = [
+    "DELETE FROM sqlite_sequence WHERE name = 'cards'",
+    """
+    INSERT INTO sqlite_sequence (name, seq) VALUES ('cards', max(
+        (SELECT coalesce(max(id), 0) FROM cards),
+        (SELECT coalesce(max(id), 0) FROM cards_archive)
+    ))
+    """,
+]
+
+
+def _rebuild_cards(autoincrement: bool) -> None:
+    # PostgreSQL sequences never hand out an id twice; only SQLite reuses the
+    # largest rowid once it has been deleted, unless the table is AUTOINCREMENT.
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    with op.batch_alter_table(
+        "cards",
+        recreate="always",
+        table_kwargs={"sqlite_autoincrement": autoincrement},
+    ):
+        pass
+    for statement in CARD_SEARCH_TRIGGERS:
+        op.execute(statement)
+    if autoincrement:
+        for statement in SEED_CARD_SEQUENCE:
+            op.execute(statement)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rebuild_cards(autoincrement=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rebuild_cards(autoincrement=False)
@@ -0,0 +1,89 @@
+"""add_card_archive
+
+Revision ID: c6e914f0b7cd
+Revises: 9a11d4732556
+Create Date: 2026-10-18 02:07:53.128662
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "c6e914f0b7cd"
+down_revision: Union[str, Sequence[str], None] = "9a11d4732556"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rebuilding ``cards`` on SQLite drops the triggers that keep ``cards_fts`` in
+# step (see d2a6f0e8c417).
+CARD_SEARCH_TRIGGERS = [
+    """
+    CREATE TRIGGER cards_fts_insert AFTER INSERT ON cards BEGIN
+        INSERT INTO cards_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER cards_fts_delete AFTER DELETE ON cards BEGIN
+        INSERT INTO cards_fts(cards_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER cards_fts_update AFTER UPDATE OF title, description ON cards
+    BEGIN
+        INSERT INTO cards_fts(cards_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO cards_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+
+def _restore_card_search_triggers() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        for statement in CARD_SEARCH_TRIGGERS:
+            op.execute(statement)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "cards_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("column_id", sa.Integer(), nullable=False),
+        sa.Column("due_date", sa.DateTime(), nullable=True),
+        sa.Column("assignee", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["column_id"], ["columns.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_cards_archive_column_id_archived_at",
+        "cards_archive",
+        ["column_id", "archived_at"],
+        unique=False,
+    )
+    op.add_column("cards", sa.Column("moved_at", sa.DateTime(), nullable=True))
+    # When existing cards entered their column is unknown; count from creation.
+    op.execute("UPDATE cards SET moved_at = created_at")
+    with op.batch_alter_table("cards") as batch_op:
+        batch_op.alter_column("moved_at", existing_type=sa.DateTime(), nullable=False)
+    _restore_card_search_triggers()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("cards") as batch_op:
+        batch_op.drop_column("moved_at")
+    _restore_card_search_triggers()
+    op.drop_index("ix_cards_archive_column_id_archived_at", table_name="cards_archive")
+    op.drop_table("cards_archive")
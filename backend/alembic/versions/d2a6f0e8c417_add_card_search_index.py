@@ -0,0 +1,73 @@
+"""add_card_search_index
+
+Revision ID: d2a6f0e8c417
+Revises: 9b4e17c3d5a2
+Create Date: 2026-10-18 15:47:31.602118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "d2a6f0e8c417"
+down_revision: Union[str, Sequence[str], None] = "9b4e17c3d5a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE cards_fts USING fts5(
+        title, description,
+        content='cards', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER cards_fts_insert AFTER INSERT ON cards BEGIN
+        INSERT INTO cards_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER cards_fts_delete AFTER DELETE ON cards BEGIN
+        INSERT INTO cards_fts(cards_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER cards_fts_update AFTER UPDATE OF title, description ON cards
+    BEGIN
+        INSERT INTO cards_fts(cards_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO cards_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    # Index the cards that already exist.
+    "INSERT INTO cards_fts(cards_fts) VALUES ('rebuild')",
+]
+
+DOWNGRADE = [
+    "DROP TRIGGER cards_fts_update",
+    "DROP TRIGGER cards_fts_delete",
+    "DROP TRIGGER cards_fts_insert",
+    "DROP TABLE cards_fts",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # FTS5 is SQLite-only; other databases search without an index.
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for statement in UPGRADE:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for statement in DOWNGRADE:
+        op.execute(statement)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import ColumnElement, Select, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.changes import log_changes, publish_change, touch_boards
+from app.config import settings
+from app.counts import adjust_card_counts, card_count_deltas
+from app.database import AsyncSessionLocal, utc_now
+from app.models.archive import ArchivedCard
+from app.models.card import Card
+from app.models.column import Column
+
+logger = logging.getLogger(__name__)
+
+# Card fields kept in the archive, and restored from it.
+ARCHIVED_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "position",
+    "column_id",
+    "due_date",
+    "assignee",
+    "created_at",
+)
+
+
+async def archive_cards(
+    db: AsyncSession, column_id: int, condition: ColumnElement[bool] | None = None
+) -> tuple[dict[int, int], list[int]]:
+    """Move the cards of a column, or those matching ``condition``, to the archive.
+
+    The cards are deleted with ``RETURNING`` and exactly the returned rows are
+    archived, inside the caller's transaction, so a card moved into the column
+    meanwhile is never deleted without being archived. The board is bumped and
+    the cards logged as changed, which delta readers see as deletions.
+    Returns the new board versions and the archived card ids.
+    """
+    stmt = delete(Card).where(Card.column_id == column_id)
+    if condition is not None:
+        stmt = stmt.where(condition)
+    rows = (
+        await db.execute(
+            stmt.returning(*(getattr(Card, field) for field in ARCHIVED_FIELDS)),
+            execution_options={"synchronize_session": False},
+        )
+    ).all()
+    if not rows:
+        return {}, []
+    archived_at = utc_now()
+    await db.execute(
+        insert(ArchivedCard),
+        [{**row._asdict(), "archived_at": archived_at} for row in rows],
+    )
+    card_ids = [row.id for row in rows]
+    await adjust_card_counts(
+        db, card_count_deltas(removed_from=[column_id] * len(card_ids))
+    )
+    versions = await touch_boards(db, column_ids=[column_id])
+    await log_changes(db, versions, card_ids=card_ids)
+    return versions, card_ids
+
+
+def _done_columns() -> Select:
+    """The last column of every board, where finished cards collect."""
+    ranked = select(
+        Column.id,
+        func.row_number()
+        .over(
+            partition_by=Column.board_id,
+            order_by=(Column.position.desc(), Column.id.desc()),
+        )
+        .label("rank"),
+    ).subquery()
+    return select(ranked.c.id).where(ranked.c.rank == 1)
+
+
+async def archive_done_cards(
+    session_factory: async_sessionmaker[AsyncSession],
+    after_days: int,
+    now: datetime | None = None,
+) -> int:
+    """Archive the cards that have sat in their board's last column for too long.
+
+    A card qualifies once ``after_days`` days have passed since it entered
+    that column. Each board is archived in its own short transaction, so
+    writers are never held up for long. Returns how many cards were archived.
+    """
+    cutoff = (now or utc_now()) - timedelta(days=after_days)
+    async with session_factory() as db:
+        column_ids = list(await db.scalars(_done_columns()))
+    archived = 0
+    for column_id in column_ids:
+        async with session_factory() as db:
+            versions, card_ids = await archive_cards(
+                db, column_id, Card.moved_at < cutoff
+            )
+            await db.commit()
+        if card_ids:
+            await publish_change(
+                versions,
+                "column.archived",
+                {"column_id": column_id, "card_ids": card_ids},
+            )
+            archived += len(card_ids)
+    return archived
+
+
+class AutoArchiver:
+    """Runs :func:`archive_done_cards` periodically in the background.
+
+    Disabled when ``after_days`` is zero. Every worker runs its own archiver;
+    that is harmless, because a card can only be deleted from ``cards`` once.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        after_days: int,
+        interval_seconds: int,
+    ) -> None:
+        self.session_factory = session_factory
+        self.after_days = after_days
+        self.interval_seconds = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        if self.after_days > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                archived = await archive_done_cards(
+                    self.session_factory, self.after_days
+                )
+            except Exception:
+                logger.exception("Archiving done cards failed")
+            else:
+                if archived:
+                    logger.info("Archived %d done cards", archived)
+            await asyncio.sleep(self.interval_seconds)
+
+
+auto_archiver = AutoArchiver(
+    AsyncSessionLocal, settings.archive_after_days, settings.archive_interval_seconds
+)
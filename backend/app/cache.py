@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from app.config import Settings, settings
+
+try:
+    import redis.asyncio as redis
+    from redis.asyncio import RedisError
+except ImportError:  # pragma: no cover - redis is only needed for a shared cache
+    redis = None
+
+    class RedisError(Exception):
+        """Stand-in so that the shared cache's error handling needs no redis."""
+
+
+logger = logging.getLogger(__name__)
+
+# Kinds of payload cached per board: the full tree and its column list.
+BOARD = "board"
+COLUMNS = "columns"
+KINDS = (BOARD, COLUMNS)
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how well a cache is doing."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+    max_bytes: int = 0
+
+
+class PayloadLRU:
+    """LRU store of encoded board payloads, bounded by their total size.
+
+    Each board has at most one entry per kind, tagged with the board version
+    it was built from; a lookup only hits when the versions match, so a
+    payload cached by a request that raced with a write is never served.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[int, str], tuple[int, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._stats = CacheStats()
+
+    def get(self, board_id: int, version: int, kind: str = BOARD) -> bytes | None:
+        key = (board_id, kind)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            self._stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return entry[1]
+
+    def put(
+        self, board_id: int, version: int, payload: bytes, kind: str = BOARD
+    ) -> None:
+        if len(payload) > self.max_bytes:
+            return
+        key = (board_id, kind)
+        current = self._entries.get(key)
+        if current is not None and current[0] > version:
+            return
+        self._discard(key)
+        self._entries[key] = (version, payload)
+        self._bytes += len(payload)
+        while self._bytes > self.max_bytes:
+            self._discard(next(iter(self._entries)))
+            self._stats.evictions += 1
+
+    def invalidate(self, board_id: int) -> None:
+        discarded = [self._discard((board_id, kind)) for kind in KINDS]
+        if any(discarded):
+            self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+        self._stats = CacheStats()
+
+    def stats(self) -> dict[str, int]:
+        self._stats.entries = len(self._entries)
+        self._stats.bytes = self._bytes
+        self._stats.max_bytes = self.max_bytes
+        return asdict(self._stats)
+
+    def _discard(self, key: tuple[int, str]) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= len(entry[1])
+        return True
+
+
+class BoardCache(ABC):
+    """Where encoded board payloads are kept between requests.
+
+    Readers look payloads up by board id, board version and kind; writers call
+    :meth:`invalidate` after committing so every worker drops the stale
+    entries at once.
+    """
+
+    @abstractmethod
+    async def get(
+        self, board_id: int, version: int, kind: str = BOARD
+    ) -> bytes | None: ...
+
+    @abstractmethod
+    async def put(
+        self, board_id: int, version: int, payload: bytes, kind: str = BOARD
+    ) -> None: ...
+
+    @abstractmethod
+    async def invalidate(self, board_id: int) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget the entries held by this process and reset the counters."""
+
+    @abstractmethod
+    def stats(self) -> dict[str, int]: ...
+
+    @property
+    @abstractmethod
+    def max_payload_bytes(self) -> int:
+        """Size of the largest payload :meth:`put` will keep."""
+
+    async def start(self) -> None:
+        """Open background resources; called once the event loop is running."""
+
+    async def close(self) -> None:
+        """Release background resources on shutdown."""
+
+
+class MemoryBoardCache(BoardCache):
+    """Per-process cache; fine for a single worker."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._lru = PayloadLRU(max_bytes)
+
+    async def get(self, board_id: int, version: int, kind: str = BOARD) -> bytes | None:
+        return self._lru.get(board_id, version, kind)
+
+    async def put(
+        self, board_id: int, version: int, payload: bytes, kind: str = BOARD
+    ) -> None:
+        self._lru.put(board_id, version, payload, kind)
+
+    async def invalidate(self, board_id: int) -> None:
+        self._lru.invalidate(board_id)
+
+    def clear(self) -> None:
+        self._lru.clear()
+
+    def stats(self) -> dict[str, int]:
+        return self._lru.stats()
+
+    @property
+    def max_payload_bytes(self) -> int:
+        return self._lru.max_bytes
+
+
+class RedisBoardCache(BoardCache):
+    """Cache shared by all workers through a Redis-protocol server.
+
+    Payloads live in one hash per board, keyed by kind and prefixed with the
+    board version they were built from. Each worker also keeps the payloads
+    it served recently in a local :class:`PayloadLRU`, which skips the round
+    trip for hot boards. Invalidations delete the shared hash and are
+    broadcast on a pub/sub channel so other workers drop their local copies
+    too; should a message be lost, the version check still keeps stale
+    copies from being served.
+
+    The cache fails soft: while Redis is unreachable, lookups count as misses
+    and stores and invalidations only reach the local copies. Failed calls
+    are logged and counted as ``shared_errors``.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        local_max_bytes: int,
+        ttl_seconds: int,
+        namespace: str = "kanban",
+    ) -> None:
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+        self.channel = f"{namespace}:invalidate"
+        self._local = PayloadLRU(local_max_bytes)
+        self._shared_hits = 0
+        self._shared_misses = 0
+        self._shared_errors = 0
+        self._pubsub: Any = None
+        self._listener: asyncio.Task[None] | None = None
+
+    def _key(self, board_id: int) -> str:
+        return f"{self.namespace}:board:{board_id}"
+
+    def _failed(self, action: str, board_id: int) -> None:
+        self._shared_errors += 1
+        logger.warning(
+            "Shared cache %s failed for board %d", action, board_id, exc_info=True
+        )
+
+    async def get(self, board_id: int, version: int, kind: str = BOARD) -> bytes | None:
+        payload = self._local.get(board_id, version, kind)
+        if payload is not None:
+            return payload
+        try:
+            value = await self.client.hget(self._key(board_id), kind)
+        except RedisError:
+            self._failed("lookup", board_id)
+            value = None
+        if value is not None:
+            stored, _, payload = value.partition(b":")
+            if int(stored) == version:
+                self._shared_hits += 1
+                self._local.put(board_id, version, payload, kind)
+                return payload
+        self._shared_misses += 1
+        return None
+
+    async def put(
+        self, board_id: int, version: int, payload: bytes, kind: str = BOARD
+    ) -> None:
+        self._local.put(board_id, version, payload, kind)
+        key = self._key(board_id)
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.hset(key, kind, b"%d:%b" % (version, payload))
+                pipe.expire(key, self.ttl_seconds)
+                await pipe.execute()
+        except RedisError:
+            self._failed("store", board_id)
+
+    async def invalidate(self, board_id: int) -> None:
+        self._local.invalidate(board_id)
+        # A payload left behind in Redis is still tagged with an older board
+        # version, so it is never served.
+        try:
+            await self.client.delete(self._key(board_id))
+            await self.client.publish(self.channel, str(board_id))
+        except RedisError:
+            self._failed("invalidation", board_id)
+
+    def clear(self) -> None:
+        self._local.clear()
+        self._shared_hits = 0
+        self._shared_misses = 0
+        self._shared_errors = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            **self._local.stats(),
+            "shared_hits": self._shared_hits,
+            "shared_misses": self._shared_misses,
+            "shared_errors": self._shared_errors,
+        }
+
+    @property
+    def max_payload_bytes(self) -> int:
+        return self._local.max_bytes
+
+    async def start(self) -> None:
+        self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        await self.client.aclose()
+
+    async def _listen(self) -> None:
+        async for message in self._pubsub.listen():
+            if message["type"] == "message":
+                self._local.invalidate(int(message["data"]))
+
+
+def create_board_cache(config: Settings) -> BoardCache:
+    """Build the cache selected by ``config.cache_url``.
+
+    An empty URL keeps payloads in process memory; a ``redis://`` or
+    ``rediss://`` URL shares them between workers and needs the ``redis``
+    package.
+    """
+    if not config.cache_url:
+        return MemoryBoardCache(config.board_cache_bytes)
+    if redis is None:
+        raise RuntimeError("KANBAN_CACHE_URL requires the redis package")
+    return RedisBoardCache(
+        redis.from_url(config.cache_url),
+        local_max_bytes=config.board_cache_bytes,
+        ttl_seconds=config.cache_ttl_seconds,
+    )
+
+
+board_cache = create_board_cache(settings)
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import delete, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import board_cache
+from app.config import settings
+from app.events import BoardEvent, hub
+from app.models.board import Board
+from app.models.card import Card
+from app.models.change import BoardChange
+from app.models.column import Column
+from app.schemas.board import BoardChanges
+from app.schemas.card import CardRead
+from app.schemas.column import ColumnSummary
+
+CARD = "card"
+COLUMN = "column"
+
+
+async def touch_boards(
+    db: AsyncSession,
+    *,
+    board_ids: Iterable[int] = (),
+    column_ids: Iterable[int] = (),
+) -> dict[int, int]:
+    """Bump the version of every board affected by a mutation.
+
+    Boards can be named directly or through any of their columns. All of them
+    are bumped with one ``UPDATE``, inside the caller's transaction, so the new
+    versions become visible together with the change. Returns the new version
+    of each bumped board.
+    """
+    board_ids = set(board_ids)
+    column_ids = set(column_ids)
+    if not board_ids and not column_ids:
+        return {}
+    stmt = (
+        update(Board)
+        .where(
+            or_(
+                Board.id.in_(board_ids),
+                Board.id.in_(select(Column.board_id).where(Column.id.in_(column_ids))),
+            )
+        )
+        .values(version=Board.version + 1)
+        .returning(Board.id, Board.version)
+        .execution_options(synchronize_session=False)
+    )
+    return {row.id: row.version for row in await db.execute(stmt)}
+
+
+async def log_changes(
+    db: AsyncSession,
+    versions: dict[int, int],
+    *,
+    card_ids: Iterable[int] = (),
+    column_ids: Iterable[int] = (),
+) -> None:
+    """Record the cards and columns changed by a mutation in the change log.
+
+    ``versions`` is the result of :func:`touch_boards`; every affected board
+    gets an entry for every changed row. Every ``change_log_retention``
+    versions a board's log is trimmed to the most recent
+    ``change_log_retention`` versions.
+    """
+    entities = [(CARD, card_id) for card_id in set(card_ids)]
+    entities += [(COLUMN, column_id) for column_id in set(column_ids)]
+    rows = [
+        {"board_id": board_id, "version": version, "entity": e, "entity_id": i}
+        for board_id, version in versions.items()
+        for e, i in entities
+    ]
+    if rows:
+        await db.execute(insert(BoardChange), rows)
+    retention = settings.change_log_retention
+    for board_id, version in versions.items():
+        if version % retention == 0:
+            await compact_changes(db, board_id, version - retention)
+
+
+async def compact_changes(db: AsyncSession, board_id: int, up_to: int) -> None:
+    """Drop a board's change log entries up to and including version ``up_to``."""
+    await db.execute(
+        delete(BoardChange).where(
+            BoardChange.board_id == board_id, BoardChange.version <= up_to
+        )
+    )
+    await db.execute(
+        update(Board)
+        .where(Board.id == board_id, Board.compacted_version < up_to)
+        .values(compacted_version=up_to)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def load_changes(
+    db: AsyncSession, board_id: int, since: int, version: int
+) -> BoardChanges:
+    """Collect the rows of a board changed after ``since``, up to ``version``.
+
+    Changed rows are looked up in their current state with one query per
+    entity type; rows that no longer exist on the board are reported as
+    deleted.
+    """
+    rows = await db.execute(
+        select(BoardChange.entity, BoardChange.entity_id)
+        .where(
+            BoardChange.board_id == board_id,
+            BoardChange.version > since,
+            BoardChange.version <= version,
+        )
+        .distinct()
+    )
+    changed: dict[str, set[int]] = {CARD: set(), COLUMN: set()}
+    for row in rows:
+        changed[row.entity].add(row.entity_id)
+
+    columns = []
+    if changed[COLUMN]:
+        columns = list(
+            await db.scalars(
+                select(Column)
+                .where(Column.id.in_(changed[COLUMN]), Column.board_id == board_id)
+                .order_by(Column.position, Column.id)
+            )
+        )
+    cards = []
+    if changed[CARD]:
+        cards = list(
+            await db.scalars(
+                select(Card)
+                .join(Column)
+                .where(Card.id.in_(changed[CARD]), Column.board_id == board_id)
+                .order_by(Card.column_id, Card.position, Card.id)
+            )
+        )
+    return BoardChanges(
+        since=since,
+        version=version,
+        columns=[ColumnSummary.model_validate(column) for column in columns],
+        cards=[CardRead.model_validate(card) for card in cards],
+        deleted_column_ids=sorted(changed[COLUMN] - {c.id for c in columns}),
+        deleted_card_ids=sorted(changed[CARD] - {c.id for c in cards}),
+    )
+
+
+async def publish_change(versions: dict[int, int], event_type: str, data: Any) -> None:
+    """Announce a committed change to the subscribers of each affected board.
+
+    The boards' cached payloads are dropped first. ``versions`` is the result
+    of :func:`touch_boards`; call this only after the transaction has
+    committed.
+    """
+    for board_id, version in versions.items():
+        await board_cache.invalidate(board_id)
+        hub.publish(BoardEvent(board_id, version, event_type, data))
+
+
+def card_data(card: Card) -> dict[str, Any]:
+    return CardRead.model_validate(card).model_dump(mode="json")
+
+
+def column_data(column: Column) -> dict[str, Any]:
+    return ColumnSummary.model_validate(column).model_dump(mode="json")
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return default if value is None or value == "" else int(value)
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Runtime settings, overridable through ``KANBAN_*`` environment variables."""
+
+    database_url: str = "sqlite:///./kanban.db"
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size_kib: int = 64 * 1024
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    postgres_statement_timeout_ms: int = 30_000
+    event_queue_size: int = 100
+    change_log_retention: int = 1000
+    board_cache_bytes: int = 64 * 1024 * 1024
+    cache_url: str = ""
+    cache_ttl_seconds: int = 3600
+    archive_after_days: int = 0
+    archive_interval_seconds: int = 3600
+
+    @classmethod
+    def from_env(cls) -> Settings:
+        """Build settings from the environment, falling back to the defaults."""
+        defaults = cls()
+        return cls(
+            database_url=os.environ.get("KANBAN_DATABASE_URL", defaults.database_url),
+            pool_size=_env_int("KANBAN_DB_POOL_SIZE", defaults.pool_size),
+            max_overflow=_env_int("KANBAN_DB_MAX_OVERFLOW", defaults.max_overflow),
+            pool_timeout=_env_int("KANBAN_DB_POOL_TIMEOUT", defaults.pool_timeout),
+            sqlite_busy_timeout_ms=_env_int(
+                "KANBAN_SQLITE_BUSY_TIMEOUT_MS", defaults.sqlite_busy_timeout_ms
+            ),
+            sqlite_cache_size_kib=_env_int(
+                "KANBAN_SQLITE_CACHE_SIZE_KIB", defaults.sqlite_cache_size_kib
+            ),
+            sqlite_mmap_size=_env_int(
+                "KANBAN_SQLITE_MMAP_SIZE", defaults.sqlite_mmap_size
+            ),
+            postgres_statement_timeout_ms=_env_int(
+                "KANBAN_POSTGRES_STATEMENT_TIMEOUT_MS",
+                defaults.postgres_statement_timeout_ms,
+            ),
+            event_queue_size=_env_int(
+                "KANBAN_EVENT_QUEUE_SIZE", defaults.event_queue_size
+            ),
+            change_log_retention=_env_int(
+                "KANBAN_CHANGE_LOG_RETENTION", defaults.change_log_retention
+            ),
+            board_cache_bytes=_env_int(
+                "KANBAN_BOARD_CACHE_BYTES", defaults.board_cache_bytes
+            ),
+            cache_url=os.environ.get("KANBAN_CACHE_URL", defaults.cache_url),
+            cache_ttl_seconds=_env_int(
+                "KANBAN_CACHE_TTL_SECONDS", defaults.cache_ttl_seconds
+            ),
+            archive_after_days=_env_int(
+                "KANBAN_ARCHIVE_AFTER_DAYS", defaults.archive_after_days
+            ),
+            archive_interval_seconds=_env_int(
+                "KANBAN_ARCHIVE_INTERVAL_SECONDS", defaults.archive_interval_seconds
+            ),
+        )
+
+
+settings = Settings.from_env()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+
+from sqlalchemy import Update, case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.card import Card
+from app.models.column import Column
+
+
+def card_count_deltas(
+    removed_from: Iterable[int] = (), added_to: Iterable[int] = ()
+) -> Counter[int]:
+    """Net change in each column's card count.
+
+    Name a column once in ``removed_from`` for every card that left it and
+    once in ``added_to`` for every card that arrived; a card moved within a
+    column cancels out.
+    """
+    deltas = Counter(added_to)
+    deltas.subtract(removed_from)
+    return deltas
+
+
+async def adjust_card_counts(db: AsyncSession, deltas: Counter[int]) -> None:
+    """Apply :func:`card_count_deltas` to ``Column.card_count`` in one ``UPDATE``.
+
+    Runs inside the caller's transaction, so the counts always match the
+    cards that transaction commits.
+    """
+    deltas = {column_id: delta for column_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    await db.execute(
+        update(Column)
+        .where(Column.id.in_(deltas))
+        .values(card_count=Column.card_count + case(deltas, value=Column.id))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def recount_cards() -> Update:
+    """Statement resetting every column's card count from its cards.
+
+    For rows written without going through the API, such as bulk seeding.
+    """
+    return update(Column).values(
+        card_count=select(func.count(Card.id))
+        .where(Card.column_id == Column.id)
+        .scalar_subquery()
+    )
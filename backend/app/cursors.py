@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+
+
+class InvalidCursorError(ValueError):
+    """A cursor passed back by a client is not one the API handed out."""
+
+
+def encode_cursor(*key: datetime | int) -> str:
+    """Encode the sort key of a page's last item as an opaque cursor."""
+    parts = [part.isoformat() if isinstance(part, datetime) else part for part in key]
+    return base64.urlsafe_b64encode(json.dumps(parts).encode()).decode()
+
+
+def decode_cursor(
+    cursor: str, *types: type[datetime] | type[int]
+) -> tuple[datetime | int, ...]:
+    """Recover the key encoded by :func:`encode_cursor`.
+
+    ``types`` gives the type of each part of the key. Raises
+    :class:`InvalidCursorError` if ``cursor`` does not hold such a key.
+    """
+    try:
+        parts = json.loads(base64.urlsafe_b64decode(cursor))
+        if not isinstance(parts, list) or len(parts) != len(types):
+            raise ValueError(parts)
+        return tuple(
+            datetime.fromisoformat(part) if part_type is datetime else int(part)
+            for part_type, part in zip(types, parts, strict=True)
+        )
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError(cursor) from exc
@@ -1,21 +1,155 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from __future__ import annotations
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./kanban.db"
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+from typing import Any
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import StaticPool
+
+from app.config import Settings, settings
+
+SYNC_DRIVERS = {"sqlite": "sqlite", "postgresql": "postgresql+psycopg2"}
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+APPLICATION_NAME = "kanban"
+
+
+def _is_memory_database(url: URL) -> bool:
+    return url.database in (None, "", ":memory:") or "mode=memory" in str(url)
+
+
+def _with_driver(url: URL, drivers: dict[str, str]) -> URL:
+    drivername = drivers.get(url.get_backend_name())
+    return url if drivername is None else url.set(drivername=drivername)
+
+
+def _postgres_connect_args(url: URL, config: Settings) -> dict[str, Any]:
+    """Name the connections and cap statement run time, in each driver's terms."""
+    server_settings = {
+        "application_name": APPLICATION_NAME,
+        "statement_timeout": str(config.postgres_statement_timeout_ms),
+    }
+    if url.get_driver_name() == "asyncpg":
+        return {"server_settings": server_settings}
+    return {
+        "options": " ".join(
+            f"-c {name}={value}" for name, value in server_settings.items()
+        )
+    }
+
+
+def _engine_kwargs(url: URL, config: Settings) -> dict[str, Any]:
+    if url.get_backend_name() != "sqlite":
+        kwargs: dict[str, Any] = {
+            "pool_size": config.pool_size,
+            "max_overflow": config.max_overflow,
+            "pool_timeout": config.pool_timeout,
+            "pool_pre_ping": True,
+        }
+        if url.get_backend_name() == "postgresql":
+            kwargs["connect_args"] = _postgres_connect_args(url, config)
+        return kwargs
+    kwargs: dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+    if _is_memory_database(url):
+        # Every connection to ":memory:" is a separate database, so share one.
+        kwargs["poolclass"] = StaticPool
+    else:
+        kwargs["pool_size"] = config.pool_size
+        kwargs["max_overflow"] = config.max_overflow
+        kwargs["pool_timeout"] = config.pool_timeout
+    return kwargs
+
+
+def _install_sqlite_pragmas(engine: Engine, url: URL, config: Settings) -> None:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection: Any, _record: Any) -> None:
+        """Let readers proceed while a writer holds the lock and wait, not fail.
+
+        Foreign keys are enforced, so deletes cascade as they do elsewhere.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        if not _is_memory_database(url):
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute(f"PRAGMA mmap_size={config.sqlite_mmap_size}")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={config.sqlite_busy_timeout_ms}")
+        cursor.execute(f"PRAGMA cache_size=-{config.sqlite_cache_size_kib}")
+        cursor.close()
+
+
+def create_db_engine(config: Settings) -> Engine:
+    """Create a blocking engine for ``config.database_url``.
+
+    The API itself runs on :func:`create_async_db_engine`; this engine is for
+    Alembic, benchmarks and other scripts. SQLite databases get WAL journaling
+    and connection pragmas applied on connect; other backends get a sized
+    ``QueuePool`` with pre-ping, and PostgreSQL connections a statement
+    timeout.
+    """
+    url = _with_driver(make_url(config.database_url), SYNC_DRIVERS)
+    engine = create_engine(url, **_engine_kwargs(url, config))
+    if url.get_backend_name() == "sqlite":
+        _install_sqlite_pragmas(engine, url, config)
+    return engine
+
+
+def create_async_db_engine(config: Settings) -> AsyncEngine:
+    """Create the asyncio engine used by the API for ``config.database_url``.
+
+    The backend named in the URL picks the driver: ``aiosqlite`` for SQLite
+    and ``asyncpg`` for PostgreSQL. Pool sizing and SQLite pragmas are the
+    same as for :func:`create_db_engine`.
+    """
+    url = _with_driver(make_url(config.database_url), ASYNC_DRIVERS)
+    engine = create_async_engine(url, **_engine_kwargs(url, config))
+    if url.get_backend_name() == "sqlite":
+        _install_sqlite_pragmas(engine.sync_engine, url, config)
+    return engine
+
+
+async_engine = create_async_db_engine(settings)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
 class Base(DeclarativeBase):
     pass
 
 
-def get_db() -> Session:
-    db = SessionLocal()
-    try:
+def utc_now() -> datetime:
+    """Current UTC time as a naive datetime, the form ``DateTime`` columns load.
+
+    Sessions keep objects loaded after commit, so a freshly created row is
+    serialized from this value rather than re-read from the database.
+    """
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+async def begin_snapshot(db: AsyncSession) -> None:
+    """Make the rest of the session's transaction read from one snapshot.
+
+    For reads that span several statements and must agree with each other.
+    Call this before the transaction's first statement. PostgreSQL runs the
+    transaction as ``REPEATABLE READ``. SQLite does not start a transaction
+    for plain reads, so one is opened explicitly; in WAL mode it does not
+    hold up writers.
+    """
+    if db.bind.dialect.name == "postgresql":
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    elif db.bind.dialect.name == "sqlite":
+        await (await db.connection()).exec_driver_sql("BEGIN")
+
+
+async def get_db() -> AsyncGenerator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
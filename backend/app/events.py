@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.config import settings
+
+KEEPALIVE_SECONDS = 15.0
+
+
+@dataclass(frozen=True)
+class BoardEvent:
+    """A change to a board, delivered to the board's subscribers."""
+
+    board_id: int
+    version: int
+    type: str
+    data: Any = None
+
+    def to_sse(self) -> str:
+        """Format the event as a Server-Sent Events message."""
+        payload = json.dumps(
+            {"board_id": self.board_id, "version": self.version, "data": self.data}
+        )
+        return f"id: {self.version}\nevent: {self.type}\ndata: {payload}\n\n"
+
+
+@dataclass(eq=False)
+class Subscription:
+    """One subscriber's bounded queue of events for a board.
+
+    A ``None`` in the queue means the subscription has ended, either because
+    the hub closed or because the subscriber fell too far behind.
+    """
+
+    board_id: int
+    queue: asyncio.Queue[BoardEvent | None]
+    overflowed: bool = field(default=False)
+
+
+class EventHub:
+    """In-process publish/subscribe of board events.
+
+    Every subscriber has its own bounded queue, so a slow reader never delays
+    publishers or other readers. When a queue fills up, its pending events are
+    dropped and the subscription is ended with ``overflowed`` set; the client
+    is expected to reload the board and subscribe again.
+    """
+
+    def __init__(self, max_queue_size: int) -> None:
+        self.max_queue_size = max_queue_size
+        self._subscriptions: dict[int, set[Subscription]] = defaultdict(set)
+
+    def subscribe(self, board_id: int) -> Subscription:
+        subscription = Subscription(board_id, asyncio.Queue(self.max_queue_size + 1))
+        self._subscriptions[board_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscriptions.get(subscription.board_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscriptions[subscription.board_id]
+
+    def subscriber_count(self, board_id: int) -> int:
+        return len(self._subscriptions.get(board_id, ()))
+
+    def publish(self, event: BoardEvent) -> None:
+        for subscription in list(self._subscriptions.get(event.board_id, ())):
+            # One slot is reserved for the end-of-stream marker.
+            if subscription.queue.qsize() < self.max_queue_size:
+                subscription.queue.put_nowait(event)
+                continue
+            while not subscription.queue.empty():
+                subscription.queue.get_nowait()
+            subscription.overflowed = True
+            subscription.queue.put_nowait(None)
+            self.unsubscribe(subscription)
+
+    def close(self) -> None:
+        """End every subscription, e.g. when the application shuts down."""
+        for subscribers in list(self._subscriptions.values()):
+            for subscription in list(subscribers):
+                subscription.queue.put_nowait(None)
+                self.unsubscribe(subscription)
+
+
+hub = EventHub(settings.event_queue_size)
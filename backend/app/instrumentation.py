@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import functools
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Coroutine, Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi.routing import APIRoute
+from sqlalchemy import Engine, event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Upper bounds of the histogram buckets, in seconds and in statements.
+SECONDS_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+@dataclass
+class RequestTiming:
+    """What one request spent its time on, filled in as it is handled."""
+
+    start: float
+    queries: int = 0
+    db_seconds: float = 0.0
+    handler_seconds: float = 0.0
+    handler_end: float | None = None
+
+    def server_timing(self, now: float) -> str:
+        """Format the timings known so far as a ``Server-Timing`` header."""
+        metrics = [
+            f'db;dur={self.db_seconds * 1000:.2f};desc="{self.queries} queries"',
+            f"handler;dur={self.handler_seconds * 1000:.2f}",
+        ]
+        if self.handler_end is not None:
+            metrics.append(f"serialize;dur={(now - self.handler_end) * 1000:.2f}")
+        metrics.append(f"app;dur={(now - self.start) * 1000:.2f}")
+        return ", ".join(metrics)
+
+
+_current: ContextVar[RequestTiming | None] = ContextVar("request_timing", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(
+    _conn: Any,
+    _cursor: Any,
+    _statement: str,
+    _parameters: Any,
+    context: Any,
+    _many: bool,
+) -> None:
+    if _current.get() is not None:
+        context._instrumentation_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(
+    _conn: Any,
+    _cursor: Any,
+    statement: str,
+    _parameters: Any,
+    context: Any,
+    _many: bool,
+) -> None:
+    timing = _current.get()
+    start = getattr(context, "_instrumentation_start", None)
+    if timing is not None and start is not None:
+        # Transaction control is not counted as a query: SQLite's explicit
+        # BEGIN goes through the cursor, PostgreSQL's does not.
+        if statement != "BEGIN":
+            timing.queries += 1
+        timing.db_seconds += time.perf_counter() - start
+
+
+def _timed_endpoint(
+    endpoint: Callable[..., Coroutine[Any, Any, Any]],
+) -> Callable[..., Coroutine[Any, Any, Any]]:
+    @functools.wraps(endpoint)
+    async def timed(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            timing = _current.get()
+            if timing is not None:
+                timing.handler_end = time.perf_counter()
+                timing.handler_seconds += timing.handler_end - start
+
+    return timed
+
+
+class TimedRoute(APIRoute):
+    """Route that records how long its endpoint function runs.
+
+    Dependencies are resolved before and the response is validated and
+    encoded after the endpoint runs; :class:`InstrumentationMiddleware`
+    reports the latter as serialization time.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+
+
+class Histogram:
+    """Prometheus-style cumulative histogram, one series per label set."""
+
+    def __init__(self, name: str, help_text: str, buckets: Iterable[float]) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        # Per label set: the count in each bucket (the last one is +Inf) and
+        # the sum of the observed values.
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, labels: tuple[str, ...], value: float) -> None:
+        counts, total = self._series.setdefault(
+            labels, ([0] * (len(self.buckets) + 1), [0.0])
+        )
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def clear(self) -> None:
+        self._series.clear()
+
+    def render(self, label_names: tuple[str, ...]) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for labels, (counts, total) in sorted(self._series.items()):
+            pairs = [
+                f'{name}="{_escape(value)}"'
+                for name, value in zip(label_names, labels, strict=True)
+            ]
+            cumulative = 0
+            for bound, count in zip((*self.buckets, None), counts, strict=True):
+                cumulative += count
+                le = "+Inf" if bound is None else f"{bound:g}"
+                label_text = ",".join([*pairs, f'le="{le}"'])
+                lines.append(f"{self.name}_bucket{{{label_text}}} {cumulative}")
+            label_text = ",".join(pairs)
+            lines.append(f"{self.name}_sum{{{label_text}}} {total[0]:.6f}")
+            lines.append(f"{self.name}_count{{{label_text}}} {cumulative}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RequestMetrics:
+    """Per-route request histograms, rendered in the Prometheus text format.
+
+    Series are labelled with the method and the route's path template rather
+    than the requested path, so ``/api/boards/1`` and ``/api/boards/2`` share
+    one series and the number of series stays bounded.
+    """
+
+    LABELS = ("method", "route", "status")
+    ROUTE_LABELS = ("method", "route")
+
+    def __init__(self) -> None:
+        self.requests: dict[tuple[str, str, str], int] = {}
+        self.duration = Histogram(
+            "kanban_request_duration_seconds",
+            "Time from receiving a request to sending the last byte.",
+            SECONDS_BUCKETS,
+        )
+        self.handler = Histogram(
+            "kanban_request_handler_seconds",
+            "Time spent in the endpoint function.",
+            SECONDS_BUCKETS,
+        )
+        self.serialize = Histogram(
+            "kanban_request_serialize_seconds",
+            "Time from the endpoint returning to the response starting.",
+            SECONDS_BUCKETS,
+        )
+        self.db = Histogram(
+            "kanban_request_db_seconds",
+            "Time spent executing SQL statements per request.",
+            SECONDS_BUCKETS,
+        )
+        self.queries = Histogram(
+            "kanban_request_queries",
+            "SQL statements executed per request.",
+            QUERY_BUCKETS,
+        )
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        timing: RequestTiming,
+        serialize_seconds: float | None,
+        duration_seconds: float,
+    ) -> None:
+        key = (method, route, str(status))
+        self.requests[key] = self.requests.get(key, 0) + 1
+        labels = (method, route)
+        self.duration.observe(labels, duration_seconds)
+        self.db.observe(labels, timing.db_seconds)
+        self.queries.observe(labels, timing.queries)
+        if timing.handler_end is not None:
+            self.handler.observe(labels, timing.handler_seconds)
+        if serialize_seconds is not None:
+            self.serialize.observe(labels, serialize_seconds)
+
+    def clear(self) -> None:
+        self.requests.clear()
+        for histogram in self._histograms():
+            histogram.clear()
+
+    def render(self) -> str:
+        lines = [
+            "# HELP kanban_requests_total Requests handled, by route and status.",
+            "# TYPE kanban_requests_total counter",
+        ]
+        for labels, count in sorted(self.requests.items()):
+            pairs = ",".join(
+                f'{name}="{_escape(value)}"'
+                for name, value in zip(self.LABELS, labels, strict=True)
+            )
+            lines.append(f"kanban_requests_total{{{pairs}}} {count}")
+        for histogram in self._histograms():
+            lines.extend(histogram.render(self.ROUTE_LABELS))
+        return "\n".join(lines) + "\n"
+
+    def _histograms(self) -> tuple[Histogram, ...]:
+        return (self.duration, self.handler, self.serialize, self.db, self.queries)
+
+
+metrics = RequestMetrics()
+
+
+def _route_template(scope: Scope) -> str:
+    """Path template of the route that handled a request, prefix included.
+
+    Routers are included lazily, so the matched route only knows its path
+    within its own router; the include prefix is whatever precedes the
+    concrete route path in the requested one.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path_format", None)
+    if template is None:
+        return "unmatched"
+    concrete = template.format(**scope.get("path_params", {}))
+    requested = scope["path"]
+    if not requested.endswith(concrete):
+        return template
+    return requested[: len(requested) - len(concrete)] + template
+
+
+class InstrumentationMiddleware:
+    """Time each HTTP request and count the SQL statements it runs.
+
+    The timings known when the response starts are sent back in a
+    ``Server-Timing`` header: time executing SQL (with the statement count),
+    in the endpoint function, serializing its result, and in the app overall.
+    A streamed body is still being produced at that point, so its own work
+    only shows up in :data:`metrics`, which records every request once its
+    last byte has been sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timing = RequestTiming(start=time.perf_counter())
+        token = _current.set(timing)
+        status = 500
+        serialize_seconds: float | None = None
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status, serialize_seconds
+            if message["type"] == "http.response.start":
+                now = time.perf_counter()
+                status = message["status"]
+                if timing.handler_end is not None:
+                    serialize_seconds = now - timing.handler_end
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timing.server_timing(now))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            metrics.observe(
+                scope["method"],
+                _route_template(scope),
+                status,
+                timing,
+                serialize_seconds,
+                time.perf_counter() - timing.start,
+            )
@@ -0,0 +1,470 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import AsyncIterator, Collection, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Result, Row, Select, func, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.cursors import encode_cursor
+from app.models.archive import ArchivedCard
+from app.models.board import Board
+from app.models.card import Card
+from app.models.column import Column
+from app.responses import dumps
+
+# Cards fetched per round trip, and bytes buffered before a chunk is sent.
+STREAM_BATCH_ROWS = 1000
+STREAM_CHUNK_BYTES = 64 * 1024
+# Columns whose first cards are fetched by one UNION ALL; SQLite allows at
+# most 500 terms in a compound SELECT.
+WINDOW_COLUMNS_PER_QUERY = 250
+
+# Board, column and card fields in the key order of ``BoardRead``.
+BOARD_PAYLOAD_FIELDS = (Board.title, Board.id, Board.created_at, Board.version)
+COLUMN_PAYLOAD_FIELDS = (Column.title, Column.position, Column.board_id, Column.id)
+CARD_PAYLOAD_FIELDS = (
+    Card.title,
+    Card.description,
+    Card.position,
+    Card.column_id,
+    Card.due_date,
+    Card.assignee,
+    Card.id,
+    Card.created_at,
+)
+
+
+@dataclass(frozen=True)
+class Fieldsets:
+    """The fields of boards, columns and cards to load; ``None`` loads all.
+
+    Only the named fields are read from the database and returned, so unused
+    text such as card descriptions is neither read nor encoded. Fields needed
+    to put the tree together (ids, parent ids, and card positions in
+    windows) are read regardless, but left out of the payload unless named.
+    """
+
+    board: frozenset[str] | None = None
+    column: frozenset[str] | None = None
+    card: frozenset[str] | None = None
+
+
+ALL_FIELDS = Fieldsets()
+
+
+def _select_fields(
+    fields: Sequence[Any], wanted: frozenset[str] | None, required: Collection[str]
+) -> tuple[Select, frozenset[str]]:
+    """Select the ``wanted`` and ``required`` fields; return the keys to hide too."""
+    if wanted is None:
+        return select(*fields), frozenset()
+    keep = wanted | frozenset(required)
+    selected = [field for field in fields if field.key in keep]
+    return select(*selected), frozenset(field.key for field in selected) - wanted
+
+
+def _shown(row: dict[str, Any], hidden: frozenset[str]) -> dict[str, Any]:
+    if not hidden:
+        return row
+    return {key: value for key, value in row.items() if key not in hidden}
+
+
+def board_tree_options() -> LoaderOption:
+    """Loader options fetching a board's columns and cards in two extra queries.
+
+    Each level is loaded with a single ``SELECT ... WHERE parent_id IN (...)``
+    so the number of queries does not depend on how many columns or cards the
+    boards contain.
+    """
+    return selectinload(Board.columns).selectinload(Column.cards)
+
+
+async def load_board(db: AsyncSession, board_id: int) -> Board | None:
+    """Load a single board together with its columns and cards."""
+    stmt = select(Board).where(Board.id == board_id).options(board_tree_options())
+    return (await db.scalars(stmt)).first()
+
+
+def _dicts(result: Result) -> list[dict[str, Any]]:
+    # Columns selected from subqueries are keyed by ``str`` subclasses, which
+    # orjson refuses as dict keys.
+    keys = [str(key) for key in result.keys()]
+    return [dict(zip(keys, row, strict=True)) for row in result.all()]
+
+
+def _board_payload_queries(
+    board_id: int | None,
+    fieldsets: Fieldsets = ALL_FIELDS,
+    card_keys: Collection[str] = ("column_id",),
+) -> tuple[Select, Select, Select, Fieldsets]:
+    """Row queries for boards, columns and cards in the key order of ``BoardRead``.
+
+    Each query reads the fields of ``fieldsets`` plus those needed to nest the
+    rows, and ``card_keys`` for cards. The returned ``Fieldsets`` names the
+    keys read only for that, to be removed before encoding.
+    """
+    boards, board_hidden = _select_fields(BOARD_PAYLOAD_FIELDS, fieldsets.board, ["id"])
+    columns, column_hidden = _select_fields(
+        COLUMN_PAYLOAD_FIELDS, fieldsets.column, ["id", "board_id"]
+    )
+    cards, card_hidden = _select_fields(CARD_PAYLOAD_FIELDS, fieldsets.card, card_keys)
+    cards = cards.join(Column, Card.column_id == Column.id)
+    if board_id is not None:
+        boards = boards.where(Board.id == board_id)
+        columns = columns.where(Column.board_id == board_id)
+        cards = cards.where(Column.board_id == board_id)
+    return boards, columns, cards, Fieldsets(board_hidden, column_hidden, card_hidden)
+
+
+async def load_board_payloads(
+    db: AsyncSession, board_id: int | None = None
+) -> list[dict[str, Any]]:
+    """Load boards with their columns and cards as plain dicts, ready to encode.
+
+    Builds the same shape as ``BoardRead`` directly from three row queries,
+    without creating ORM objects or validating them through Pydantic. Loads
+    every board, or only ``board_id`` when given.
+    """
+    boards, columns, cards, _ = _board_payload_queries(board_id)
+
+    # Plain Core execution: the rows need none of the ORM's bookkeeping.
+    conn = await db.connection()
+    column_cards: defaultdict[int, list[dict[str, Any]]] = defaultdict(list)
+    for card in _dicts(await conn.execute(cards.order_by(Card.position, Card.id))):
+        column_cards[card["column_id"]].append(card)
+    board_columns: defaultdict[int, list[dict[str, Any]]] = defaultdict(list)
+    for column in _dicts(
+        await conn.execute(columns.order_by(Column.position, Column.id))
+    ):
+        column["cards"] = column_cards[column["id"]]
+        board_columns[column["board_id"]].append(column)
+    boards_out = _dicts(await conn.execute(boards.order_by(Board.id)))
+    for board in boards_out:
+        board["columns"] = board_columns[board["id"]]
+    return boards_out
+
+
+async def load_board_window(
+    db: AsyncSession,
+    board_id: int,
+    cards_per_column: int,
+    fieldsets: Fieldsets = ALL_FIELDS,
+) -> dict[str, Any] | None:
+    """Load a board like :func:`load_board_payloads`, with only the first cards.
+
+    Each column carries its first ``cards_per_column`` cards, its total
+    ``card_count``, and ``next_cursor``: the position key of its last card
+    when more follow, or ``None``. The cards of every column are read in one
+    ``UNION ALL`` of per-column ``LIMIT`` queries, each served by the
+    ``(column_id, position)`` index, so long columns are never read past the
+    window. Returns ``None`` if the board does not exist.
+    """
+    boards, columns, card_query, hidden = _board_payload_queries(
+        board_id, fieldsets, card_keys=("column_id", "position", "id")
+    )
+    conn = await db.connection()
+    board = next(iter(_dicts(await conn.execute(boards))), None)
+    if board is None:
+        return None
+    board["columns"] = _dicts(
+        await conn.execute(
+            columns.add_columns(Column.card_count).order_by(Column.position, Column.id)
+        )
+    )
+    column_cards: defaultdict[int, list[dict[str, Any]]] = defaultdict(list)
+    column_ids = [column["id"] for column in board["columns"]]
+    card_fields = card_query.selected_columns
+    for start in range(0, len(column_ids), WINDOW_COLUMNS_PER_QUERY):
+        windows = [
+            select(*card_fields)
+            .where(Card.column_id == column_id)
+            .order_by(Card.position, Card.id)
+            .limit(cards_per_column + 1)
+            .subquery()
+            .select()
+            for column_id in column_ids[start : start + WINDOW_COLUMNS_PER_QUERY]
+        ]
+        for card in _dicts(await conn.execute(union_all(*windows))):
+            column_cards[card["column_id"]].append(card)
+    for column in board["columns"]:
+        cards = sorted(
+            column_cards[column["id"]], key=lambda card: (card["position"], card["id"])
+        )
+        # Moved behind the cards, in the key order of ``ColumnWindow``.
+        card_count = column.pop("card_count")
+        column["cards"] = [
+            _shown(card, hidden.card) for card in cards[:cards_per_column]
+        ]
+        column["card_count"] = card_count
+        column["next_cursor"] = None
+        if len(cards) > cards_per_column:
+            last = cards[cards_per_column - 1]
+            column["next_cursor"] = encode_cursor(last["position"], last["id"])
+    board["columns"] = [_shown(column, hidden.column) for column in board["columns"]]
+    return _shown(board, hidden.board)
+
+
+async def load_column_cards(
+    db: AsyncSession, column_id: int, after: tuple[int, int] | None, limit: int
+) -> list[Card]:
+    """Load up to ``limit`` cards of a column following ``after``.
+
+    ``after`` is a ``(position, id)`` key as encoded in cursors. Cards are
+    ordered by position and id, a keyset walk of the ``(column_id,
+    position)`` index.
+    """
+    stmt = select(Card).where(Card.column_id == column_id)
+    if after is not None:
+        stmt = stmt.where(tuple_(Card.position, Card.id) > tuple_(*after))
+    stmt = stmt.order_by(Card.position, Card.id).limit(limit)
+    return list(await db.scalars(stmt))
+
+
+async def stream_board_payloads(
+    db: AsyncSession, board_id: int | None = None, fieldsets: Fieldsets = ALL_FIELDS
+) -> AsyncIterator[bytes] | None:
+    """Encode boards like :func:`load_board_payloads`, but chunk by chunk.
+
+    Boards and their columns are read up front; cards are then read through a
+    server-side cursor ordered by board, column and position, and written out
+    as they arrive, so memory use does not grow with the number of cards.
+    The cards must come in the column order already read, so run both reads
+    in one snapshot (see :func:`app.database.begin_snapshot`).
+    The chunks form a JSON array of boards, or a single board object when
+    ``board_id`` is given; ``None`` is returned if that board does not exist.
+    """
+    boards, columns, cards, hidden = _board_payload_queries(board_id, fieldsets)
+    conn = await db.connection()
+    board_columns: defaultdict[int, list[dict[str, Any]]] = defaultdict(list)
+    for column in _dicts(
+        await conn.execute(
+            columns.order_by(Column.board_id, Column.position, Column.id)
+        )
+    ):
+        board_columns[column["board_id"]].append(column)
+    boards_out = _dicts(await conn.execute(boards.order_by(Board.id)))
+    if board_id is not None and not boards_out:
+        return None
+    cards = cards.order_by(
+        Column.board_id, Column.position, Column.id, Card.position, Card.id
+    )
+    return _encode_boards(
+        conn, boards_out, board_columns, cards, hidden, single=board_id is not None
+    )
+
+
+async def _encode_boards(
+    conn: AsyncConnection,
+    boards: list[dict[str, Any]],
+    board_columns: dict[int, list[dict[str, Any]]],
+    cards: Select,
+    hidden: Fieldsets,
+    *,
+    single: bool,
+) -> AsyncIterator[bytes]:
+    result = await conn.stream(cards)
+    try:
+        keys = list(result.keys())
+        column_index = keys.index("column_id")
+        shown = [index for index, key in enumerate(keys) if key not in hidden.card]
+        shown_keys = [keys[index] for index in shown]
+        partitions = result.partitions(STREAM_BATCH_ROWS)
+        rows: Sequence[Row] = []
+        start = 0
+        exhausted = False
+        out = bytearray() if single else bytearray(b"[")
+        for board_number, board in enumerate(boards):
+            if board_number:
+                out += b","
+            # Open the encoded object and append the nested list by hand.
+            out += dumps(_shown(board, hidden.board))[:-1] + b',"columns":['
+            for column_number, column in enumerate(board_columns[board["id"]]):
+                if column_number:
+                    out += b","
+                out += dumps(_shown(column, hidden.column))[:-1] + b',"cards":['
+                first = True
+                while True:
+                    if start == len(rows) and not exhausted:
+                        try:
+                            rows, start = await anext(partitions), 0
+                        except StopAsyncIteration:
+                            exhausted = True
+                    end = start
+                    while end < len(rows) and rows[end][column_index] == column["id"]:
+                        end += 1
+                    if end > start:
+                        if hidden.card:
+                            batch = [
+                                dict(zip(shown_keys, [row[i] for i in shown]))
+                                for row in rows[start:end]
+                            ]
+                        else:
+                            batch = [dict(zip(keys, row)) for row in rows[start:end]]
+                        if not first:
+                            out += b","
+                        out += dumps(batch)[1:-1]
+                        first = False
+                        start = end
+                    if len(out) >= STREAM_CHUNK_BYTES:
+                        yield bytes(out)
+                        out.clear()
+                    if start < len(rows) or exhausted:
+                        break
+                out += b"]}"
+            out += b"]}"
+        if not single:
+            out += b"]"
+        yield bytes(out)
+    finally:
+        await result.close()
+
+
+async def load_column_stats(
+    db: AsyncSession, board_id: int, now: datetime
+) -> list[Row]:
+    """Load a board's columns with their card and overdue counts.
+
+    Card counts are read from the columns. Overdue cards (due before ``now``)
+    are counted per column through the ``(column_id, due_date)`` index, which
+    only visits the overdue cards.
+    """
+    overdue_count = (
+        select(func.count())
+        .select_from(Card)
+        .where(Card.column_id == Column.id, Card.due_date < now)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(
+            Column.id,
+            Column.title,
+            Column.position,
+            Column.card_count,
+            overdue_count.label("overdue_count"),
+        )
+        .where(Column.board_id == board_id)
+        .order_by(Column.position, Column.id)
+    )
+    return list(await db.execute(stmt))
+
+
+async def load_columns(db: AsyncSession, board_id: int) -> list[Column]:
+    """Load the columns of a board together with their cards."""
+    stmt = (
+        select(Column)
+        .where(Column.board_id == board_id)
+        .order_by(Column.position)
+        .options(selectinload(Column.cards))
+    )
+    return list(await db.scalars(stmt))
+
+
+async def load_column(db: AsyncSession, column_id: int) -> Column | None:
+    """Load a single column together with its cards."""
+    stmt = (
+        select(Column).where(Column.id == column_id).options(selectinload(Column.cards))
+    )
+    return (await db.scalars(stmt)).first()
+
+
+async def load_board_summaries(
+    db: AsyncSession, after: int | None, limit: int
+) -> list[Row]:
+    """Load up to ``limit`` boards with ``id > after`` plus their counts.
+
+    Column and card counts are correlated aggregate subqueries over the
+    boards' columns, whose stored card counts save reading any cards, so the
+    cost is proportional to the page being returned.
+    """
+    column_count = (
+        select(func.count(Column.id))
+        .where(Column.board_id == Board.id)
+        .scalar_subquery()
+    )
+    card_count = (
+        select(func.coalesce(func.sum(Column.card_count), 0))
+        .where(Column.board_id == Board.id)
+        .scalar_subquery()
+    )
+    stmt = select(
+        Board.id,
+        Board.title,
+        Board.created_at,
+        column_count.label("column_count"),
+        card_count.label("card_count"),
+    )
+    if after is not None:
+        stmt = stmt.where(Board.id > after)
+    stmt = stmt.order_by(Board.id).limit(limit)
+    return list(await db.execute(stmt))
+
+
+async def load_cards(
+    db: AsyncSession,
+    *,
+    assignee: str | None = None,
+    due_before: datetime | None = None,
+    due_after: datetime | None = None,
+    board_id: int | None = None,
+    order: str = "id",
+    after: tuple[datetime | int, ...] | None = None,
+    limit: int,
+) -> list[Card]:
+    """Load up to ``limit`` cards from any board matching the given filters.
+
+    Cards are ordered by id, or by ``(due_date, id)`` when ``order`` is
+    ``"due_date"``, in which case cards without a due date are left out.
+    ``after`` is the sort key of the last card of the previous page, so each
+    page is one range scan of the matching index.
+    """
+    stmt = select(Card)
+    if assignee is not None:
+        stmt = stmt.where(Card.assignee == assignee)
+    if due_before is not None:
+        stmt = stmt.where(Card.due_date < due_before)
+    if due_after is not None:
+        stmt = stmt.where(Card.due_date >= due_after)
+    if board_id is not None:
+        stmt = stmt.join(Column, Card.column_id == Column.id).where(
+            Column.board_id == board_id
+        )
+    if order == "due_date":
+        key = (Card.due_date, Card.id)
+        stmt = stmt.where(Card.due_date.is_not(None))
+        if after is not None:
+            stmt = stmt.where(tuple_(*key) > tuple_(*after))
+    else:
+        key = (Card.id,)
+        if after is not None:
+            stmt = stmt.where(Card.id > after[0])
+    stmt = stmt.order_by(*key).limit(limit)
+    return list(await db.scalars(stmt))
+
+
+async def load_archived_cards(
+    db: AsyncSession,
+    board_id: int,
+    after: tuple[datetime, int] | None,
+    limit: int,
+) -> list[ArchivedCard]:
+    """Load up to ``limit`` archived cards of a board, most recently archived first.
+
+    ``after`` is the ``(archived_at, id)`` key of the last card of the previous
+    page.
+    """
+    key = (ArchivedCard.archived_at, ArchivedCard.id)
+    stmt = (
+        select(ArchivedCard)
+        .join(Column, ArchivedCard.column_id == Column.id)
+        .where(Column.board_id == board_id)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(*key) < tuple_(*after))
+    stmt = stmt.order_by(*(part.desc() for part in key)).limit(limit)
+    return list(await db.scalars(stmt))
@@ -1,9 +1,37 @@
-from fastapi import FastAPI
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+from app.archive import auto_archiver
+from app.cache import board_cache
+from app.compression import CompressionMiddleware
+from app.cursors import InvalidCursorError
+from app.events import hub
+from app.instrumentation import InstrumentationMiddleware
+from app.routers import archive, boards, cards, columns, monitoring, search
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    await board_cache.start()
+    await auto_archiver.start()
+    yield
+    # End open event streams so the server can shut down promptly.
+    hub.close()
+    await auto_archiver.close()
+    await board_cache.close()
+
+
+app = FastAPI(title="Kanban Board API", lifespan=lifespan)
+
 
-from app.routers import boards, cards, columns
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor(_request: Request, _exc: InvalidCursorError) -> JSONResponse:
+    return JSONResponse(status_code=422, content={"detail": "Invalid cursor"})
 
-app = FastAPI(title="Kanban Board API")
 
 app.add_middleware(
     CORSMiddleware,
@@ -11,8 +39,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
+app.add_middleware(CompressionMiddleware)
+# Outermost, so its timings cover compression and CORS too.
+app.add_middleware(InstrumentationMiddleware)
 
 app.include_router(boards.router, prefix="/api")
 app.include_router(columns.router, prefix="/api")
 app.include_router(cards.router, prefix="/api")
+app.include_router(search.router, prefix="/api")
+app.include_router(archive.router, prefix="/api")
+app.include_router(monitoring.router, prefix="/api")
@@ -1,5 +1,7 @@
+from app.models.archive import ArchivedCard
 from app.models.board import Board
 from app.models.card import Card
+from app.models.change import BoardChange
 from app.models.column import Column
 
-__all__ = ["Board", "Card", "Column"]
+__all__ = ["ArchivedCard", "Board", "BoardChange", "Card", "Column"]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base, utc_now
+
+
+class ArchivedCard(Base):
+    """A card moved out of its column into the archive.
+
+    Archived cards keep their id and column, so they can be listed per board
+    and restored, but they are not part of the board tree, its counts or
+    search. They go with their column when it is deleted.
+    """
+
+    __tablename__ = "cards_archive"
+    __table_args__ = (
+        Index("ix_cards_archive_column_id_archived_at", "column_id", "archived_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    title: Mapped[str] = mapped_column(String, nullable=False)
+    description: Mapped[str | None] = mapped_column(String, nullable=True)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    column_id: Mapped[int] = mapped_column(
+        ForeignKey("columns.id", ondelete="CASCADE"), nullable=False
+    )
+    due_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    assignee: Mapped[str | None] = mapped_column(String, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=utc_now
+    )
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import DateTime, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, utc_now
 
 if TYPE_CHECKING:
     from app.models.column import Column
@@ -19,10 +19,21 @@ class Board(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(UTC)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # Changes up to this version have been dropped from the change log.
+    compacted_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
     )
 
     columns: Mapped[list[Column]] = relationship(
-        "Column", back_populates="board", cascade="all, delete-orphan"
+        "Column",
+        back_populates="board",
+        cascade="all, delete-orphan",
+        # Columns and their cards are removed by ON DELETE CASCADE rather than
+        # loaded and deleted one by one.
+        passive_deletes=True,
+        order_by="Column.position",
     )
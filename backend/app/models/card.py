@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import DDL, DateTime, ForeignKey, Index, Integer, String, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, utc_now
 
 if TYPE_CHECKING:
     from app.models.column import Column
@@ -16,16 +16,94 @@ class Card(Base):
     """Card model representing a card within a Kanban column."""
 
     __tablename__ = "cards"
+    __table_args__ = (
+        Index("ix_cards_column_id_position", "column_id", "position"),
+        # Counts a column's overdue cards without reading the others.
+        Index("ix_cards_column_id_due_date", "column_id", "due_date"),
+        # Serves assignee lookups as well as "my cards by due date" queries.
+        Index("ix_cards_assignee_due_date", "assignee", "due_date"),
+        # Archived cards keep their ids, so SQLite must never hand out the
+        # id of a deleted card again, as it does for plain rowids.
+        {"sqlite_autoincrement": True},
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str | None] = mapped_column(String, nullable=True)
     position: Mapped[int] = mapped_column(Integer, nullable=False)
-    column_id: Mapped[int] = mapped_column(ForeignKey("columns.id"), nullable=False)
-    due_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    column_id: Mapped[int] = mapped_column(
+        ForeignKey("columns.id", ondelete="CASCADE"), nullable=False
+    )
+    due_date: Mapped[datetime | None] = mapped_column(
+        DateTime, nullable=True, index=True
+    )
     assignee: Mapped[str | None] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(UTC)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utc_now)
+    # When the card entered its current column; auto-archiving ages cards by it.
+    moved_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=utc_now
     )
 
     column: Mapped[Column] = relationship("Column", back_populates="cards")
+
+
+# Full-text index over card titles and descriptions, used by ``/search``. On
+# SQLite it is an FTS5 external-content table that stores only the index;
+# triggers keep it in step with ``cards``.
+CARD_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE cards_fts USING fts5(
+        title, description,
+        content='cards', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER cards_fts_insert AFTER INSERT ON cards BEGIN
+        INSERT INTO cards_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER cards_fts_delete AFTER DELETE ON cards BEGIN
+        INSERT INTO cards_fts(cards_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER cards_fts_update AFTER UPDATE OF title, description ON cards
+    BEGIN
+        INSERT INTO cards_fts(cards_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO cards_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+for statement in CARD_SEARCH_DDL:
+    event.listen(
+        Card.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    Card.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS cards_fts").execute_if(dialect="sqlite"),
+)
+
+# PostgreSQL searches a tsvector of the title (weight A) and description
+# (weight B) instead, through a GIN index on the same expression; queries must
+# spell it exactly like this for the index to be used.
+CARD_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', cards.title), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(cards.description, '')), 'B')"
+)
+CARD_SEARCH_INDEX_DDL = (
+    f"CREATE INDEX ix_cards_search ON cards USING gin (({CARD_SEARCH_VECTOR}))"
+)
+
+event.listen(
+    Card.__table__,
+    "after_create",
+    DDL(CARD_SEARCH_INDEX_DDL).execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from sqlalchemy import ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class BoardChange(Base):
+    """Change log entry: a column or card touched by a board version.
+
+    Entries only name the row that changed; readers look up its current state,
+    and a row that is gone (or has left the board) is reported as deleted.
+    """
+
+    __tablename__ = "board_changes"
+    __table_args__ = (
+        Index("ix_board_changes_board_id_version", "board_id", "version"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    board_id: Mapped[int] = mapped_column(
+        ForeignKey("boards.id", ondelete="CASCADE"), nullable=False
+    )
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    entity: Mapped[str] = mapped_column(String, nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
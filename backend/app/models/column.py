@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -16,13 +16,25 @@ class Column(Base):
     """Column model representing a column within a Kanban board."""
 
     __tablename__ = "columns"
+    __table_args__ = (Index("ix_columns_board_id_position", "board_id", "position"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String, nullable=False)
     position: Mapped[int] = mapped_column(Integer, nullable=False)
-    board_id: Mapped[int] = mapped_column(ForeignKey("boards.id"), nullable=False)
+    board_id: Mapped[int] = mapped_column(
+        ForeignKey("boards.id", ondelete="CASCADE"), nullable=False
+    )
+    # Cards in the column, kept up to date by every path that adds, moves or
+    # removes cards (see app.counts).
+    card_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     board: Mapped[Board] = relationship("Board", back_populates="columns")
     cards: Mapped[list[Card]] = relationship(
-        "Card", back_populates="column", cascade="all, delete-orphan"
+        "Card",
+        back_populates="column",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="Card.position",
     )
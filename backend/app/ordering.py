@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from sqlalchemy import func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.card import Card
+
+POSITION_STEP = 1024
+
+
+class StaleOrderError(ValueError):
+    """The neighbours given for a move do not match the stored card order."""
+
+
+def position_between(lower: int | None, upper: int | None) -> int | None:
+    """Return a position strictly between ``lower`` and ``upper``.
+
+    ``None`` bounds are open ends. Returns ``None`` when two neighbours are
+    adjacent integers and there is no room left, in which case the column has
+    to be rebalanced first.
+    """
+    if lower is None and upper is None:
+        return 0
+    if lower is None:
+        return upper - POSITION_STEP
+    if upper is None:
+        return lower + POSITION_STEP
+    if upper - lower < 2:  # noqa: PLR2004
+        return None
+    return (lower + upper) // 2
+
+
+async def neighbour_positions(
+    db: AsyncSession,
+    card_id: int,
+    column_id: int,
+    after_card_id: int | None,
+    before_card_id: int | None,
+) -> tuple[int | None, int | None]:
+    """Resolve the positions a card moved into ``column_id`` must fit between.
+
+    ``after_card_id`` is the card that will precede the moved card and
+    ``before_card_id`` the one that will follow it. When only one neighbour is
+    given the other is looked up; with neither the card goes to the end.
+    """
+    ids = [i for i in (after_card_id, before_card_id) if i is not None]
+    rows = {
+        row.id: row
+        for row in await db.execute(
+            select(Card.id, Card.column_id, Card.position).where(Card.id.in_(ids))
+        )
+    }
+    for neighbour_id in ids:
+        row = rows.get(neighbour_id)
+        if neighbour_id == card_id or row is None or row.column_id != column_id:
+            raise StaleOrderError(f"Card {neighbour_id} is not in column {column_id}")
+
+    lower = rows[after_card_id].position if after_card_id is not None else None
+    upper = rows[before_card_id].position if before_card_id is not None else None
+    # Cards sort by position and then id, so cards sharing a position are
+    # still ordered; neighbours at the same position leave no room between
+    # them and make ``position_between`` ask for a rebalance.
+    key = tuple_(Card.position, Card.id)
+    siblings = (Card.column_id == column_id, Card.id != card_id)
+    if lower is None and upper is None:
+        lower = await db.scalar(select(func.max(Card.position)).where(*siblings))
+    elif upper is None:
+        upper = await db.scalar(
+            select(func.min(Card.position)).where(
+                *siblings, key > tuple_(lower, after_card_id)
+            )
+        )
+    elif lower is None:
+        lower = await db.scalar(
+            select(func.max(Card.position)).where(
+                *siblings, key < tuple_(upper, before_card_id)
+            )
+        )
+    elif (lower, after_card_id) >= (upper, before_card_id):
+        raise StaleOrderError("Neighbour cards are out of order")
+    return lower, upper
+
+
+async def rebalance_column(
+    db: AsyncSession, column_id: int, card_id: int
+) -> dict[int, int]:
+    """Respace the cards of a column ``POSITION_STEP`` apart, keeping their order.
+
+    The card being moved is left out; it gets its new position afterwards.
+    All rows are rewritten with a single executemany ``UPDATE``. Returns the
+    new position of each respaced card, by id.
+    """
+    ids = list(
+        await db.scalars(
+            select(Card.id)
+            .where(Card.column_id == column_id, Card.id != card_id)
+            .order_by(Card.position, Card.id)
+        )
+    )
+    positions = {
+        sibling_id: index * POSITION_STEP for index, sibling_id in enumerate(ids)
+    }
+    if positions:
+        await db.execute(
+            update(Card),
+            [{"id": id_, "position": position} for id_, position in positions.items()],
+        )
+    return positions
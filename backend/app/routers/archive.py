@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.archive import ARCHIVED_FIELDS, archive_cards
+from app.changes import card_data, log_changes, publish_change, touch_boards
+from app.counts import adjust_card_counts, card_count_deltas
+from app.cursors import decode_cursor, encode_cursor
+from app.database import get_db
+from app.instrumentation import TimedRoute
+from app.loaders import load_archived_cards
+from app.models.archive import ArchivedCard
+from app.models.board import Board
+from app.models.card import Card
+from app.models.column import Column
+from app.ordering import position_between
+from app.schemas.archive import (
+    ArchivedCardPage,
+    ArchivedCardRead,
+    ColumnArchiveResult,
+)
+from app.schemas.card import CardRead
+
+router = APIRouter(tags=["archive"], route_class=TimedRoute)
+
+
+@router.post("/cards/{card_id}/archive", response_model=ArchivedCardRead)
+async def archive_card(
+    card_id: int, db: AsyncSession = Depends(get_db)
+) -> ArchivedCard:
+    """Move a card out of its column into the board's archive."""
+    column_id = await db.scalar(select(Card.column_id).where(Card.id == card_id))
+    if column_id is None:
+        raise HTTPException(status_code=404, detail="Card not found")
+    versions, card_ids = await archive_cards(db, column_id, Card.id == card_id)
+    if not card_ids:
+        raise HTTPException(status_code=409, detail="Card was moved; try again")
+    await db.commit()
+    await publish_change(
+        versions, "card.archived", {"id": card_id, "column_id": column_id}
+    )
+    return await db.get(ArchivedCard, card_id)
+
+
+@router.post("/columns/{column_id}/archive", response_model=ColumnArchiveResult)
+async def archive_column(
+    column_id: int, db: AsyncSession = Depends(get_db)
+) -> ColumnArchiveResult:
+    """Move every card of a column into the board's archive.
+
+    The column itself stays on the board, empty.
+    """
+    if await db.get(Column, column_id) is None:
+        raise HTTPException(status_code=404, detail="Column not found")
+    versions, card_ids = await archive_cards(db, column_id)
+    await db.commit()
+    if card_ids:
+        await publish_change(
+            versions, "column.archived", {"column_id": column_id, "card_ids": card_ids}
+        )
+    return ColumnArchiveResult(archived=len(card_ids))
+
+
+@router.get("/boards/{board_id}/archive", response_model=ArchivedCardPage)
+async def list_archived_cards(
+    board_id: int,
+    after: str | None = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+) -> ArchivedCardPage:
+    """List a board's archived cards, most recently archived first.
+
+    Pass the previous page's ``next_cursor`` as ``after`` to continue.
+    """
+    if await db.get(Board, board_id) is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    cards = await load_archived_cards(
+        db,
+        board_id,
+        decode_cursor(after, datetime, int) if after is not None else None,
+        limit + 1,
+    )
+    items = [ArchivedCardRead.model_validate(card) for card in cards[:limit]]
+    next_cursor = None
+    if len(cards) > limit:
+        last = cards[limit - 1]
+        next_cursor = encode_cursor(last.archived_at, last.id)
+    return ArchivedCardPage(items=items, next_cursor=next_cursor)
+
+
+@router.post("/archive/{card_id}/restore", response_model=CardRead)
+async def restore_card(card_id: int, db: AsyncSession = Depends(get_db)) -> Card:
+    """Move an archived card back into its column, after the last card.
+
+    The card keeps its id. It counts as having just entered the column, so
+    auto-archiving leaves it alone for another full period.
+    """
+    archived = await db.get(ArchivedCard, card_id)
+    if archived is None:
+        raise HTTPException(status_code=404, detail="Archived card not found")
+    last = await db.scalar(
+        select(func.max(Card.position)).where(Card.column_id == archived.column_id)
+    )
+    card = Card(**{field: getattr(archived, field) for field in ARCHIVED_FIELDS})
+    card.position = position_between(last, None)
+    await db.delete(archived)
+    db.add(card)
+    await db.flush()
+    await adjust_card_counts(db, card_count_deltas(added_to=[card.column_id]))
+    versions = await touch_boards(db, column_ids=[card.column_id])
+    await log_changes(db, versions, card_ids=[card_id])
+    await db.commit()
+    await publish_change(versions, "card.restored", card_data(card))
+    return card
@@ -1,45 +1,300 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import asyncio
+import json
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
 
-from app.database import get_db
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import board_cache
+from app.changes import load_changes
+from app.database import begin_snapshot, get_db, utc_now
+from app.events import KEEPALIVE_SECONDS, Subscription, hub
+from app.instrumentation import TimedRoute
+from app.loaders import (
+    ALL_FIELDS,
+    BOARD_PAYLOAD_FIELDS,
+    CARD_PAYLOAD_FIELDS,
+    COLUMN_PAYLOAD_FIELDS,
+    Fieldsets,
+    load_board,
+    load_board_summaries,
+    load_board_window,
+    load_column_stats,
+    stream_board_payloads,
+)
 from app.models.board import Board
-from app.schemas.board import BoardCreate, BoardRead
+from app.responses import dumps
+from app.schemas.board import (
+    BoardChanges,
+    BoardCreate,
+    BoardRead,
+    BoardStats,
+    BoardSummary,
+    BoardSummaryPage,
+    BoardWindow,
+    ColumnStats,
+)
+
+router = APIRouter(tags=["boards"], route_class=TimedRoute)
+
+
+def _board_etag(board_id: int, version: int) -> str:
+    return f'W/"board-{board_id}-v{version}"'
+
 
-router = APIRouter(tags=["boards"])
+def _etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """Weakly compare ``etag`` with the tags listed in an If-None-Match header."""
+    if if_none_match is None:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
 
 
 @router.get("/boards", response_model=list[BoardRead])
-def list_boards(db: Session = Depends(get_db)) -> list[Board]:
-    """List all boards with their columns and cards."""
-    return db.query(Board).all()
+async def list_boards(db: AsyncSession = Depends(get_db)) -> StreamingResponse:
+    """List all boards with their columns and cards.
+
+    The JSON is streamed as the cards are read, so neither the first byte nor
+    the memory held depends on how many cards there are.
+    """
+    await begin_snapshot(db)
+    chunks = await stream_board_payloads(db)
+    return StreamingResponse(chunks, media_type="application/json")
+
+
+async def _cache_after_streaming(
+    chunks: AsyncIterator[bytes], board_id: int, version: int
+) -> AsyncIterator[bytes]:
+    """Pass ``chunks`` through, caching the payload if it turns out small enough."""
+    parts: list[bytes] | None = []
+    size = 0
+    async for chunk in chunks:
+        if parts is not None:
+            size += len(chunk)
+            if size <= board_cache.max_payload_bytes:
+                parts.append(chunk)
+            else:
+                parts = None
+        yield chunk
+    if parts is not None:
+        await board_cache.put(board_id, version, b"".join(parts))
+
+
+@router.get("/boards/summary", response_model=BoardSummaryPage)
+async def list_board_summaries(
+    after: int | None = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+) -> BoardSummaryPage:
+    """List boards without their columns and cards, one page at a time.
+
+    Pages are keyed on board id: pass the previous page's ``next_cursor`` as
+    ``after`` to continue.
+    """
+    rows = await load_board_summaries(db, after, limit + 1)
+    items = [BoardSummary.model_validate(row) for row in rows[:limit]]
+    next_cursor = items[-1].id if len(rows) > limit else None
+    return BoardSummaryPage(items=items, next_cursor=next_cursor)
 
 
 @router.post("/boards", response_model=BoardRead, status_code=201)
-def create_board(board_in: BoardCreate, db: Session = Depends(get_db)) -> Board:
+async def create_board(
+    board_in: BoardCreate, db: AsyncSession = Depends(get_db)
+) -> Board:
     """Create a new board."""
-    board = Board(title=board_in.title)
+    # A new board has no columns; marking the collection loaded avoids a lazy
+    # load during serialization, which the async session does not allow.
+    board = Board(title=board_in.title, columns=[])
     db.add(board)
-    db.commit()
-    db.refresh(board)
+    await db.commit()
     return board
 
 
-@router.get("/boards/{board_id}", response_model=BoardRead)
-def get_board(board_id: int, db: Session = Depends(get_db)) -> Board:
-    """Get a board with its columns and cards."""
-    board = db.query(Board).filter(Board.id == board_id).first()
-    if board is None:
+def _fieldset(
+    value: str | None, fields: Sequence[Any], resource: str
+) -> frozenset[str] | None:
+    """Parse a comma-separated ``fields[resource]`` parameter."""
+    if value is None:
+        return None
+    names = frozenset(name.strip() for name in value.split(",") if name.strip())
+    if unknown := sorted(names - {field.key for field in fields}):
+        raise HTTPException(
+            status_code=422, detail=f"Unknown {resource} fields: {unknown}"
+        )
+    return names
+
+
+def board_fieldsets(
+    board_fields: str | None = Query(default=None, alias="fields[board]"),
+    column_fields: str | None = Query(default=None, alias="fields[column]"),
+    card_fields: str | None = Query(default=None, alias="fields[card]"),
+) -> Fieldsets:
+    """Sparse fieldsets requested for a board tree, one parameter per type."""
+    return Fieldsets(
+        board=_fieldset(board_fields, BOARD_PAYLOAD_FIELDS, "board"),
+        column=_fieldset(column_fields, COLUMN_PAYLOAD_FIELDS, "column"),
+        card=_fieldset(card_fields, CARD_PAYLOAD_FIELDS, "card"),
+    )
+
+
+@router.get("/boards/{board_id}", response_model=BoardRead | BoardWindow)
+async def get_board(
+    board_id: int,
+    cards_per_column: int | None = Query(default=None, ge=1, le=1000),
+    fieldsets: Fieldsets = Depends(board_fieldsets),
+    if_none_match: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Get a board with its columns and cards.
+
+    The response carries a weak ETag derived from the board's version. When
+    the client already holds that version, 304 is returned without loading
+    the columns and cards. Encoded payloads are cached per board version, so
+    repeated reads of an unchanged board skip the tree queries entirely;
+    otherwise the JSON is streamed as the cards are read.
+
+    With ``cards_per_column`` each column holds only its first cards, plus
+    its card count and a cursor for the rest (see :class:`BoardWindow`).
+    ``fields[board]``, ``fields[column]`` and ``fields[card]`` each restrict
+    the fields read and returned for that type to a comma-separated list.
+    Windowed and sparse payloads bypass the cache.
+    """
+    # The version and every part of the tree are read from one snapshot, so
+    # the payload is exactly the one the ETag names.
+    await begin_snapshot(db)
+    version = await db.scalar(select(Board.version).where(Board.id == board_id))
+    if version is None:
         raise HTTPException(status_code=404, detail="Board not found")
-    return board
+    etag = _board_etag(board_id, version)
+    if _etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers={"ETag": etag})
+    headers = {"ETag": etag}
+    if cards_per_column is not None:
+        board = await load_board_window(db, board_id, cards_per_column, fieldsets)
+        if board is None:
+            raise HTTPException(status_code=404, detail="Board not found")
+        return Response(dumps(board), media_type="application/json", headers=headers)
+    cached = fieldsets == ALL_FIELDS
+    if cached:
+        payload = await board_cache.get(board_id, version)
+        if payload is not None:
+            return Response(payload, media_type="application/json", headers=headers)
+    chunks = await stream_board_payloads(db, board_id, fieldsets)
+    if chunks is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    if cached:
+        chunks = _cache_after_streaming(chunks, board_id, version)
+    return StreamingResponse(chunks, media_type="application/json", headers=headers)
+
+
+@router.get("/boards/{board_id}/changes", response_model=BoardChanges)
+async def get_board_changes(
+    board_id: int,
+    since: int = Query(ge=0),
+    db: AsyncSession = Depends(get_db),
+) -> BoardChanges:
+    """Return what changed on a board after version ``since``.
+
+    Only the changed columns and cards are sent, plus the ids of deleted ones.
+    When the change log has been compacted past ``since`` (or ``since`` is
+    ahead of the board) the whole board is returned as ``snapshot`` instead.
+    """
+    row = (
+        await db.execute(
+            select(Board.version, Board.compacted_version).where(Board.id == board_id)
+        )
+    ).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    if row.compacted_version <= since <= row.version:
+        return await load_changes(db, board_id, since, row.version)
+    board = await load_board(db, board_id)
+    return BoardChanges(
+        since=since, version=board.version, snapshot=BoardRead.model_validate(board)
+    )
+
+
+@router.get("/boards/{board_id}/stats", response_model=BoardStats)
+async def get_board_stats(
+    board_id: int, db: AsyncSession = Depends(get_db)
+) -> BoardStats:
+    """Count the cards of a board and of each of its columns.
+
+    Answered from the counts stored on the columns, so the cost grows with the
+    number of columns rather than cards.
+    """
+    version = await db.scalar(select(Board.version).where(Board.id == board_id))
+    if version is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    columns = [
+        ColumnStats.model_validate(row)
+        for row in await load_column_stats(db, board_id, utc_now())
+    ]
+    return BoardStats(
+        id=board_id,
+        version=version,
+        card_count=sum(column.card_count for column in columns),
+        overdue_count=sum(column.overdue_count for column in columns),
+        columns=columns,
+    )
+
+
+async def _event_stream(subscription: Subscription, version: int) -> AsyncIterator[str]:
+    try:
+        yield f"event: ready\ndata: {json.dumps({'version': version})}\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.queue.get(), KEEPALIVE_SECONDS
+                )
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if event is None:
+                if subscription.overflowed:
+                    yield "event: resync\ndata: {}\n\n"
+                return
+            yield event.to_sse()
+    finally:
+        hub.unsubscribe(subscription)
+
+
+@router.get("/boards/{board_id}/events")
+async def board_events(
+    board_id: int, db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    """Stream changes to a board as Server-Sent Events.
+
+    The stream opens with a ``ready`` event carrying the current board
+    version, followed by one event per committed column or card change. A
+    client that falls too far behind receives ``resync`` and should reload
+    the board before reconnecting.
+    """
+    version = await db.scalar(select(Board.version).where(Board.id == board_id))
+    if version is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    subscription = hub.subscribe(board_id)
+    # Release the connection now rather than holding it for the whole stream.
+    await db.close()
+    return StreamingResponse(
+        _event_stream(subscription, version),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.delete("/boards/{board_id}", status_code=204)
-def delete_board(board_id: int, db: Session = Depends(get_db)) -> None:
+async def delete_board(board_id: int, db: AsyncSession = Depends(get_db)) -> None:
     """Delete a board."""
-    board = db.query(Board).filter(Board.id == board_id).first()
+    board = await db.get(Board, board_id)
     if board is None:
         raise HTTPException(status_code=404, detail="Board not found")
-    db.delete(board)
-    db.commit()
+    # Its columns, cards and change log go with it through ON DELETE CASCADE.
+    await db.delete(board)
+    await db.commit()
+    await board_cache.invalidate(board_id)
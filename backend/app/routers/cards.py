@@ -1,24 +1,134 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from datetime import UTC, datetime
+from typing import Any, Literal
 
-from app.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.changes import card_data, log_changes, publish_change, touch_boards
+from app.counts import adjust_card_counts, card_count_deltas
+from app.cursors import decode_cursor, encode_cursor
+from app.database import get_db, utc_now
+from app.instrumentation import TimedRoute
+from app.loaders import load_cards
 from app.models.card import Card
-from app.schemas.card import CardCreate, CardRead, CardUpdate
+from app.models.column import Column
+from app.ordering import (
+    StaleOrderError,
+    neighbour_positions,
+    position_between,
+    rebalance_column,
+)
+from app.schemas.card import (
+    CardBulkCreate,
+    CardBulkRequest,
+    CardBulkResult,
+    CardBulkUpdate,
+    CardCreate,
+    CardMove,
+    CardPage,
+    CardRead,
+    CardUpdate,
+)
+
+router = APIRouter(tags=["cards"], route_class=TimedRoute)
+
+
+def _update_values(card_in: CardUpdate) -> dict[str, Any]:
+    """Column values set by a partial update.
+
+    Text and ordering fields are only changed when given a value; the
+    nullable ``due_date`` and ``assignee`` can be cleared with an explicit null.
+    """
+    values = {
+        field: value
+        for field in ("title", "description", "position", "column_id")
+        if (value := getattr(card_in, field)) is not None
+    }
+    for field in ("due_date", "assignee"):
+        if field in card_in.model_fields_set:
+            values[field] = getattr(card_in, field)
+    return values
+
+
+async def _card_columns(db: AsyncSession, card_ids: set[int]) -> dict[int, int]:
+    """Map each existing card in ``card_ids`` to its column id."""
+    if not card_ids:
+        return {}
+    rows = await db.execute(
+        select(Card.id, Card.column_id).where(Card.id.in_(card_ids))
+    )
+    return {row.id: row.column_id for row in rows}
+
 
-router = APIRouter(tags=["cards"])
+def _naive_utc(value: datetime | None) -> datetime | None:
+    """Convert an aware datetime to the naive UTC form due dates are stored in."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+# Types of the sort key encoded in cursors for each ``order``.
+_CURSOR_TYPES = {"id": (int,), "due_date": (datetime, int)}
+
+
+def _cursor_key(card: Card, order: str) -> tuple[datetime | int, ...]:
+    return (card.due_date, card.id) if order == "due_date" else (card.id,)
+
+
+@router.get("/cards", response_model=CardPage)
+async def query_cards(
+    assignee: str | None = None,
+    due_before: datetime | None = None,
+    due_after: datetime | None = None,
+    board_id: int | None = None,
+    order: Literal["id", "due_date"] = "id",
+    after: str | None = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+) -> CardPage:
+    """List cards across boards, filtered by assignee, due date and board.
+
+    Results are ordered by id or, with ``order=due_date``, soonest due first
+    (cards without a due date are then excluded). Pass the previous page's
+    ``next_cursor`` as ``after`` to continue.
+    """
+    key = decode_cursor(after, *_CURSOR_TYPES[order]) if after is not None else None
+    cards = await load_cards(
+        db,
+        assignee=assignee,
+        due_before=_naive_utc(due_before),
+        due_after=_naive_utc(due_after),
+        board_id=board_id,
+        order=order,
+        after=key,
+        limit=limit + 1,
+    )
+    items = [CardRead.model_validate(card) for card in cards[:limit]]
+    next_cursor = (
+        encode_cursor(*_cursor_key(cards[limit - 1], order))
+        if len(cards) > limit
+        else None
+    )
+    return CardPage(items=items, next_cursor=next_cursor)
 
 
 @router.get("/cards/{column_id}", response_model=list[CardRead])
-def list_cards(column_id: int, db: Session = Depends(get_db)) -> list[Card]:
+async def list_cards(column_id: int, db: AsyncSession = Depends(get_db)) -> list[Card]:
     """List all cards for a given column."""
-    return db.query(Card).filter(Card.column_id == column_id).all()
+    stmt = (
+        select(Card).where(Card.column_id == column_id).order_by(Card.position, Card.id)
+    )
+    return list(await db.scalars(stmt))
 
 
 @router.post("/cards", response_model=CardRead, status_code=201)
-def create_card(card_in: CardCreate, db: Session = Depends(get_db)) -> Card:
+async def create_card(card_in: CardCreate, db: AsyncSession = Depends(get_db)) -> Card:
     """Create a new card."""
+    if await db.get(Column, card_in.column_id) is None:
+        raise HTTPException(status_code=404, detail="Column not found")
     card = Card(
         title=card_in.title,
         description=card_in.description,
@@ -28,41 +138,180 @@ def create_card(card_in: CardCreate, db: Session = Depends(get_db)) -> Card:
         assignee=card_in.assignee,
     )
     db.add(card)
-    db.commit()
-    db.refresh(card)
+    await db.flush()
+    await adjust_card_counts(db, card_count_deltas(added_to=[card.column_id]))
+    versions = await touch_boards(db, column_ids=[card.column_id])
+    await log_changes(db, versions, card_ids=[card.id])
+    await db.commit()
+    await publish_change(versions, "card.created", card_data(card))
     return card
 
 
+@router.post("/cards/bulk", response_model=list[CardBulkResult])
+async def bulk_cards(
+    bulk_in: CardBulkRequest, db: AsyncSession = Depends(get_db)
+) -> list[CardBulkResult]:
+    """Create, update and delete many cards in a single transaction.
+
+    Every referenced card and column is checked up front, then creates,
+    updates and deletes each run as one executemany statement. Results are
+    returned in request order.
+    """
+    creates = [op for op in bulk_in.operations if isinstance(op, CardBulkCreate)]
+    updates = [op for op in bulk_in.operations if isinstance(op, CardBulkUpdate)]
+    delete_ids = {op.id for op in bulk_in.operations if op.op == "delete"}
+
+    update_values = [_update_values(op) for op in updates]
+    column_ids = {op.column_id for op in creates}
+    column_ids |= {v["column_id"] for v in update_values if "column_id" in v}
+    if column_ids:
+        found = set(
+            await db.scalars(select(Column.id).where(Column.id.in_(column_ids)))
+        )
+        if missing := sorted(column_ids - found):
+            raise HTTPException(status_code=404, detail=f"Columns not found: {missing}")
+    card_ids = {op.id for op in updates} | delete_ids
+    card_columns = await _card_columns(db, card_ids)
+    if missing := sorted(card_ids - card_columns.keys()):
+        raise HTTPException(status_code=404, detail=f"Cards not found: {missing}")
+
+    created_ids: list[int] = []
+    if creates:
+        rows = [op.model_dump(exclude={"op"}) for op in creates]
+        # Asking SQLAlchemy to sort RETURNING rows makes SQLite fall back to one
+        # INSERT per row. Ids are allocated in VALUES order, so sort them here.
+        created_ids = sorted(await db.scalars(insert(Card).returning(Card.id), rows))
+    now = utc_now()
+    changes = []
+    final_columns = dict(card_columns)
+    for op, values in zip(updates, update_values, strict=True):
+        if not values:
+            continue
+        change = {"id": op.id, **values}
+        if values.get("column_id", card_columns[op.id]) != card_columns[op.id]:
+            change["moved_at"] = now
+        changes.append(change)
+        final_columns[op.id] = values.get("column_id", final_columns[op.id])
+    if changes:
+        await db.execute(update(Card), changes)
+    if delete_ids:
+        await db.execute(delete(Card).where(Card.id.in_(delete_ids)))
+    await adjust_card_counts(
+        db,
+        card_count_deltas(
+            removed_from=card_columns.values(),
+            added_to=[
+                *(op.column_id for op in creates),
+                *(c for i, c in final_columns.items() if i not in delete_ids),
+            ],
+        ),
+    )
+    versions = await touch_boards(
+        db, column_ids=column_ids | set(card_columns.values())
+    )
+    await log_changes(db, versions, card_ids=[*created_ids, *card_ids])
+    await db.commit()
+
+    new_ids = iter(created_ids)
+    results = [
+        CardBulkResult(op=op.op, id=next(new_ids) if op.op == "create" else op.id)
+        for op in bulk_in.operations
+    ]
+    await publish_change(
+        versions, "cards.bulk", [result.model_dump() for result in results]
+    )
+    return results
+
+
 @router.patch("/cards/{card_id}", response_model=CardRead)
-def update_card(
-    card_id: int, card_in: CardUpdate, db: Session = Depends(get_db)
+async def update_card(
+    card_id: int, card_in: CardUpdate, db: AsyncSession = Depends(get_db)
 ) -> Card:
     """Update a card's fields."""
-    card = db.query(Card).filter(Card.id == card_id).first()
+    card = await db.get(Card, card_id)
     if card is None:
         raise HTTPException(status_code=404, detail="Card not found")
-    if card_in.title is not None:
-        card.title = card_in.title
-    if card_in.description is not None:
-        card.description = card_in.description
-    if card_in.position is not None:
-        card.position = card_in.position
-    if card_in.column_id is not None:
-        card.column_id = card_in.column_id
-    if "due_date" in card_in.model_fields_set:
-        card.due_date = card_in.due_date
-    if "assignee" in card_in.model_fields_set:
-        card.assignee = card_in.assignee
-    db.commit()
-    db.refresh(card)
+    previous_column_id = card.column_id
+    if (
+        card_in.column_id is not None
+        and card_in.column_id != previous_column_id
+        and await db.get(Column, card_in.column_id) is None
+    ):
+        raise HTTPException(status_code=404, detail="Column not found")
+    for field, value in _update_values(card_in).items():
+        setattr(card, field, value)
+    if card.column_id != previous_column_id:
+        card.moved_at = utc_now()
+        await adjust_card_counts(
+            db, card_count_deltas([previous_column_id], [card.column_id])
+        )
+    versions = await touch_boards(db, column_ids=[previous_column_id, card.column_id])
+    await log_changes(db, versions, card_ids=[card_id])
+    await db.commit()
+    await publish_change(versions, "card.updated", card_data(card))
+    return card
+
+
+@router.post("/cards/{card_id}/move", response_model=CardRead)
+async def move_card(
+    card_id: int, move: CardMove, db: AsyncSession = Depends(get_db)
+) -> Card:
+    """Move a card into a column between two neighbouring cards.
+
+    Only the moved card is written, unless its neighbours sit on adjacent
+    positions; then the target column is respaced in the same transaction,
+    and the ``card.moved`` event lists the new positions of the other cards.
+    """
+    card = await db.get(Card, card_id)
+    if card is None:
+        raise HTTPException(status_code=404, detail="Card not found")
+    if await db.get(Column, move.column_id) is None:
+        raise HTTPException(status_code=404, detail="Column not found")
+    respaced: dict[int, int] = {}
+    try:
+        bounds = await neighbour_positions(
+            db, card_id, move.column_id, move.after_card_id, move.before_card_id
+        )
+        position = position_between(*bounds)
+        if position is None:
+            respaced = await rebalance_column(db, move.column_id, card_id)
+            bounds = await neighbour_positions(
+                db, card_id, move.column_id, move.after_card_id, move.before_card_id
+            )
+            position = position_between(*bounds)
+    except StaleOrderError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    versions = await touch_boards(db, column_ids=[card.column_id, move.column_id])
+    if card.column_id != move.column_id:
+        await adjust_card_counts(
+            db, card_count_deltas([card.column_id], [move.column_id])
+        )
+        card.column_id = move.column_id
+        card.moved_at = utc_now()
+    card.position = position
+    await log_changes(db, versions, card_ids=[card_id, *respaced])
+    await db.commit()
+    data = card_data(card)
+    if respaced:
+        data["respaced"] = [
+            {"id": sibling_id, "position": position}
+            for sibling_id, position in respaced.items()
+        ]
+    await publish_change(versions, "card.moved", data)
     return card
 
 
 @router.delete("/cards/{card_id}", status_code=204)
-def delete_card(card_id: int, db: Session = Depends(get_db)) -> None:
+async def delete_card(card_id: int, db: AsyncSession = Depends(get_db)) -> None:
     """Delete a card."""
-    card = db.query(Card).filter(Card.id == card_id).first()
+    card = await db.get(Card, card_id)
     if card is None:
         raise HTTPException(status_code=404, detail="Card not found")
-    db.delete(card)
-    db.commit()
+    versions = await touch_boards(db, column_ids=[card.column_id])
+    await log_changes(db, versions, card_ids=[card_id])
+    await adjust_card_counts(db, card_count_deltas(removed_from=[card.column_id]))
+    await db.delete(card)
+    await db.commit()
+    await publish_change(
+        versions, "card.deleted", {"id": card_id, "column_id": card.column_id}
+    )
@@ -1,57 +1,160 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import case, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import COLUMNS, board_cache
+from app.changes import column_data, log_changes, publish_change, touch_boards
+from app.cursors import decode_cursor, encode_cursor
 from app.database import get_db
+from app.instrumentation import TimedRoute
+from app.loaders import (
+    load_board_payloads,
+    load_column,
+    load_column_cards,
+    load_columns,
+)
+from app.models.board import Board
+from app.models.card import Card
 from app.models.column import Column
-from app.schemas.column import ColumnCreate, ColumnRead, ColumnUpdate
+from app.responses import dumps
+from app.schemas.card import CardPage, CardRead
+from app.schemas.column import ColumnCreate, ColumnOrder, ColumnRead, ColumnUpdate
 
-router = APIRouter(tags=["columns"])
+router = APIRouter(tags=["columns"], route_class=TimedRoute)
 
 
 @router.get("/columns/{board_id}", response_model=list[ColumnRead])
-def list_columns(board_id: int, db: Session = Depends(get_db)) -> list[Column]:
-    """List all columns for a given board."""
-    return db.query(Column).filter(Column.board_id == board_id).all()
+async def list_columns(board_id: int, db: AsyncSession = Depends(get_db)) -> Response:
+    """List all columns for a given board.
+
+    The encoded list is cached per board version alongside the board tree.
+    """
+    version = await db.scalar(select(Board.version).where(Board.id == board_id))
+    if version is None:
+        return Response(b"[]", media_type="application/json")
+    payload = await board_cache.get(board_id, version, COLUMNS)
+    if payload is None:
+        boards = await load_board_payloads(db, board_id)
+        payload = dumps(boards[0]["columns"] if boards else [])
+        await board_cache.put(board_id, version, payload, COLUMNS)
+    return Response(payload, media_type="application/json")
+
+
+@router.get("/columns/{column_id}/cards", response_model=CardPage)
+async def list_column_cards(
+    column_id: int,
+    after: str | None = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+) -> CardPage:
+    """List a column's cards in order, one page at a time.
+
+    Pass the previous page's ``next_cursor``, or a column's ``next_cursor``
+    from ``GET /boards/{board_id}?cards_per_column=``, as ``after`` to
+    continue.
+    """
+    if await db.get(Column, column_id) is None:
+        raise HTTPException(status_code=404, detail="Column not found")
+    key = decode_cursor(after, int, int) if after is not None else None
+    cards = await load_column_cards(db, column_id, key, limit + 1)
+    items = [CardRead.model_validate(card) for card in cards[:limit]]
+    next_cursor = None
+    if len(cards) > limit:
+        last = cards[limit - 1]
+        next_cursor = encode_cursor(last.position, last.id)
+    return CardPage(items=items, next_cursor=next_cursor)
 
 
 @router.post("/columns", response_model=ColumnRead, status_code=201)
-def create_column(column_in: ColumnCreate, db: Session = Depends(get_db)) -> Column:
+async def create_column(
+    column_in: ColumnCreate, db: AsyncSession = Depends(get_db)
+) -> Column:
     """Create a new column."""
+    if await db.get(Board, column_in.board_id) is None:
+        raise HTTPException(status_code=404, detail="Board not found")
     column = Column(
         title=column_in.title,
         position=column_in.position,
         board_id=column_in.board_id,
+        cards=[],
     )
     db.add(column)
-    db.commit()
-    db.refresh(column)
+    await db.flush()
+    versions = await touch_boards(db, board_ids=[column.board_id])
+    await log_changes(db, versions, column_ids=[column.id])
+    await db.commit()
+    await publish_change(versions, "column.created", column_data(column))
     return column
 
 
 @router.patch("/columns/{column_id}", response_model=ColumnRead)
-def update_column(
-    column_id: int, column_in: ColumnUpdate, db: Session = Depends(get_db)
+async def update_column(
+    column_id: int, column_in: ColumnUpdate, db: AsyncSession = Depends(get_db)
 ) -> Column:
     """Update a column's title or position."""
-    column = db.query(Column).filter(Column.id == column_id).first()
+    column = await load_column(db, column_id)
     if column is None:
         raise HTTPException(status_code=404, detail="Column not found")
     if column_in.title is not None:
         column.title = column_in.title
     if column_in.position is not None:
         column.position = column_in.position
-    db.commit()
-    db.refresh(column)
+    versions = await touch_boards(db, board_ids=[column.board_id])
+    await log_changes(db, versions, column_ids=[column_id])
+    await db.commit()
+    await publish_change(versions, "column.updated", column_data(column))
     return column
 
 
+@router.put("/boards/{board_id}/columns/order", response_model=list[ColumnRead])
+async def reorder_columns(
+    board_id: int, order_in: ColumnOrder, db: AsyncSession = Depends(get_db)
+) -> list[Column]:
+    """Set the order of all of a board's columns in one statement.
+
+    ``column_ids`` must list exactly the board's current columns; an ordering
+    built from an outdated view of the board is rejected with 409.
+    """
+    if await db.get(Board, board_id) is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    current = set(
+        await db.scalars(select(Column.id).where(Column.board_id == board_id))
+    )
+    if len(order_in.column_ids) != len(current) or set(order_in.column_ids) != current:
+        raise HTTPException(
+            status_code=409, detail="Column order does not match the board's columns"
+        )
+    if current:
+        positions = {
+            column_id: pos for pos, column_id in enumerate(order_in.column_ids)
+        }
+        await db.execute(
+            update(Column)
+            .where(Column.board_id == board_id)
+            .values(position=case(positions, value=Column.id))
+            .execution_options(synchronize_session=False)
+        )
+        versions = await touch_boards(db, board_ids=[board_id])
+        await log_changes(db, versions, column_ids=current)
+        await db.commit()
+        await publish_change(versions, "columns.reordered", order_in.column_ids)
+    return await load_columns(db, board_id)
+
+
 @router.delete("/columns/{column_id}", status_code=204)
-def delete_column(column_id: int, db: Session = Depends(get_db)) -> None:
+async def delete_column(column_id: int, db: AsyncSession = Depends(get_db)) -> None:
     """Delete a column."""
-    column = db.query(Column).filter(Column.id == column_id).first()
+    column = await db.get(Column, column_id)
     if column is None:
         raise HTTPException(status_code=404, detail="Column not found")
-    db.delete(column)
-    db.commit()
+    card_ids = await db.scalars(select(Card.id).where(Card.column_id == column_id))
+    versions = await touch_boards(db, board_ids=[column.board_id])
+    await log_changes(db, versions, card_ids=card_ids.all(), column_ids=[column_id])
+    # The cards are deleted with it through ON DELETE CASCADE.
+    await db.delete(column)
+    await db.commit()
+    await publish_change(
+        versions, "column.deleted", {"id": column_id, "board_id": column.board_id}
+    )
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.cache import board_cache
+from app.instrumentation import TimedRoute, metrics
+
+router = APIRouter(tags=["monitoring"], route_class=TimedRoute)
+
+# Version 0.0.4 of the Prometheus text exposition format.
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/cache/stats")
+async def cache_stats() -> dict[str, int]:
+    """Report the board payload cache's size and hit, miss and eviction counts."""
+    return board_cache.stats()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def request_metrics() -> PlainTextResponse:
+    """Report per-route request counts, latency and SQL statement histograms."""
+    return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.instrumentation import TimedRoute
+from app.schemas.search import CardSearchPage, CardSearchResult
+from app.search import search_cards
+
+router = APIRouter(tags=["search"], route_class=TimedRoute)
+
+
+@router.get("/search", response_model=CardSearchPage)
+async def search(
+    q: str = Query(min_length=1, max_length=200, pattern=r"\S"),
+    board_id: int | None = None,
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_db),
+) -> CardSearchPage:
+    """Search card titles and descriptions, best match first.
+
+    Every word of ``q`` must appear in the card. Results can be limited to
+    one board and are paged with ``offset``.
+    """
+    rows, ranked = await search_cards(
+        db, q, board_id=board_id, limit=limit + 1, offset=offset
+    )
+    items = [CardSearchResult.model_validate(row) for row in rows[:limit]]
+    next_offset = offset + limit if len(rows) > limit else None
+    return CardSearchPage(items=items, next_offset=next_offset, ranked=ranked)
@@ -1,14 +1,68 @@
-from app.schemas.board import BoardCreate, BoardRead
-from app.schemas.card import CardCreate, CardRead, CardUpdate
-from app.schemas.column import ColumnCreate, ColumnRead, ColumnUpdate
+from app.schemas.archive import (
+    ArchivedCardPage,
+    ArchivedCardRead,
+    ColumnArchiveResult,
+)
+from app.schemas.board import (
+    BoardChanges,
+    BoardCreate,
+    BoardRead,
+    BoardStats,
+    BoardSummary,
+    BoardSummaryPage,
+    BoardWindow,
+    ColumnStats,
+)
+from app.schemas.card import (
+    CardBulkCreate,
+    CardBulkDelete,
+    CardBulkRequest,
+    CardBulkResult,
+    CardBulkUpdate,
+    CardCreate,
+    CardMove,
+    CardPage,
+    CardRead,
+    CardUpdate,
+)
+from app.schemas.column import (
+    ColumnCreate,
+    ColumnOrder,
+    ColumnRead,
+    ColumnSummary,
+    ColumnUpdate,
+    ColumnWindow,
+)
+from app.schemas.search import CardSearchPage, CardSearchResult
 
 __all__ = [
+    "ArchivedCardPage",
+    "ArchivedCardRead",
+    "BoardChanges",
     "BoardCreate",
     "BoardRead",
+    "BoardStats",
+    "BoardSummary",
+    "BoardSummaryPage",
+    "BoardWindow",
+    "CardBulkCreate",
+    "CardBulkDelete",
+    "CardBulkRequest",
+    "CardBulkResult",
+    "CardBulkUpdate",
     "CardCreate",
+    "CardMove",
+    "CardPage",
     "CardRead",
+    "CardSearchPage",
+    "CardSearchResult",
     "CardUpdate",
+    "ColumnArchiveResult",
     "ColumnCreate",
+    "ColumnOrder",
     "ColumnRead",
+    "ColumnStats",
+    "ColumnSummary",
     "ColumnUpdate",
+    "ColumnWindow",
 ]
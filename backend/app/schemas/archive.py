@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from app.schemas.card import CardRead
+
+
+class ArchivedCardRead(CardRead):
+    """Schema for reading an archived card."""
+
+    archived_at: datetime
+
+
+class ArchivedCardPage(BaseModel):
+    """Schema for one page of a board's archived cards, most recent first.
+
+    ``next_cursor`` is the value to pass as ``after`` to fetch the next page,
+    or ``None`` when there are no more cards.
+    """
+
+    items: list[ArchivedCardRead]
+    next_cursor: str | None = None
+
+
+class ColumnArchiveResult(BaseModel):
+    """Schema for the outcome of archiving a column's cards."""
+
+    archived: int
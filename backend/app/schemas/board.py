@@ -4,7 +4,8 @@ from datetime import datetime
 
 from pydantic import BaseModel
 
-from app.schemas.column import ColumnRead
+from app.schemas.card import CardRead
+from app.schemas.column import ColumnRead, ColumnSummary, ColumnWindow
 
 
 class BoardBase(BaseModel):
@@ -22,6 +23,80 @@ class BoardRead(BoardBase):
 
     id: int
     created_at: datetime
+    version: int = 0
     columns: list[ColumnRead] = []
 
     model_config = {"from_attributes": True}
+
+
+class BoardWindow(BoardRead):
+    """Schema for a board whose columns carry only their first cards."""
+
+    columns: list[ColumnWindow] = []
+
+
+class BoardSummary(BaseModel):
+    """Schema for a board listing entry without nested columns and cards."""
+
+    id: int
+    title: str
+    created_at: datetime
+    column_count: int
+    card_count: int
+
+    model_config = {"from_attributes": True}
+
+
+class BoardSummaryPage(BaseModel):
+    """Schema for one page of board summaries.
+
+    ``next_cursor`` is the value to pass as ``after`` to fetch the next page,
+    or ``None`` when there are no more boards.
+    """
+
+    items: list[BoardSummary]
+    next_cursor: int | None = None
+
+
+class ColumnStats(BaseModel):
+    """Schema for the card counts of one column."""
+
+    id: int
+    title: str
+    position: int
+    card_count: int
+    overdue_count: int
+
+    model_config = {"from_attributes": True}
+
+
+class BoardStats(BaseModel):
+    """Schema for the card counts of a board and each of its columns.
+
+    Archived cards are not counted. A card is overdue once its due date has
+    passed.
+    """
+
+    id: int
+    version: int
+    card_count: int
+    overdue_count: int
+    columns: list[ColumnStats]
+
+
+class BoardChanges(BaseModel):
+    """Schema for the changes to a board since a given version.
+
+    ``columns`` and ``cards`` hold the current state of every row changed after
+    ``since``; rows deleted or moved off the board are listed by id. When the
+    change log no longer reaches back to ``since``, ``snapshot`` carries the
+    whole board instead and the change lists are empty.
+    """
+
+    since: int
+    version: int
+    columns: list[ColumnSummary] = []
+    cards: list[CardRead] = []
+    deleted_column_ids: list[int] = []
+    deleted_card_ids: list[int] = []
+    snapshot: BoardRead | None = None
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Annotated, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class CardBase(BaseModel):
@@ -31,6 +32,18 @@ class CardUpdate(BaseModel):
     assignee: str | None = None
 
 
+class CardMove(BaseModel):
+    """Schema for moving a card to a column, between two neighbouring cards.
+
+    ``after_card_id`` is the card that should precede the moved card and
+    ``before_card_id`` the one that should follow it; either may be omitted.
+    """
+
+    column_id: int
+    after_card_id: int | None = None
+    before_card_id: int | None = None
+
+
 class CardRead(CardBase):
     """Schema for reading card data."""
 
@@ -38,3 +51,52 @@ class CardRead(CardBase):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class CardPage(BaseModel):
+    """Schema for one page of cards matching a query.
+
+    ``next_cursor`` is the value to pass as ``after`` to fetch the next page,
+    or ``None`` when there are no more cards.
+    """
+
+    items: list[CardRead]
+    next_cursor: str | None = None
+
+
+class CardBulkCreate(CardCreate):
+    """Bulk operation creating a card."""
+
+    op: Literal["create"]
+
+
+class CardBulkUpdate(CardUpdate):
+    """Bulk operation partially updating a card."""
+
+    op: Literal["update"]
+    id: int
+
+
+class CardBulkDelete(BaseModel):
+    """Bulk operation deleting a card."""
+
+    op: Literal["delete"]
+    id: int
+
+
+CardBulkOperation = Annotated[
+    CardBulkCreate | CardBulkUpdate | CardBulkDelete, Field(discriminator="op")
+]
+
+
+class CardBulkRequest(BaseModel):
+    """Schema for a batch of card operations applied in one transaction."""
+
+    operations: list[CardBulkOperation] = Field(min_length=1, max_length=10_000)
+
+
+class CardBulkResult(BaseModel):
+    """Outcome of one bulk operation: the operation and the affected card id."""
+
+    op: Literal["create", "update", "delete"]
+    id: int
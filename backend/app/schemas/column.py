@@ -24,6 +24,20 @@ class ColumnUpdate(BaseModel):
     position: int | None = None
 
 
+class ColumnOrder(BaseModel):
+    """Schema for reordering every column of a board at once."""
+
+    column_ids: list[int]
+
+
+class ColumnSummary(ColumnBase):
+    """Schema for a column without its cards."""
+
+    id: int
+
+    model_config = {"from_attributes": True}
+
+
 class ColumnRead(ColumnBase):
     """Schema for reading column data."""
 
@@ -31,3 +45,15 @@ class ColumnRead(ColumnBase):
     cards: list[CardRead] = []
 
     model_config = {"from_attributes": True}
+
+
+class ColumnWindow(ColumnRead):
+    """Schema for a column with only its first cards.
+
+    ``card_count`` is the total number of cards in the column. ``next_cursor``
+    is the value to pass as ``after`` to ``GET /columns/{column_id}/cards`` for
+    the cards that follow, or ``None`` when ``cards`` holds all of them.
+    """
+
+    card_count: int
+    next_cursor: str | None = None
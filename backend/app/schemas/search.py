@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class CardSearchResult(BaseModel):
+    """Schema for a card matching a search, with its column and board.
+
+    ``snippet`` is an excerpt of the matching field with the matched words
+    wrapped in ``<mark>`` tags. The rest of the text is HTML-escaped.
+    """
+
+    id: int
+    title: str
+    description: str | None = None
+    column_id: int
+    column_title: str
+    board_id: int
+    board_title: str
+    snippet: str | None = None
+
+    model_config = {"from_attributes": True}
+
+
+class CardSearchPage(BaseModel):
+    """Schema for one page of search results.
+
+    Results are ordered best match first when ``ranked`` is true, and newest
+    first for queries too broad to rank. ``next_offset`` is the value to pass
+    as ``offset`` to fetch the next page, or ``None`` when there are no more
+    results.
+    """
+
+    items: list[CardSearchResult]
+    next_offset: int | None = None
+    ranked: bool = True
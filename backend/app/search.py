@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import html
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Row,
+    Select,
+    and_,
+    column,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.board import Board
+from app.models.card import CARD_SEARCH_VECTOR, Card
+from app.models.column import Column
+
+# Ranking costs a few microseconds per matching card, so only queries with up
+# to this many matches are ranked; broader ones list the newest matches first.
+RANKED_MATCH_LIMIT = 5000
+# BM25 weights of the indexed columns: a hit in the title counts for more.
+TITLE_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+SNIPPET_TOKENS = 12
+# The database wraps matches in these control characters rather than in
+# <mark> tags, so that the snippet can be HTML-escaped before they are turned
+# into tags. Card text containing them at most gets stray highlighting.
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+
+cards_fts = table("cards_fts", column("rowid", Integer))
+_index = literal_column("cards_fts")
+
+# PostgreSQL: the indexed tsvector, and ts_rank weights for its D, C, B
+# (description) and A (title) labels in the same proportion as above.
+_search_vector = literal_column(CARD_SEARCH_VECTOR)
+_rank_weights = literal_column(
+    f"'{{0, 0, {DESCRIPTION_WEIGHT / TITLE_WEIGHT}, 1}}'::float4[]"
+)
+_headline_options = (
+    f"StartSel={MATCH_START}, StopSel={MATCH_END}, "
+    f"MaxWords={SNIPPET_TOKENS}, MinWords={SNIPPET_TOKENS // 2}, ShortWord=0"
+)
+
+
+def match_query(q: str) -> str:
+    """Turn free text into an FTS5 query matching cards containing every word.
+
+    Each word is quoted, so FTS5 operators and punctuation in user input are
+    matched literally instead of being parsed as query syntax.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in q.split())
+
+
+def highlight(snippet: str | None) -> str | None:
+    """HTML-escape a snippet and wrap its matched words in ``<mark>`` tags."""
+    if snippet is None:
+        return None
+    return (
+        html.escape(snippet)
+        .replace(MATCH_START, "<mark>")
+        .replace(MATCH_END, "</mark>")
+    )
+
+
+def _with_context(stmt: Select, board_id: int | None) -> Select:
+    stmt = stmt.join(Column, Column.id == Card.column_id).join(
+        Board, Board.id == Column.board_id
+    )
+    if board_id is not None:
+        stmt = stmt.where(Column.board_id == board_id)
+    return stmt
+
+
+def _result_columns(snippet: ColumnElement) -> Select:
+    return select(
+        Card.id,
+        Card.title,
+        Card.description,
+        Card.column_id,
+        Column.title.label("column_title"),
+        Column.board_id,
+        Board.title.label("board_title"),
+        snippet.label("snippet"),
+    )
+
+
+async def _fts_search(
+    db: AsyncSession, q: str, board_id: int | None, limit: int, offset: int
+) -> tuple[list[Row], bool]:
+    filters = [_index.op("MATCH")(match_query(q))]
+    if board_id is not None:
+        # Cards of one board tend to have nearby ids; limiting the index scan
+        # to the board's id range lets FTS5 skip most other boards' matches.
+        bounds = (
+            await db.execute(
+                select(func.min(Card.id), func.max(Card.id))
+                .join(Column, Column.id == Card.column_id)
+                .where(Column.board_id == board_id)
+            )
+        ).one()
+        if bounds[0] is None:
+            return [], True
+        filters.append(cards_fts.c.rowid.between(*bounds))
+
+    probe = select(cards_fts.c.rowid).where(*filters).limit(RANKED_MATCH_LIMIT + 1)
+    match_count = await db.scalar(select(func.count()).select_from(probe.subquery()))
+    ranked = match_count <= RANKED_MATCH_LIMIT
+    if ranked:
+        order = func.bm25(_index, TITLE_WEIGHT, DESCRIPTION_WEIGHT)
+    else:
+        order = cards_fts.c.rowid.desc()
+
+    # Pick the page first, then compute snippets and context for that page
+    # only rather than for every match.
+    page = select(cards_fts.c.rowid).where(*filters)
+    if board_id is not None:
+        page = (
+            page.join(Card, Card.id == cards_fts.c.rowid)
+            .join(Column, Column.id == Card.column_id)
+            .where(Column.board_id == board_id)
+        )
+    ids = list(await db.scalars(page.order_by(order).limit(limit).offset(offset)))
+    if not ids:
+        return [], ranked
+
+    snippet = func.snippet(_index, -1, MATCH_START, MATCH_END, "…", SNIPPET_TOKENS)
+    details = (
+        _result_columns(snippet)
+        .select_from(cards_fts)
+        .join(Card, Card.id == cards_fts.c.rowid)
+        .where(filters[0], cards_fts.c.rowid.in_(ids))
+    )
+    rows = {row.id: row for row in await db.execute(_with_context(details, None))}
+    return [rows[card_id] for card_id in ids], ranked
+
+
+async def _tsvector_search(
+    db: AsyncSession, q: str, board_id: int | None, limit: int, offset: int
+) -> tuple[list[Row], bool]:
+    # The text search configuration is inlined so that the condition matches
+    # the expression of the ix_cards_search index.
+    query = func.plainto_tsquery(literal_column("'simple'"), q)
+    matches = select(Card.id).where(_search_vector.op("@@")(query))
+    if board_id is not None:
+        matches = matches.join(Column, Column.id == Card.column_id).where(
+            Column.board_id == board_id
+        )
+
+    probe = matches.limit(RANKED_MATCH_LIMIT + 1)
+    match_count = await db.scalar(select(func.count()).select_from(probe.subquery()))
+    ranked = match_count <= RANKED_MATCH_LIMIT
+    if ranked:
+        order = func.ts_rank(_rank_weights, _search_vector, query).desc()
+    else:
+        order = Card.id.desc()
+    ids = list(await db.scalars(matches.order_by(order).limit(limit).offset(offset)))
+    if not ids:
+        return [], ranked
+
+    text = func.concat_ws(" ", Card.title, Card.description)
+    snippet = func.ts_headline(
+        literal_column("'simple'"), text, query, _headline_options
+    )
+    details = _result_columns(snippet).select_from(Card).where(Card.id.in_(ids))
+    rows = {row.id: row for row in await db.execute(_with_context(details, None))}
+    return [rows[card_id] for card_id in ids], ranked
+
+
+async def _like_search(
+    db: AsyncSession, q: str, board_id: int | None, limit: int, offset: int
+) -> tuple[list[Row], bool]:
+    terms = [
+        or_(
+            Card.title.icontains(term, autoescape=True),
+            Card.description.icontains(term, autoescape=True),
+        )
+        for term in q.split()
+    ]
+    stmt = (
+        _result_columns(literal_column("NULL"))
+        .select_from(Card)
+        .where(and_(*terms))
+        .order_by(Card.id.desc())
+    )
+    stmt = _with_context(stmt, board_id).limit(limit).offset(offset)
+    return list(await db.execute(stmt)), False
+
+
+async def search_cards(
+    db: AsyncSession,
+    q: str,
+    *,
+    board_id: int | None,
+    limit: int,
+    offset: int,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Find the cards whose title or description contains every word of ``q``.
+
+    On SQLite the ``cards_fts`` index is queried and results are ranked by
+    BM25; on PostgreSQL the ``ix_cards_search`` tsvector index is used with
+    ``ts_rank``. Either way results come with highlighted snippets and are
+    ranked unless the query matches more than ``RANKED_MATCH_LIMIT`` cards.
+    Other databases fall back to substring matching without snippets.
+    Returns the results and whether they are ranked; unranked results are
+    ordered newest first.
+    """
+    dialect = db.bind.dialect.name
+    if dialect == "sqlite":
+        search = _fts_search
+    elif dialect == "postgresql":
+        search = _tsvector_search
+    else:
+        search = _like_search
+    rows, ranked = await search(db, q, board_id, limit, offset)
+    results = [{**row._mapping, "snippet": highlight(row.snippet)} for row in rows]
+    return results, ranked
@@ -0,0 +1,100 @@
+"""Compare two benchmark reports and flag regressions.
+
+Run from ``backend/``::
+
+    uv run python -m benchmarks.load --output before.json
+    # ...change something...
+    uv run python -m benchmarks.load --output after.json
+    uv run python -m benchmarks.compare before.json after.json --threshold 10
+
+Every numeric result present in both reports is listed with its relative
+change. Latencies, query counts, sizes and memory are better when lower;
+throughput is better when higher. Any metric that got worse by more than
+``--threshold`` percent is marked, and the script then exits with status 1
+so it can gate a CI job.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+# Metrics (the last part of their dotted path) that are better when higher.
+HIGHER_IS_BETTER = ("requests_per_second",)
+# Metrics that describe the run rather than measure it, and maxima, which rest
+# on a single sample and are too noisy to gate on.
+IGNORED = ("requests", "seconds", "max", "matches", "budget_ms")
+
+
+def _flatten(results: Any, prefix: str = "") -> Iterator[tuple[str, float]]:
+    if isinstance(results, dict):
+        for key, value in results.items():
+            yield from _flatten(value, f"{prefix}{key}.")
+    elif isinstance(results, int | float) and not isinstance(results, bool):
+        yield prefix.rstrip("."), float(results)
+
+
+def compare(
+    before: dict[str, Any], after: dict[str, Any], threshold: float
+) -> tuple[list[tuple[str, float, float, float | None, bool]], bool]:
+    """Pair up the results of two reports.
+
+    Returns one ``(metric, before, after, change_percent, regressed)`` row per
+    metric found in both, and whether any of them regressed. The change is
+    ``None`` when the old value is zero.
+    """
+    old = dict(_flatten(before["results"]))
+    rows = []
+    for metric, new_value in _flatten(after["results"]):
+        name = metric.rsplit(".", 1)[-1]
+        if metric not in old or name in IGNORED:
+            continue
+        old_value = old[metric]
+        if old_value == 0:
+            rows.append((metric, old_value, new_value, None, False))
+            continue
+        change = (new_value - old_value) / abs(old_value) * 100
+        worse = -change if name in HIGHER_IS_BETTER else change
+        rows.append((metric, old_value, new_value, change, worse > threshold))
+    return rows, any(row[4] for row in rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("before", type=Path)
+    parser.add_argument("after", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="percentage by which a metric may get worse (default: 10)",
+    )
+    args = parser.parse_args()
+
+    before = json.loads(args.before.read_text())
+    after = json.loads(args.after.read_text())
+    if before["benchmark"] != after["benchmark"]:
+        parser.error(
+            f"cannot compare a {before['benchmark']!r} report "
+            f"with a {after['benchmark']!r} report"
+        )
+    if before["parameters"] != after["parameters"]:
+        print("warning: the reports were taken with different parameters")
+
+    rows, regressed = compare(before, after, args.threshold)
+    width = max((len(row[0]) for row in rows), default=0)
+    for metric, old_value, new_value, change, worse in rows:
+        delta = "n/a" if change is None else f"{change:+.1f}%"
+        marker = "  REGRESSION" if worse else ""
+        print(
+            f"{metric:<{width}}  {old_value:>12g}  {new_value:>12g}  {delta:>8}{marker}"
+        )
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
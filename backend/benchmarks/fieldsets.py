@@ -0,0 +1,115 @@
+"""Compare full board payloads with sparse fieldsets.
+
+Run from ``backend/``::
+
+    uv run python -m benchmarks.fieldsets --cards 10000 --description-bytes 2000
+
+One board with ``--cards`` cards is seeded into a throwaway SQLite database,
+every card getting a description of ``--description-bytes`` bytes, and
+fetched repeatedly through ``httpx.ASGITransport``: in full, with only the
+card fields a board view needs (``fields[card]=id,title,position,column_id``),
+and windowed to the first 50 cards of each column with the same fields. The
+board cache is disabled so that every request reads and encodes the board.
+The script reports the payload size, the latency percentiles and the CPU time
+per request for each.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+
+import httpx
+
+from benchmarks.harness import (
+    add_output_argument,
+    latency_summary,
+    report,
+    seeded_app_database,
+)
+
+SPARSE_CARD_FIELDS = "id,title,position,column_id"
+
+
+def _pad_descriptions(url: str, description_bytes: int) -> None:
+    from sqlalchemy import update
+
+    from app.config import Settings
+    from app.database import create_db_engine
+    from app.models.card import Card
+
+    engine = create_db_engine(Settings(database_url=url))
+    with engine.begin() as conn:
+        conn.execute(update(Card).values(description="x" * description_bytes))
+    engine.dispose()
+
+
+async def _measure(
+    client: httpx.AsyncClient, params: dict[str, str | int], requests: int
+) -> dict:
+    url = "/api/boards/1"
+    (await client.get(url, params=params)).raise_for_status()  # warm up
+    latencies = []
+    cpu_start = time.process_time()
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+    cpu_ms = (time.process_time() - cpu_start) * 1000 / requests
+    return {
+        "bytes": len(response.content),
+        "latency_ms": latency_summary(latencies),
+        "cpu_ms_per_request": round(cpu_ms, 2),
+    }
+
+
+async def _drive(requests: int) -> dict:
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        sparse = {"fields[card]": SPARSE_CARD_FIELDS}
+        return {
+            "full": await _measure(client, {}, requests),
+            "sparse": await _measure(client, sparse, requests),
+            "sparse_windowed": await _measure(
+                client, {**sparse, "cards_per_column": 50}, requests
+            ),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=10_000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--description-bytes", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=50)
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    os.environ["KANBAN_BOARD_CACHE_BYTES"] = "0"
+    with seeded_app_database(
+        boards=1, columns_per_board=args.columns, cards=args.cards
+    ) as url:
+        _pad_descriptions(url, args.description_bytes)
+        results = asyncio.run(_drive(args.requests))
+    report(
+        "fieldsets",
+        {
+            "cards": args.cards,
+            "columns": args.columns,
+            "description_bytes": args.description_bytes,
+            "requests": args.requests,
+        },
+        results,
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
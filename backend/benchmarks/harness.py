@@ -0,0 +1,177 @@
+"""Helpers shared by the benchmark scripts.
+
+Every script seeds its own dataset, measures, and hands its results to
+:func:`report`, which adds the commit, interpreter and platform they were
+taken on and prints them as JSON or writes them to ``--output``. Two such
+reports can be diffed with ``python -m benchmarks.compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+# Named dataset sizes: boards, columns per board and cards per column.
+DATASETS = {
+    "small": (10, 5, 20),
+    "medium": (100, 20, 50),
+    "large": (100, 20, 500),
+}
+
+# Name of the operation the current task is timing, for per-operation counts.
+current_operation: ContextVar[str | None] = ContextVar(
+    "current_operation", default=None
+)
+
+
+def add_output_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="write the JSON report to this file instead of printing it",
+    )
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def report(
+    benchmark: str,
+    parameters: dict[str, Any],
+    results: dict[str, Any],
+    output: Path | None = None,
+) -> None:
+    """Print ``results`` as a JSON report, or write it to ``output``."""
+    document = {
+        "benchmark": benchmark,
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        },
+        "parameters": parameters,
+        "results": results,
+    }
+    text = json.dumps(document, indent=2)
+    if output is None:
+        print(text)
+    else:
+        output.write_text(text + "\n")
+
+
+def latency_summary(latencies_ms: list[float]) -> dict[str, float]:
+    """Percentiles of a list of request latencies, in milliseconds."""
+    if len(latencies_ms) < 2:
+        value = round(latencies_ms[0], 2) if latencies_ms else 0.0
+        return {"p50": value, "p95": value, "p99": value, "max": value}
+    quantiles = statistics.quantiles(latencies_ms, n=100, method="inclusive")
+    return {
+        "p50": round(quantiles[49], 2),
+        "p95": round(quantiles[94], 2),
+        "p99": round(quantiles[98], 2),
+        "max": round(max(latencies_ms), 2),
+    }
+
+
+def reset_peak_rss() -> None:
+    """Start a new peak resident set size measurement, where Linux allows it."""
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        pass
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process since the last reset."""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class QueryCounter:
+    """Counts SQL statements per :data:`current_operation`."""
+
+    def __init__(self) -> None:
+        self.counts: dict[str | None, int] = {}
+
+    def __call__(self, *_args: Any) -> None:
+        operation = current_operation.get()
+        self.counts[operation] = self.counts.get(operation, 0) + 1
+
+    @contextmanager
+    def attached(self, engine: Engine) -> Iterator[QueryCounter]:
+        event.listen(engine, "before_cursor_execute", self)
+        try:
+            yield self
+        finally:
+            event.remove(engine, "before_cursor_execute", self)
+
+
+@contextmanager
+def seeded_app_database(
+    *,
+    boards: int,
+    columns_per_board: int,
+    cards: int,
+    database_url: str | None = None,
+) -> Iterator[str]:
+    """Seed a database and point the app at it; yields its URL.
+
+    Without ``database_url`` a throwaway SQLite file is used. Otherwise the
+    tables are created in that (empty) database and dropped again afterwards.
+    The app reads its settings at import time, so nothing from it (nor
+    ``benchmarks.seed``) may be imported before entering this context.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        url = database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        os.environ["KANBAN_DATABASE_URL"] = url
+
+        import app.models  # noqa: F401
+        from app.config import Settings
+        from app.database import Base, create_db_engine
+        from benchmarks.seed import seed
+
+        engine = create_db_engine(Settings(database_url=url))
+        Base.metadata.create_all(engine)
+        try:
+            seed(
+                engine,
+                boards=boards,
+                columns_per_board=columns_per_board,
+                cards=cards,
+            )
+            engine.dispose()
+            yield url
+        finally:
+            if database_url is not None:
+                Base.metadata.drop_all(engine)
+            engine.dispose()
@@ -0,0 +1,115 @@
+"""Benchmark hot read queries with and without the foreign-key/ordering indexes.
+
+Run from ``backend/``::
+
+    uv run python -m benchmarks.indexes --cards 1000000
+
+The script seeds a throwaway SQLite database, times each query with the
+indexes from revision ``7c1e9a4b2d3f`` dropped and then recreated, and reports
+the median latency of both runs (see ``benchmarks.harness.report``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+from sqlalchemy import Connection, create_engine, text
+
+import app.models  # noqa: F401
+from app.database import Base
+from benchmarks.harness import add_output_argument, report
+from benchmarks.seed import seed
+
+INDEXES = [
+    index
+    for table in ("columns", "cards")
+    for index in Base.metadata.tables[table].indexes
+    if index.name != f"ix_{table}_id"
+]
+
+QUERIES = {
+    "list_columns": (
+        "SELECT * FROM columns WHERE board_id = :board_id ORDER BY position",
+        {"board_id": 50},
+    ),
+    "list_cards": (
+        "SELECT * FROM cards WHERE column_id = :column_id ORDER BY position",
+        {"column_id": 1000},
+    ),
+    "cards_by_assignee": (
+        "SELECT * FROM cards WHERE assignee = :assignee",
+        {"assignee": "user07"},
+    ),
+    "overdue_cards": (
+        "SELECT * FROM cards WHERE due_date < :now ORDER BY due_date LIMIT 50",
+        {"now": datetime.now(UTC).replace(tzinfo=None)},
+    ),
+}
+
+
+def _time_queries(conn: Connection, repeat: int) -> dict[str, float]:
+    results = {}
+    for name, (sql, params) in QUERIES.items():
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            conn.execute(text(sql), params).fetchall()
+            timings.append((time.perf_counter() - start) * 1000)
+        results[name] = round(statistics.median(timings), 3)
+    return results
+
+
+def run(cards: int, boards: int, columns_per_board: int, repeat: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        seed(engine, boards=boards, columns_per_board=columns_per_board, cards=cards)
+
+        with engine.begin() as conn:
+            for index in INDEXES:
+                index.drop(conn)
+            conn.execute(text("ANALYZE"))
+            before = _time_queries(conn, repeat)
+
+            for index in INDEXES:
+                index.create(conn)
+            conn.execute(text("ANALYZE"))
+            after = _time_queries(conn, repeat)
+        engine.dispose()
+
+    return {
+        "median_ms": {
+            name: {"before": before[name], "after": after[name]} for name in QUERIES
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=1_000_000)
+    parser.add_argument("--boards", type=int, default=100)
+    parser.add_argument("--columns-per-board", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    add_output_argument(parser)
+    args = parser.parse_args()
+    report(
+        "indexes",
+        {
+            "cards": args.cards,
+            "boards": args.boards,
+            "columns_per_board": args.columns_per_board,
+            "repeat": args.repeat,
+            "indexes": [index.name for index in INDEXES],
+        },
+        run(args.cards, args.boards, args.columns_per_board, args.repeat),
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""Drive the API with concurrent clients and report throughput and latency.
+
+Run from ``backend/``::
+
+    uv run python -m benchmarks.load --dataset large --clients 100
+    uv run python -m benchmarks.load --output before.json
+
+A named dataset (see ``benchmarks.harness.DATASETS``; ``large`` is 100 boards x
+20 columns x 500 cards) is seeded into a throwaway SQLite database, or into
+the empty database given with ``--database-url``. The app is then served
+in-process through ``httpx.ASGITransport``, so the numbers measure request
+handling and the database rather than the network. Each client loops over a
+weighted mix of board, column and card reads and writes.
+
+The report gives the overall requests per second and, per operation, the
+p50/p95/p99 latency and SQL statements per request, plus the peak RSS of the
+process while the clients ran. Compare two reports with
+``python -m benchmarks.compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from collections import defaultdict
+from collections.abc import Callable
+
+import httpx
+
+from benchmarks.harness import (
+    DATASETS,
+    QueryCounter,
+    add_output_argument,
+    current_operation,
+    latency_summary,
+    peak_rss_bytes,
+    report,
+    reset_peak_rss,
+    seeded_app_database,
+)
+
+WARMUP_REQUESTS = 50
+
+
+class Workload:
+    """Picks requests against the seeded ids, in proportion to ``MIX``."""
+
+    MIX = {
+        "get_board": 35,
+        "list_columns": 10,
+        "list_cards": 25,
+        "update_card": 15,
+        "move_card": 10,
+        "create_card": 5,
+    }
+
+    def __init__(self, boards: int, columns_per_board: int, cards: int) -> None:
+        self.boards = boards
+        self.columns_per_board = columns_per_board
+        self.columns = boards * columns_per_board
+        self.cards = cards
+        self.cards_per_column = max(cards // self.columns, 1)
+        self.names = list(self.MIX)
+        self.weights = list(self.MIX.values())
+
+    def _board_column(self, rng: random.Random, board_id: int) -> int:
+        return (board_id - 1) * self.columns_per_board + rng.randint(
+            1, self.columns_per_board
+        )
+
+    def _card_board(self, card_id: int) -> int:
+        column_id = min((card_id - 1) // self.cards_per_column, self.columns - 1) + 1
+        return (column_id - 1) // self.columns_per_board + 1
+
+    def request(
+        self, rng: random.Random
+    ) -> tuple[str, Callable[[httpx.AsyncClient], object]]:
+        name = rng.choices(self.names, self.weights)[0]
+        board_id = rng.randint(1, self.boards)
+        card_id = rng.randint(1, self.cards)
+        if name == "get_board":
+            return name, lambda c: c.get(f"/api/boards/{board_id}")
+        if name == "list_columns":
+            return name, lambda c: c.get(f"/api/columns/{board_id}")
+        if name == "list_cards":
+            column_id = self._board_column(rng, board_id)
+            return name, lambda c: c.get(f"/api/cards/{column_id}")
+        if name == "update_card":
+            body = {"assignee": f"user{rng.randint(0, 49):02d}"}
+            return name, lambda c: c.patch(f"/api/cards/{card_id}", json=body)
+        if name == "move_card":
+            # Seeded cards only ever move within their own board.
+            body = {"column_id": self._board_column(rng, self._card_board(card_id))}
+            return name, lambda c: c.post(f"/api/cards/{card_id}/move", json=body)
+        body = {
+            "title": "Benchmark card",
+            "position": 0,
+            "column_id": self._board_column(rng, board_id),
+        }
+        return name, lambda c: c.post("/api/cards", json=body)
+
+
+async def _client_loop(
+    client: httpx.AsyncClient,
+    workload: Workload,
+    requests: int,
+    rng: random.Random,
+    latencies: defaultdict[str, list[float]],
+    errors: defaultdict[str, int],
+) -> None:
+    for _ in range(requests):
+        name, send = workload.request(rng)
+        token = current_operation.set(name)
+        start = time.perf_counter()
+        try:
+            response = await send(client)
+        finally:
+            current_operation.reset(token)
+        latencies[name].append((time.perf_counter() - start) * 1000)
+        if response.is_error:
+            errors[name] += 1
+
+
+async def _drive(args: argparse.Namespace, workload: Workload) -> dict:
+    from app.database import async_engine
+    from app.main import app
+
+    latencies: defaultdict[str, list[float]] = defaultdict(list)
+    errors: defaultdict[str, int] = defaultdict(int)
+    counter = QueryCounter()
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        # Warm up the connection pool and the app's lazily built state.
+        await _client_loop(
+            client, workload, WARMUP_REQUESTS, random.Random(-1), latencies, errors
+        )
+        latencies.clear()
+        errors.clear()
+        reset_peak_rss()
+        with counter.attached(async_engine.sync_engine):
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(
+                    _client_loop(
+                        client,
+                        workload,
+                        args.requests_per_client,
+                        random.Random(args.seed * 100_003 + n),
+                        latencies,
+                        errors,
+                    )
+                    for n in range(args.clients)
+                )
+            )
+            elapsed = time.perf_counter() - start
+    await async_engine.dispose()
+
+    total = sum(len(values) for values in latencies.values())
+    return {
+        "requests": total,
+        "errors": sum(errors.values()),
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(total / elapsed, 1),
+        "latency_ms": latency_summary(
+            [ms for values in latencies.values() for ms in values]
+        ),
+        "queries_per_request": round(sum(counter.counts.values()) / total, 2),
+        "peak_rss_bytes": peak_rss_bytes(),
+        "operations": {
+            name: {
+                "requests": len(latencies[name]),
+                "errors": errors[name],
+                "latency_ms": latency_summary(latencies[name]),
+                "queries_per_request": round(
+                    counter.counts.get(name, 0) / len(latencies[name]), 2
+                ),
+            }
+            for name in Workload.MIX
+            if latencies[name]
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dataset", choices=DATASETS, default="medium")
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--requests-per-client", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--database-url",
+        help="empty database to seed instead of a throwaway SQLite file",
+    )
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    boards, columns_per_board, cards_per_column = DATASETS[args.dataset]
+    cards = boards * columns_per_board * cards_per_column
+    with seeded_app_database(
+        boards=boards,
+        columns_per_board=columns_per_board,
+        cards=cards,
+        database_url=args.database_url,
+    ) as url:
+        workload = Workload(boards, columns_per_board, cards)
+        results = asyncio.run(_drive(args, workload))
+
+    report(
+        "load",
+        {
+            "dataset": args.dataset,
+            "boards": boards,
+            "columns_per_board": columns_per_board,
+            "cards": cards,
+            "clients": args.clients,
+            "requests_per_client": args.requests_per_client,
+            "seed": args.seed,
+            "database": url.split(":", 1)[0],
+        },
+        results,
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Measure time to first byte and peak memory of ``GET /api/boards``.
+
+Run from ``backend/``::
+
+    uv run python -m benchmarks.memory --cards 100000
+
+``--cards`` cards spread over ``--boards`` boards are seeded into a throwaway
+SQLite database. The board list is then requested by calling the ASGI app
+directly, with a ``send`` that only counts the bytes: from the streaming
+endpoint, with and without compression, and built the way the endpoint used
+to, with every board loaded into dicts and encoded in one piece. For each the
+script reports the time to the first and the last byte, the bytes sent and the
+peak Python heap allocation traced during a separate run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+
+from starlette.types import ASGIApp
+
+from benchmarks.harness import add_output_argument, report, seeded_app_database
+
+
+def _add_buffered_route() -> None:
+    from fastapi import Depends, Response
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.database import get_db
+    from app.loaders import load_board_payloads
+    from app.main import app
+    from app.responses import dumps
+
+    @app.get("/bench/buffered")
+    async def buffered_boards(db: AsyncSession = Depends(get_db)) -> Response:
+        return Response(
+            dumps(await load_board_payloads(db)), media_type="application/json"
+        )
+
+
+async def _fetch(app: ASGIApp, url: str, encoding: str) -> dict:
+    """Call the app directly, counting the body bytes without keeping them."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": url,
+        "raw_path": url.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"accept-encoding", encoding.encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    requested = False
+    disconnected = asyncio.Event()
+    start = time.perf_counter()
+    first_byte_ms = None
+    received = 0
+
+    async def receive() -> dict:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        nonlocal first_byte_ms, received
+        if message["type"] == "http.response.body" and message.get("body"):
+            if first_byte_ms is None:
+                first_byte_ms = (time.perf_counter() - start) * 1000
+            received += len(message["body"])
+
+    await app(scope, receive, send)
+    disconnected.set()
+    return {
+        "first_byte_ms": round(first_byte_ms or 0.0, 2),
+        "last_byte_ms": round((time.perf_counter() - start) * 1000, 2),
+        "bytes": received,
+    }
+
+
+async def _peak_bytes(run: Callable[[], Awaitable[dict]]) -> int:
+    tracemalloc.start()
+    try:
+        await run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+async def _drive() -> dict:
+    from app.main import app
+
+    cases = {
+        "buffered": ("/bench/buffered", "identity"),
+        "streamed": ("/api/boards", "identity"),
+        "streamed_gzip": ("/api/boards", "gzip"),
+        "streamed_brotli": ("/api/boards", "br"),
+    }
+    results = {}
+    for name, (url, encoding) in cases.items():
+        await _fetch(app, url, encoding)  # warm up
+        timing = await _fetch(app, url, encoding)
+        peak = await _peak_bytes(lambda: _fetch(app, url, encoding))
+        results[name] = {**timing, "peak_python_bytes": peak}
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=100_000)
+    parser.add_argument("--boards", type=int, default=20)
+    parser.add_argument("--columns-per-board", type=int, default=10)
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    with seeded_app_database(
+        boards=args.boards,
+        columns_per_board=args.columns_per_board,
+        cards=args.cards,
+    ):
+        _add_buffered_route()
+        results = asyncio.run(_drive())
+    report(
+        "memory",
+        {
+            "cards": args.cards,
+            "boards": args.boards,
+            "columns_per_board": args.columns_per_board,
+        },
+        results,
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Benchmark full-text card search against a large seeded database.
+
+Run from ``backend/``::
+
+    uv run python -m benchmarks.search --cards 1000000
+
+The script seeds a throwaway SQLite database (the ``cards_fts`` index is
+filled by its triggers as cards are inserted), then times ``search_cards``
+for rare, common and multi-word queries and reports the median latency, the
+number of matching cards, whether the results were ranked and whether each
+query stays within the budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.models  # noqa: F401
+from app.config import Settings
+from app.database import Base, create_async_db_engine
+from app.search import match_query, search_cards
+from benchmarks.harness import add_output_argument, report
+from benchmarks.seed import WORDS, seed
+
+BUDGET_MS = 50.0
+
+# Seeded words are Zipf-distributed, so the first few are in a large share of
+# all cards and the later ones in only a handful.
+QUERIES = {
+    "rare_word": {"q": WORDS[4000]},
+    "ranked_word": {"q": WORDS[300]},
+    "uncommon_word": {"q": WORDS[200]},
+    "common_word": {"q": WORDS[10]},
+    "most_common_word": {"q": WORDS[0]},
+    "two_words": {"q": f"{WORDS[3]} {WORDS[40]}"},
+    "one_board": {"q": WORDS[0], "board_id": 7},
+    "deep_page": {"q": WORDS[10], "offset": 500},
+}
+
+
+async def _time_queries(
+    url: str, repeat: int, limit: int
+) -> dict[str, tuple[float, bool]]:
+    engine = create_async_db_engine(Settings(database_url=url))
+    results = {}
+    async with AsyncSession(engine) as db:
+        for name, params in QUERIES.items():
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                _, ranked = await search_cards(
+                    db,
+                    params["q"],
+                    board_id=params.get("board_id"),
+                    limit=limit,
+                    offset=params.get("offset", 0),
+                )
+                timings.append((time.perf_counter() - start) * 1000)
+            results[name] = round(statistics.median(timings), 3), ranked
+    await engine.dispose()
+    return results
+
+
+def run(cards: int, boards: int, columns_per_board: int, repeat: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine(url)
+        Base.metadata.create_all(engine)
+        start = time.perf_counter()
+        seed(engine, boards=boards, columns_per_board=columns_per_board, cards=cards)
+        seed_seconds = time.perf_counter() - start
+        with engine.begin() as conn:
+            conn.execute(text("INSERT INTO cards_fts(cards_fts) VALUES ('optimize')"))
+            matches = {
+                name: conn.execute(
+                    text("SELECT count(*) FROM cards_fts WHERE cards_fts MATCH :q"),
+                    {"q": match_query(params["q"])},
+                ).scalar_one()
+                for name, params in QUERIES.items()
+            }
+        engine.dispose()
+
+        timings = asyncio.run(_time_queries(url, repeat, limit=20))
+
+    return {
+        "seed_seconds": round(seed_seconds, 1),
+        "budget_ms": BUDGET_MS,
+        "queries": {
+            name: {
+                "q": QUERIES[name]["q"],
+                "matches": matches[name],
+                "ranked": timings[name][1],
+                "median_ms": timings[name][0],
+                "within_budget": timings[name][0] <= BUDGET_MS,
+            }
+            for name in QUERIES
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=1_000_000)
+    parser.add_argument("--boards", type=int, default=100)
+    parser.add_argument("--columns-per-board", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    add_output_argument(parser)
+    args = parser.parse_args()
+    report(
+        "search",
+        {
+            "cards": args.cards,
+            "boards": args.boards,
+            "columns_per_board": args.columns_per_board,
+            "repeat": args.repeat,
+        },
+        run(args.cards, args.boards, args.columns_per_board, args.repeat),
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Synthetic dataset generation shared by the benchmarks."""
+
+from __future__ import annotations
+
+import itertools
+import random
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import Engine, insert, text
+
+from app.counts import recount_cards
+from app.models.board import Board
+from app.models.card import Card
+from app.models.column import Column
+
+ASSIGNEES = [f"user{i:02d}" for i in range(50)]
+BATCH_SIZE = 50_000
+
+# Pronounceable made-up words; card text samples them with a Zipf-like skew so
+# that, as in real text, a few words are very common and most are rare.
+WORDS = [
+    "".join(parts)
+    for parts in itertools.product(
+        ["ba", "ko", "mi", "ru", "te", "la", "so", "pe", "di", "no"],
+        ["ri", "ma", "tu", "ve", "lo", "ka", "sa", "ne", "po", "zi"],
+        ["", "da", "go", "fe", "mu", "ni", "ro", "sy", "wa", "he"],
+        ["n", "t", "s", "x", "l"],
+    )
+]
+WORD_WEIGHTS = list(itertools.accumulate(1 / rank for rank in range(1, len(WORDS) + 1)))
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(WORDS, cum_weights=WORD_WEIGHTS, k=words))
+
+
+def seed(
+    engine: Engine,
+    *,
+    boards: int,
+    columns_per_board: int,
+    cards: int,
+    seed_value: int = 0,
+) -> None:
+    """Insert ``boards`` boards and spread ``cards`` cards evenly over their columns.
+
+    Rows are inserted with executemany batches so that seeding a million cards
+    takes seconds rather than minutes. Titles and descriptions are drawn from
+    :data:`WORDS`; roughly a third of the cards get a description, an assignee
+    and a due date.
+    """
+    rng = random.Random(seed_value)
+    now = datetime.now(UTC)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Board),
+            [
+                {"id": b + 1, "title": f"Board {b}", "created_at": now}
+                for b in range(boards)
+            ],
+        )
+        column_ids = []
+        column_rows = []
+        for b in range(boards):
+            for position in range(columns_per_board):
+                column_id = len(column_rows) + 1
+                column_ids.append(column_id)
+                column_rows.append(
+                    {
+                        "id": column_id,
+                        "title": f"Column {position}",
+                        "position": position,
+                        "board_id": b + 1,
+                    }
+                )
+        conn.execute(insert(Column), column_rows)
+
+        per_column = max(cards // len(column_ids), 1)
+        batch = []
+        for n in range(cards):
+            column_id = column_ids[min(n // per_column, len(column_ids) - 1)]
+            assigned = rng.random() < 0.3
+            batch.append(
+                {
+                    "title": _text(rng, rng.randint(3, 6)),
+                    "description": _text(rng, rng.randint(10, 25))
+                    if assigned
+                    else None,
+                    "position": n % per_column,
+                    "column_id": column_id,
+                    "assignee": rng.choice(ASSIGNEES) if assigned else None,
+                    "due_date": (
+                        now + timedelta(days=rng.randint(-60, 60)) if assigned else None
+                    ),
+                    "created_at": now,
+                }
+            )
+            if len(batch) == BATCH_SIZE:
+                conn.execute(insert(Card), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(Card), batch)
+        conn.execute(recount_cards())
+        if conn.dialect.name == "postgresql":
+            # Boards and columns were given explicit ids; move their sequences
+            # past them so that rows created afterwards get fresh ones.
+            for table in ("boards", "columns"):
+                conn.execute(
+                    text(
+                        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                        f"(SELECT max(id) FROM {table}))"
+                    )
+                )
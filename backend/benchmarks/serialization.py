@@ -0,0 +1,97 @@
+"""Compare the board endpoint's row-to-JSON path with Pydantic model validation.
+
+Run from ``backend/``::
+
+    uv run python -m benchmarks.serialization --cards 10000
+
+One board with ``--cards`` cards is seeded into a throwaway SQLite database and
+fetched repeatedly through ``httpx.ASGITransport``: once from
+``GET /api/boards/{id}``, which encodes plain rows with orjson, and once from
+an equivalent route that loads ORM objects and returns them through
+``response_model=BoardRead``, as the endpoint used to. The script reports the
+latency percentiles and the CPU time per request for both.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from benchmarks.harness import (
+    add_output_argument,
+    latency_summary,
+    report,
+    seeded_app_database,
+)
+
+
+def _add_validated_route() -> None:
+    from fastapi import Depends
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.database import get_db
+    from app.loaders import load_board
+    from app.main import app
+    from app.schemas.board import BoardRead
+
+    @app.get("/bench/validated/{board_id}", response_model=BoardRead)
+    async def validated_board(board_id: int, db: AsyncSession = Depends(get_db)):
+        return await load_board(db, board_id)
+
+
+async def _measure(client: httpx.AsyncClient, url: str, requests: int) -> dict:
+    (await client.get(url)).raise_for_status()  # warm up
+    latencies = []
+    cpu_start = time.process_time()
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.get(url)
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+    cpu_ms = (time.process_time() - cpu_start) * 1000 / requests
+    return {
+        "bytes": len(response.content),
+        "latency_ms": latency_summary(latencies),
+        "cpu_ms_per_request": round(cpu_ms, 2),
+    }
+
+
+async def _drive(requests: int) -> dict:
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        return {
+            "validated": await _measure(client, "/bench/validated/1", requests),
+            "rows_orjson": await _measure(client, "/api/boards/1", requests),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=10_000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=100)
+    add_output_argument(parser)
+    args = parser.parse_args()
+
+    with seeded_app_database(
+        boards=1, columns_per_board=args.columns, cards=args.cards
+    ):
+        _add_validated_route()
+        results = asyncio.run(_drive(args.requests))
+    report(
+        "serialization",
+        {"cards": args.cards, "columns": args.columns, "requests": args.requests},
+        results,
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
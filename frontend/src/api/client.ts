@@ -4,13 +4,30 @@ const api = axios.create({
   baseURL: 'http://localhost:8000/api',
 });
 
+// Gap the server leaves between card positions (POSITION_STEP in ordering.py)
+export const POSITION_STEP = 1024;
+
 export interface Board {
   id: number;
   title: string;
   created_at: string;
+  version: number;
   columns: Column[];
 }
 
+export interface BoardSummary {
+  id: number;
+  title: string;
+  created_at: string;
+  column_count: number;
+  card_count: number;
+}
+
+export interface BoardSummaryPage {
+  items: BoardSummary[];
+  next_cursor: number | null;
+}
+
 export interface Column {
   id: number;
   title: string;
@@ -32,6 +49,8 @@ export interface Card {
 
 // Boards
 export const getBoards = () => api.get<Board[]>('/boards').then(r => r.data);
+export const getBoardSummaries = (after?: number | null, limit = 50) =>
+  api.get<BoardSummaryPage>('/boards/summary', { params: { after: after ?? undefined, limit } }).then(r => r.data);
 export const getBoard = (id: number) => api.get<Board>(`/boards/${id}`).then(r => r.data);
 export const createBoard = (title: string) => api.post<Board>('/boards', { title }).then(r => r.data);
 export const deleteBoard = (id: number) => api.delete(`/boards/${id}`);
@@ -41,6 +60,8 @@ export const createColumn = (data: { title: string; position: number; board_id:
   api.post<Column>('/columns', data).then(r => r.data);
 export const updateColumn = (id: number, data: { title?: string; position?: number }) =>
   api.patch<Column>(`/columns/${id}`, data).then(r => r.data);
+export const reorderColumns = (boardId: number, columnIds: number[]) =>
+  api.put<Column[]>(`/boards/${boardId}/columns/order`, { column_ids: columnIds }).then(r => r.data);
 export const deleteColumn = (id: number) => api.delete(`/columns/${id}`);
 
 // Cards
@@ -48,4 +69,6 @@ export const createCard = (data: { title: string; description?: string; position
   api.post<Card>('/cards', data).then(r => r.data);
 export const updateCard = (id: number, data: { title?: string; description?: string; position?: number; column_id?: number; due_date?: string | null; assignee?: string | null }) =>
   api.patch<Card>(`/cards/${id}`, data).then(r => r.data);
+export const moveCard = (id: number, data: { column_id: number; after_card_id?: number; before_card_id?: number }) =>
+  api.post<Card>(`/cards/${id}/move`, data).then(r => r.data);
 export const deleteCard = (id: number) => api.delete(`/cards/${id}`);
@@ -1,6 +1,6 @@
 import { useState } from 'react';
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
-import { getBoards, createBoard, deleteBoard } from '../../api/client';
+import { useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { getBoardSummaries, createBoard, deleteBoard } from '../../api/client';
 import { useBoardStore } from '../../store/boardStore';
 
 export function BoardList() {
@@ -9,10 +9,13 @@ export function BoardList() {
   const [newTitle, setNewTitle] = useState('');
   const [adding, setAdding] = useState(false);
 
-  const { data: boards = [] } = useQuery({
+  const { data, hasNextPage, fetchNextPage, isFetchingNextPage } = useInfiniteQuery({
     queryKey: ['boards'],
-    queryFn: getBoards,
+    queryFn: ({ pageParam }) => getBoardSummaries(pageParam),
+    initialPageParam: null as number | null,
+    getNextPageParam: (lastPage) => lastPage.next_cursor,
   });
+  const boards = data?.pages.flatMap(page => page.items) ?? [];
 
   const createMutation = useMutation({
     mutationFn: createBoard,
@@ -67,6 +70,16 @@ export function BoardList() {
             </div>
           </div>
         ))}
+        {hasNextPage && (
+          <button
+            data-testid="load-more-boards"
+            onClick={() => fetchNextPage()}
+            disabled={isFetchingNextPage}
+            className="w-full text-left pl-3 pr-2 py-1.5 rounded-lg text-xs text-gray-400 hover:text-gray-600 dark:text-gray-500 dark:hover:text-gray-300 transition-colors"
+          >
+            {isFetchingNextPage ? 'Loading...' : 'Show more boards'}
+          </button>
+        )}
       </div>
       <div className="px-2 py-2 border-t border-slate-200 dark:border-gray-800">
         {adding ? (
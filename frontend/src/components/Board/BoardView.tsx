@@ -3,7 +3,7 @@ import { DndContext, DragOverlay, PointerSensor, useSensor, useSensors, closestC
 import type { DragEndEvent, DragOverEvent } from '@dnd-kit/core';
 import { arrayMove } from '@dnd-kit/sortable';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
-import { getBoard, createColumn, createCard, updateCard, deleteCard, deleteColumn } from '../../api/client';
+import { getBoard, createColumn, createCard, moveCard, deleteCard, deleteColumn, POSITION_STEP } from '../../api/client';
 import type { Card, Column } from '../../api/client';
 import { ColumnItem } from '../Column/ColumnItem';
 import { AddColumnForm } from '../Column/AddColumnForm';
@@ -43,15 +43,23 @@ export function BoardView({ boardId, isDark, toggleTheme }: Props) {
   const addCardMutation = useMutation({
     mutationFn: ({ columnId, title, assignee, dueDate }: { columnId: number; title: string; assignee?: string; dueDate?: string }) => {
       const col = board?.columns.find(c => c.id === columnId);
-      const position = col?.cards.length ?? 0;
+      // Append one step after the highest position, leaving room for later moves
+      const position = col && col.cards.length > 0 ? Math.max(...col.cards.map(c => c.position)) + POSITION_STEP : 0;
       return createCard({ title, position, column_id: columnId, assignee, due_date: dueDate });
     },
     onSuccess: () => queryClient.invalidateQueries({ queryKey: ['board', boardId] }),
   });
 
-  const updateCardMutation = useMutation({
-    mutationFn: ({ id, data }: { id: number; data: { position?: number; column_id?: number } }) =>
-      updateCard(id, data),
+  const moveCardMutation = useMutation({
+    mutationFn: ({ id, columnId, cards }: { id: number; columnId: number; cards: Card[] }) => {
+      // Send the cards that end up on either side; the server only rewrites the moved card
+      const index = cards.findIndex(c => c.id === id);
+      return moveCard(id, {
+        column_id: columnId,
+        after_card_id: cards[index - 1]?.id,
+        before_card_id: cards[index + 1]?.id,
+      });
+    },
     onSuccess: () => queryClient.invalidateQueries({ queryKey: ['board', boardId] }),
   });
 
@@ -149,8 +157,7 @@ export function BoardView({ boardId, isDark, toggleTheme }: Props) {
 
     if (currentCol.id !== originalColumnId) {
       // Cross-column: dragColumns already has correct position from onDragOver
-      const newPosition = currentCol.cards.findIndex(c => c.id === cardId);
-      updateCardMutation.mutate({ id: cardId, data: { column_id: currentCol.id, position: newPosition } });
+      moveCardMutation.mutate({ id: cardId, columnId: currentCol.id, cards: currentCol.cards });
     } else if (over) {
       // Same column: determine new position from drop target
       const overId = String(over.id);
@@ -161,9 +168,7 @@ export function BoardView({ boardId, isDark, toggleTheme }: Props) {
         const newIndex = cards.findIndex(c => c.id === overCardId);
         if (oldIndex !== newIndex && oldIndex >= 0 && newIndex >= 0) {
           const reordered = arrayMove(cards, oldIndex, newIndex);
-          reordered.forEach((card, idx) => {
-            updateCardMutation.mutate({ id: card.id, data: { position: idx } });
-          });
+          moveCardMutation.mutate({ id: cardId, columnId: originalColumnId, cards: reordered });
         }
       }
     }
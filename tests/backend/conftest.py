@@ -1,23 +1,43 @@
-from collections.abc import Generator
+import os
+from collections.abc import AsyncGenerator, Generator
 
 import pytest
-from app.database import Base, get_db
+from app.cache import board_cache
+from app.config import Settings
+from app.database import Base, create_async_db_engine, create_db_engine, get_db
+from app.instrumentation import metrics
 from app.main import app
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
 
-TEST_DATABASE_URL = "sqlite:///./test_kanban.db"
+# Point KANBAN_TEST_DATABASE_URL at an empty PostgreSQL database to run the
+# suite against PostgreSQL; its tables are created and dropped around each test.
+TEST_DATABASE_URL = os.environ.get(
+    "KANBAN_TEST_DATABASE_URL",
+    "sqlite:///./test_kanban.db",
+)
+TEST_SETTINGS = Settings(database_url=TEST_DATABASE_URL)
 
-engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+engine = create_db_engine(TEST_SETTINGS)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_db_engine(TEST_SETTINGS)
+AsyncTestingSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 
 @pytest.fixture(autouse=True)
 def setup_db() -> Generator[None]:
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
+    board_cache.clear()
+    metrics.clear()
 
 
 @pytest.fixture
@@ -29,16 +49,50 @@ def db() -> Generator[Session]:
         session.close()
 
 
+@pytest.fixture
+def async_session_factory() -> async_sessionmaker[AsyncSession]:
+    return AsyncTestingSessionLocal
+
+
 @pytest.fixture
 def client() -> Generator[TestClient]:
-    def override_get_db() -> Generator[Session]:
-        session = TestingSessionLocal()
-        try:
+    async def override_get_db() -> AsyncGenerator[AsyncSession]:
+        async with AsyncTestingSessionLocal() as session:
             yield session
-        finally:
-            session.close()
 
     app.dependency_overrides[get_db] = override_get_db
     with TestClient(app) as c:
         yield c
+        # Pooled aiosqlite connections belong to this client's event loop.
+        c.portal.call(async_engine.dispose)
     app.dependency_overrides.clear()
+
+
+class QueryCounter:
+    """Counts the SQL statements executed against the test engine."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(
+        self,
+        _conn: object,
+        _cursor: object,
+        statement: str,
+        *_args: object,
+    ) -> None:
+        # Transaction control is left out: only SQLite sends it through the
+        # cursor, so counting it would make the numbers differ by backend.
+        if statement != "BEGIN":
+            self.count += 1
+
+    def reset(self) -> None:
+        self.count = 0
+
+
+@pytest.fixture
+def query_counter() -> Generator[QueryCounter]:
+    counter = QueryCounter()
+    event.listen(async_engine.sync_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(async_engine.sync_engine, "before_cursor_execute", counter)
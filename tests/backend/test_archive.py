@@ -0,0 +1,185 @@
+from datetime import timedelta
+
+from app.archive import archive_done_cards
+from app.database import utc_now
+from app.models import Card
+from sqlalchemy import update
+
+
+def _create_board(client, columns=("To Do", "Done"), cards=2):
+    board = client.post("/api/boards", json={"title": "Board"}).json()
+    column_ids = []
+    for position, title in enumerate(columns):
+        column = client.post(
+            "/api/columns",
+            json={"title": title, "position": position, "board_id": board["id"]},
+        ).json()
+        column_ids.append(column["id"])
+        for i in range(cards):
+            client.post(
+                "/api/cards",
+                json={
+                    "title": f"{title} {i}",
+                    "position": i,
+                    "column_id": column["id"],
+                },
+            )
+    return board["id"], column_ids
+
+
+def _board_card_ids(client, board_id):
+    board = client.get(f"/api/boards/{board_id}").json()
+    return {card["id"] for column in board["columns"] for card in column["cards"]}
+
+
+def _archive_ids(client, board_id, **params):
+    response = client.get(f"/api/boards/{board_id}/archive", params=params)
+    assert response.status_code == 200
+    return [card["id"] for card in response.json()["items"]]
+
+
+def test_archive_card_removes_it_from_the_board(client):
+    board_id, column_ids = _create_board(client)
+    card_id = min(_board_card_ids(client, board_id))
+
+    response = client.post(f"/api/cards/{card_id}/archive")
+    assert response.status_code == 200
+    assert response.json()["id"] == card_id
+    assert response.json()["archived_at"] is not None
+
+    assert card_id not in _board_card_ids(client, board_id)
+    column_cards = client.get(f"/api/cards/{column_ids[0]}").json()
+    assert card_id not in {card["id"] for card in column_cards}
+    hits = client.get("/api/search", params={"q": "To Do 0"}).json()["items"]
+    assert card_id not in {hit["id"] for hit in hits}
+    assert _archive_ids(client, board_id) == [card_id]
+    assert client.post(f"/api/cards/{card_id}/archive").status_code == 404
+
+
+def test_archive_card_shows_up_as_deleted_in_changes(client):
+    board_id, _ = _create_board(client)
+    version = client.get(f"/api/boards/{board_id}").json()["version"]
+    card_id = min(_board_card_ids(client, board_id))
+    client.post(f"/api/cards/{card_id}/archive")
+
+    response = client.get(f"/api/boards/{board_id}/changes", params={"since": version})
+    assert response.json()["deleted_card_ids"] == [card_id]
+
+
+def test_archive_column_keeps_the_column(client):
+    board_id, column_ids = _create_board(client, cards=3)
+
+    response = client.post(f"/api/columns/{column_ids[1]}/archive")
+    assert response.status_code == 200
+    assert response.json() == {"archived": 3}
+
+    board = client.get(f"/api/boards/{board_id}").json()
+    assert [len(column["cards"]) for column in board["columns"]] == [3, 0]
+    assert len(_archive_ids(client, board_id)) == 3
+    assert client.post("/api/columns/999/archive").status_code == 404
+
+
+def test_archive_pages_with_a_cursor(client):
+    board_id, column_ids = _create_board(client, columns=("Done",), cards=5)
+    client.post(f"/api/columns/{column_ids[0]}/archive")
+
+    first = client.get(f"/api/boards/{board_id}/archive", params={"limit": 2}).json()
+    assert len(first["items"]) == 2
+    seen = [card["id"] for card in first["items"]]
+    cursor = first["next_cursor"]
+    while cursor is not None:
+        page = client.get(
+            f"/api/boards/{board_id}/archive",
+            params={"limit": 2, "after": cursor},
+        ).json()
+        seen += [card["id"] for card in page["items"]]
+        cursor = page["next_cursor"]
+    # Archived together, so the id breaks the tie.
+    assert seen == sorted(seen, reverse=True)
+    assert len(seen) == 5
+
+
+def test_archive_rejects_bad_cursor_and_missing_board(client):
+    board_id, _ = _create_board(client)
+    response = client.get(f"/api/boards/{board_id}/archive", params={"after": "x"})
+    assert response.status_code == 422
+    assert client.get("/api/boards/999/archive").status_code == 404
+
+
+def test_restore_card_appends_it_to_its_column(client):
+    board_id, column_ids = _create_board(client)
+    card_id = min(_board_card_ids(client, board_id))
+    client.post(f"/api/cards/{card_id}/archive")
+
+    response = client.post(f"/api/archive/{card_id}/restore")
+    assert response.status_code == 200
+    assert response.json()["id"] == card_id
+    assert response.json()["column_id"] == column_ids[0]
+
+    board = client.get(f"/api/boards/{board_id}").json()
+    assert board["columns"][0]["cards"][-1]["id"] == card_id
+    assert _archive_ids(client, board_id) == []
+    titles = [
+        hit["title"]
+        for hit in client.get("/api/search", params={"q": "To Do 0"}).json()["items"]
+    ]
+    assert "To Do 0" in titles
+    assert client.post(f"/api/archive/{card_id}/restore").status_code == 404
+
+
+def test_new_cards_never_reuse_an_archived_card_id(client):
+    board_id, column_ids = _create_board(client)
+    card_id = max(_board_card_ids(client, board_id))
+    assert client.post(f"/api/cards/{card_id}/archive").status_code == 200
+
+    new_id = client.post(
+        "/api/cards",
+        json={"title": "New", "position": 9, "column_id": column_ids[0]},
+    ).json()["id"]
+    assert new_id > card_id
+    assert client.post(f"/api/cards/{new_id}/archive").status_code == 200
+    assert client.post(f"/api/archive/{card_id}/restore").status_code == 200
+    assert client.post(f"/api/archive/{new_id}/restore").status_code == 200
+    assert {card_id, new_id} <= _board_card_ids(client, board_id)
+
+
+def test_deleting_a_column_deletes_its_archive(client):
+    board_id, column_ids = _create_board(client)
+    client.post(f"/api/columns/{column_ids[0]}/archive")
+    client.delete(f"/api/columns/{column_ids[0]}")
+    assert _archive_ids(client, board_id) == []
+
+
+def test_archive_done_cards_archives_old_cards_in_the_last_column(
+    client,
+    async_session_factory,
+):
+    board_id, _ = _create_board(client)
+    done_ids = {
+        card["id"]
+        for card in client.get(f"/api/boards/{board_id}").json()["columns"][1]["cards"]
+    }
+
+    assert client.portal.call(archive_done_cards, async_session_factory, 7) == 0
+    later = utc_now() + timedelta(days=8)
+    archived = client.portal.call(archive_done_cards, async_session_factory, 7, later)
+
+    assert archived == 2
+    assert set(_archive_ids(client, board_id)) == done_ids
+    assert _board_card_ids(client, board_id).isdisjoint(done_ids)
+    assert len(_board_card_ids(client, board_id)) == 2
+
+
+def test_moving_a_card_resets_its_age(client, db, async_session_factory):
+    board_id, column_ids = _create_board(client, cards=1)
+    db.execute(update(Card).values(moved_at=utc_now() - timedelta(days=30)))
+    db.commit()
+    columns = client.get(f"/api/boards/{board_id}").json()["columns"]
+    moved_id = columns[0]["cards"][0]["id"]
+    client.post(f"/api/cards/{moved_id}/move", json={"column_id": column_ids[1]})
+
+    client.portal.call(archive_done_cards, async_session_factory, 7)
+
+    # Both cards have existed for a month, but only one has been done that long.
+    assert _board_card_ids(client, board_id) == {moved_id}
+    assert _archive_ids(client, board_id) == [columns[1]["cards"][0]["id"]]
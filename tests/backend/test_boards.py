@@ -1,3 +1,35 @@
+import pytest
+from app import changes, compression, loaders, responses
+from app.cache import PayloadLRU
+from app.config import Settings
+from app.models import BoardChange, Card, Column
+from app.schemas.board import BoardRead, BoardWindow
+from sqlalchemy import func, select, update
+
+
+def _seed_board(client, title="Board", columns=1, cards_per_column=1):
+    board = client.post("/api/boards", json={"title": title}).json()
+    for col_pos in range(columns):
+        col = client.post(
+            "/api/columns",
+            json={
+                "title": f"Col {col_pos}",
+                "position": col_pos,
+                "board_id": board["id"],
+            },
+        ).json()
+        for card_pos in range(cards_per_column):
+            client.post(
+                "/api/cards",
+                json={
+                    "title": f"Card {card_pos}",
+                    "position": card_pos,
+                    "column_id": col["id"],
+                },
+            )
+    return board
+
+
 def test_list_boards_empty(client):
     response = client.get("/api/boards")
     assert response.status_code == 200
@@ -51,3 +83,623 @@ def test_delete_board(client):
 def test_delete_board_not_found(client):
     response = client.delete("/api/boards/9999")
     assert response.status_code == 404
+
+
+def test_delete_board_cascades_to_its_rows(client, db):
+    board = _seed_board(client, columns=2, cards_per_column=3)
+    other = _seed_board(client, title="Other")
+
+    assert client.delete(f"/api/boards/{board['id']}").status_code == 204
+
+    assert db.scalars(select(Column.board_id)).all() == [other["id"]]
+    assert db.scalar(select(func.count()).select_from(Card)) == 1
+    assert set(db.scalars(select(BoardChange.board_id))) == {other["id"]}
+    results = client.get("/api/search", params={"q": "Card"}).json()["items"]
+    assert [result["board_id"] for result in results] == [other["id"]]
+
+
+def test_delete_board_query_count_is_constant(client, query_counter):
+    small = _seed_board(client, columns=1, cards_per_column=1)
+    large = _seed_board(client, columns=8, cards_per_column=10)
+
+    query_counter.reset()
+    client.delete(f"/api/boards/{small['id']}")
+    small_queries = query_counter.count
+
+    query_counter.reset()
+    client.delete(f"/api/boards/{large['id']}")
+    large_queries = query_counter.count
+
+    assert small_queries == large_queries == 2
+
+
+def test_get_board_returns_nested_tree(client):
+    board = _seed_board(client, columns=2, cards_per_column=3)
+
+    data = client.get(f"/api/boards/{board['id']}").json()
+    assert len(data["columns"]) == 2
+    assert all(len(col["cards"]) == 3 for col in data["columns"])
+
+
+def test_get_board_query_count_is_constant(client, query_counter):
+    small = _seed_board(client, columns=1, cards_per_column=1)
+    large = _seed_board(client, columns=8, cards_per_column=10)
+
+    query_counter.reset()
+    client.get(f"/api/boards/{small['id']}")
+    small_queries = query_counter.count
+
+    query_counter.reset()
+    client.get(f"/api/boards/{large['id']}")
+    large_queries = query_counter.count
+
+    assert small_queries == large_queries == 4
+
+
+def test_list_boards_query_count_is_constant(client, query_counter):
+    _seed_board(client, columns=1, cards_per_column=1)
+
+    query_counter.reset()
+    client.get("/api/boards")
+    few_boards_queries = query_counter.count
+
+    for i in range(5):
+        _seed_board(client, title=f"Board {i}", columns=3, cards_per_column=4)
+
+    query_counter.reset()
+    response = client.get("/api/boards")
+    assert len(response.json()) == 6
+    assert query_counter.count == few_boards_queries == 3
+
+
+def test_list_board_summaries(client):
+    board = _seed_board(client, columns=2, cards_per_column=3)
+
+    response = client.get("/api/boards/summary")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["next_cursor"] is None
+    assert data["items"] == [
+        {
+            "id": board["id"],
+            "title": board["title"],
+            "created_at": board["created_at"],
+            "column_count": 2,
+            "card_count": 6,
+        },
+    ]
+
+
+def test_list_board_summaries_paginates_by_id(client):
+    ids = [
+        client.post("/api/boards", json={"title": f"B{i}"}).json()["id"]
+        for i in range(5)
+    ]
+
+    first = client.get("/api/boards/summary", params={"limit": 2}).json()
+    assert [b["id"] for b in first["items"]] == ids[:2]
+    assert first["next_cursor"] == ids[1]
+
+    second = client.get(
+        "/api/boards/summary",
+        params={"limit": 2, "after": first["next_cursor"]},
+    ).json()
+    assert [b["id"] for b in second["items"]] == ids[2:4]
+
+    last = client.get(
+        "/api/boards/summary",
+        params={"limit": 2, "after": second["next_cursor"]},
+    ).json()
+    assert [b["id"] for b in last["items"]] == ids[4:]
+    assert last["next_cursor"] is None
+
+
+def test_list_board_summaries_rejects_invalid_limit(client):
+    response = client.get("/api/boards/summary", params={"limit": 0})
+    assert response.status_code == 422
+
+
+def test_get_board_etag_and_not_modified(client, query_counter):
+    board = _seed_board(client, columns=2, cards_per_column=2)
+    url = f"/api/boards/{board['id']}"
+
+    first = client.get(url)
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    query_counter.reset()
+    cached = client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+    assert query_counter.count == 1
+
+    assert (
+        client.get(url, headers={"If-None-Match": '"other", ' + etag}).status_code
+        == 304
+    )
+    assert client.get(url, headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_board_version_changes_on_every_mutation(client):
+    board = _seed_board(client, columns=1, cards_per_column=0)
+    url = f"/api/boards/{board['id']}"
+    column_id = client.get(url).json()["columns"][0]["id"]
+    seen = {client.get(url).headers["ETag"]}
+
+    def assert_changed():
+        response = client.get(url, headers={"If-None-Match": ", ".join(seen)})
+        assert response.status_code == 200
+        seen.add(response.headers["ETag"])
+
+    card = client.post(
+        "/api/cards",
+        json={"title": "Card", "position": 0, "column_id": column_id},
+    ).json()
+    assert_changed()
+    client.patch(f"/api/cards/{card['id']}", json={"title": "Renamed"})
+    assert_changed()
+    client.post(f"/api/cards/{card['id']}/move", json={"column_id": column_id})
+    assert_changed()
+    client.patch(f"/api/columns/{column_id}", json={"title": "Renamed"})
+    assert_changed()
+    client.delete(f"/api/cards/{card['id']}")
+    assert_changed()
+    client.delete(f"/api/columns/{column_id}")
+    assert_changed()
+
+
+def test_board_version_unaffected_by_other_boards(client):
+    board = _seed_board(client, title="Watched", columns=1, cards_per_column=0)
+    other = _seed_board(client, title="Other", columns=1, cards_per_column=0)
+    etag = client.get(f"/api/boards/{board['id']}").headers["ETag"]
+
+    other_column = client.get(f"/api/boards/{other['id']}").json()["columns"][0]
+    client.post(
+        "/api/cards",
+        json={"title": "Card", "position": 0, "column_id": other_column["id"]},
+    )
+
+    response = client.get(f"/api/boards/{board['id']}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_board_changes_since_version(client):
+    board = _seed_board(client, columns=2, cards_per_column=2)
+    url = f"/api/boards/{board['id']}"
+    tree = client.get(url).json()
+    since = tree["version"]
+    kept, removed = tree["columns"][0]["cards"]
+
+    client.patch(f"/api/cards/{kept['id']}", json={"title": "Renamed"})
+    client.delete(f"/api/cards/{removed['id']}")
+    column = client.post(
+        "/api/columns",
+        json={"title": "New", "position": 2, "board_id": board["id"]},
+    ).json()
+
+    response = client.get(f"{url}/changes", params={"since": since})
+    assert response.status_code == 200
+    delta = response.json()
+    assert delta["since"] == since
+    assert delta["version"] == since + 3
+    assert delta["snapshot"] is None
+    assert [c["id"] for c in delta["columns"]] == [column["id"]]
+    assert [c["title"] for c in delta["cards"]] == ["Renamed"]
+    assert delta["deleted_card_ids"] == [removed["id"]]
+    assert delta["deleted_column_ids"] == []
+
+    latest = client.get(f"{url}/changes", params={"since": delta["version"]}).json()
+    assert latest["columns"] == latest["cards"] == latest["deleted_card_ids"] == []
+
+
+def test_board_changes_report_cards_of_deleted_column(client):
+    board = _seed_board(client, columns=2, cards_per_column=2)
+    url = f"/api/boards/{board['id']}"
+    tree = client.get(url).json()
+    column = tree["columns"][0]
+
+    client.delete(f"/api/columns/{column['id']}")
+
+    delta = client.get(f"{url}/changes", params={"since": tree["version"]}).json()
+    assert delta["deleted_column_ids"] == [column["id"]]
+    assert delta["deleted_card_ids"] == sorted(c["id"] for c in column["cards"])
+
+
+def test_board_changes_fall_back_to_snapshot_after_compaction(client, monkeypatch):
+    monkeypatch.setattr(changes, "settings", Settings(change_log_retention=2))
+    board = _seed_board(client, columns=1, cards_per_column=4)
+    url = f"/api/boards/{board['id']}"
+
+    compacted = client.get(f"{url}/changes", params={"since": 1}).json()
+    assert compacted["version"] == 5
+    assert compacted["snapshot"]["id"] == board["id"]
+    assert len(compacted["snapshot"]["columns"][0]["cards"]) == 4
+    assert compacted["cards"] == []
+
+    recent = client.get(f"{url}/changes", params={"since": 2}).json()
+    assert recent["snapshot"] is None
+    assert len(recent["cards"]) == 3
+
+    ahead = client.get(f"{url}/changes", params={"since": 99}).json()
+    assert ahead["snapshot"] is not None
+
+
+def test_board_changes_not_found(client):
+    response = client.get("/api/boards/9999/changes", params={"since": 0})
+    assert response.status_code == 404
+
+
+def test_board_payload_matches_response_model(client):
+    board = _seed_board(client, columns=2, cards_per_column=2)
+    card_id = client.get(f"/api/boards/{board['id']}").json()["columns"][0]["cards"][0][
+        "id"
+    ]
+    client.patch(
+        f"/api/cards/{card_id}",
+        json={"due_date": "2026-03-01T09:30:00.250000", "assignee": "alice"},
+    )
+
+    data = client.get(f"/api/boards/{board['id']}").json()
+    assert data == BoardRead.model_validate(data).model_dump(mode="json")
+    assert [c["title"] for c in data["columns"]] == ["Col 0", "Col 1"]
+    assert data["columns"][0]["cards"][0]["due_date"] == "2026-03-01T09:30:00.250000"
+    assert client.get("/api/boards").json() == [data]
+
+
+def test_board_payload_without_orjson(client, monkeypatch):
+    _seed_board(client, columns=1, cards_per_column=2)
+    url = "/api/boards"
+    expected = client.get(url).content
+
+    monkeypatch.setattr(responses, "orjson", None)
+    assert client.get(url).content == expected
+
+
+def test_get_board_served_from_cache(client, query_counter):
+    board = _seed_board(client, columns=2, cards_per_column=2)
+    url = f"/api/boards/{board['id']}"
+
+    first = client.get(url)
+    query_counter.reset()
+    second = client.get(url)
+    assert second.content == first.content
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["Content-Type"] == "application/json"
+    assert query_counter.count == 1
+
+    stats = client.get("/api/cache/stats").json()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+    assert stats["bytes"] == len(first.content)
+
+
+def test_board_cache_invalidated_by_writes(client):
+    board = _seed_board(client, columns=1, cards_per_column=1)
+    url = f"/api/boards/{board['id']}"
+    column = client.get(url).json()["columns"][0]
+
+    client.patch(f"/api/columns/{column['id']}", json={"title": "Renamed"})
+    assert client.get("/api/cache/stats").json()["entries"] == 0
+    assert client.get(url).json()["columns"][0]["title"] == "Renamed"
+
+    client.delete(url)
+    stats = client.get("/api/cache/stats").json()
+    assert stats["invalidations"] == 2
+    assert stats["entries"] == 0
+    assert client.get(url).status_code == 404
+
+
+def test_board_cache_evicts_least_recently_used():
+    cache = PayloadLRU(max_bytes=10)
+    cache.put(1, 1, b"aaaa")
+    cache.put(2, 1, b"bbbb")
+    assert cache.get(1, 1) == b"aaaa"
+
+    cache.put(3, 1, b"cccc")
+    assert cache.get(2, 1) is None
+    assert cache.get(1, 1) == b"aaaa"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 8
+
+    cache.put(4, 1, b"x" * 11)
+    assert cache.get(4, 1) is None
+
+
+def test_board_cache_matches_versions():
+    cache = PayloadLRU(max_bytes=100)
+    cache.put(1, 2, b"v2")
+    assert cache.get(1, 1) is None
+    assert cache.get(1, 3) is None
+
+    cache.put(1, 1, b"v1")
+    assert cache.get(1, 2) == b"v2"
+    cache.put(1, 3, b"v3")
+    assert cache.get(1, 3) == b"v3"
+    assert cache.stats()["entries"] == 1
+
+
+def test_streamed_boards_match_across_chunk_boundaries(client, monkeypatch):
+    _seed_board(client, title="A", columns=3, cards_per_column=3)
+    empty = _seed_board(client, title="B", columns=0)
+    client.post(
+        "/api/columns",
+        json={"title": "Empty", "position": 0, "board_id": empty["id"]},
+    )
+    _seed_board(client, title="C", columns=2, cards_per_column=1)
+    headers = {"Accept-Encoding": "identity"}
+    expected = client.get("/api/boards", headers=headers).content
+
+    monkeypatch.setattr(loaders, "STREAM_BATCH_ROWS", 2)
+    monkeypatch.setattr(loaders, "STREAM_CHUNK_BYTES", 1)
+    streamed = client.get("/api/boards", headers=headers)
+    assert streamed.content == expected
+    data = streamed.json()
+    assert [len(b["columns"]) for b in data] == [3, 1, 2]
+    assert [len(c["cards"]) for c in data[0]["columns"]] == [3, 3, 3]
+    assert data[1]["columns"][0]["cards"] == []
+    assert data == [BoardRead.model_validate(b).model_dump(mode="json") for b in data]
+
+    board = data[0]
+    single = client.get(f"/api/boards/{board['id']}", headers=headers).json()
+    assert single == board
+
+
+def test_board_stream_reads_one_snapshot(client, db, monkeypatch):
+    board = _seed_board(client, columns=2, cards_per_column=3)
+    encode_boards = loaders._encode_boards
+
+    def reorder_then_encode(*args, **kwargs):
+        # Commit a column reorder after the columns are read, before the cards.
+        db.execute(update(Column).values(position=1 - Column.position))
+        db.commit()
+        return encode_boards(*args, **kwargs)
+
+    monkeypatch.setattr(loaders, "_encode_boards", reorder_then_encode)
+    for url in (f"/api/boards/{board['id']}", "/api/boards"):
+        payload = client.get(url).json()
+        (streamed,) = payload if isinstance(payload, list) else [payload]
+        columns = [(c["title"], len(c["cards"])) for c in streamed["columns"]]
+        assert sorted(columns) == [("Col 0", 3), ("Col 1", 3)]
+
+
+def test_board_responses_compressed_when_accepted(client):
+    board = _seed_board(client, columns=2, cards_per_column=5)
+    url = f"/api/boards/{board['id']}"
+    plain = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in plain.headers
+
+    for endpoint in (url, "/api/boards"):
+        gzipped = client.get(endpoint, headers={"Accept-Encoding": "gzip"})
+        assert gzipped.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in gzipped.headers["Vary"]
+        assert gzipped.json() == client.get(endpoint).json()
+
+        refused = client.get(
+            endpoint,
+            headers={"Accept-Encoding": "gzip;q=0, identity"},
+        )
+        assert "Content-Encoding" not in refused.headers
+
+
+def test_board_responses_prefer_brotli(client):
+    pytest.importorskip("brotli")
+    board = _seed_board(client, columns=2, cards_per_column=5)
+    url = f"/api/boards/{board['id']}"
+    response = client.get(url, headers={"Accept-Encoding": "gzip, br"})
+    assert response.headers["Content-Encoding"] == "br"
+    assert response.json()["id"] == board["id"]
+
+
+def test_accepted_encodings():
+    assert compression.accepted_encodings("gzip, deflate, br") == {
+        "gzip",
+        "deflate",
+        "br",
+    }
+    assert compression.accepted_encodings("br;q=0, GZIP;q=0.5") == {"gzip"}
+    assert compression.accepted_encodings("") == set()
+
+
+def _assert_stats_match_board(client, board_id):
+    board = client.get(f"/api/boards/{board_id}").json()
+    stats = client.get(f"/api/boards/{board_id}/stats").json()
+    assert stats["version"] == board["version"]
+    assert [(c["id"], c["card_count"]) for c in stats["columns"]] == [
+        (c["id"], len(c["cards"])) for c in board["columns"]
+    ]
+    assert stats["card_count"] == sum(len(c["cards"]) for c in board["columns"])
+    return stats
+
+
+def test_board_stats_follow_card_writes(client):
+    board = _seed_board(client, columns=2, cards_per_column=3)
+    columns = client.get(f"/api/boards/{board['id']}").json()["columns"]
+    first, second = ([card["id"] for card in c["cards"]] for c in columns)
+    stats = _assert_stats_match_board(client, board["id"])
+    assert stats["card_count"] == 6
+    assert stats["overdue_count"] == 0
+
+    client.post(
+        "/api/cards",
+        json={
+            "title": "Late",
+            "position": 9,
+            "column_id": columns[1]["id"],
+            "due_date": "2020-01-01T00:00:00",
+        },
+    )
+    client.post(f"/api/cards/{first[0]}/move", json={"column_id": columns[1]["id"]})
+    client.patch(f"/api/cards/{first[1]}", json={"column_id": columns[1]["id"]})
+    client.delete(f"/api/cards/{second[0]}")
+    stats = _assert_stats_match_board(client, board["id"])
+    assert [c["card_count"] for c in stats["columns"]] == [1, 5]
+    assert [c["overdue_count"] for c in stats["columns"]] == [0, 1]
+    assert stats["overdue_count"] == 1
+
+    client.post(
+        "/api/cards/bulk",
+        json={
+            "operations": [
+                {
+                    "op": "create",
+                    "title": "New",
+                    "position": 0,
+                    "column_id": columns[0]["id"],
+                },
+                {"op": "update", "id": second[1], "column_id": columns[0]["id"]},
+                {"op": "update", "id": second[2], "column_id": columns[0]["id"]},
+                {"op": "delete", "id": second[2]},
+            ],
+        },
+    )
+    stats = _assert_stats_match_board(client, board["id"])
+    assert [c["card_count"] for c in stats["columns"]] == [3, 3]
+
+    client.post(f"/api/columns/{columns[1]['id']}/archive")
+    stats = _assert_stats_match_board(client, board["id"])
+    assert [c["card_count"] for c in stats["columns"]] == [3, 0]
+    assert stats["overdue_count"] == 0
+
+    client.post(f"/api/archive/{first[0]}/restore")
+    stats = _assert_stats_match_board(client, board["id"])
+    assert [c["card_count"] for c in stats["columns"]] == [3, 1]
+
+
+def test_board_stats_do_not_read_cards(client, query_counter):
+    small = _seed_board(client, columns=2, cards_per_column=1)
+    large = _seed_board(client, columns=2, cards_per_column=20)
+
+    query_counter.reset()
+    client.get(f"/api/boards/{small['id']}/stats")
+    small_queries = query_counter.count
+    query_counter.reset()
+    client.get(f"/api/boards/{large['id']}/stats")
+
+    assert query_counter.count == small_queries == 2
+
+
+def test_board_stats_not_found(client):
+    assert client.get("/api/boards/999/stats").status_code == 404
+
+
+def test_board_window_limits_cards_per_column(client):
+    board = _seed_board(client, columns=2, cards_per_column=5)
+    full = client.get(f"/api/boards/{board['id']}").json()
+    long_column = full["columns"][0]
+    # Equal positions are ordered by id, across the window boundary too.
+    client.post(
+        "/api/cards",
+        json={"title": "Tie", "position": 1, "column_id": long_column["id"]},
+    )
+    full = client.get(f"/api/boards/{board['id']}").json()
+
+    response = client.get(f"/api/boards/{board['id']}", params={"cards_per_column": 2})
+    assert response.status_code == 200
+    assert response.headers["etag"] == f'W/"board-{board["id"]}-v{full["version"]}"'
+    data = response.json()
+    assert data == BoardWindow.model_validate(data).model_dump(mode="json")
+    for window, column in zip(data["columns"], full["columns"], strict=True):
+        assert window["cards"] == column["cards"][:2]
+        assert window["card_count"] == len(column["cards"])
+
+    cards = data["columns"][0]["cards"]
+    cursor = data["columns"][0]["next_cursor"]
+    while cursor is not None:
+        page = client.get(
+            f"/api/columns/{long_column['id']}/cards",
+            params={"after": cursor, "limit": 2},
+        ).json()
+        cards += page["items"]
+        cursor = page["next_cursor"]
+    assert cards == full["columns"][0]["cards"]
+
+
+def test_board_window_query_count_is_constant(client, query_counter):
+    small = _seed_board(client, columns=1, cards_per_column=1)
+    large = _seed_board(client, columns=5, cards_per_column=10)
+
+    query_counter.reset()
+    client.get(f"/api/boards/{small['id']}", params={"cards_per_column": 3})
+    small_queries = query_counter.count
+    query_counter.reset()
+    client.get(f"/api/boards/{large['id']}", params={"cards_per_column": 3})
+
+    assert query_counter.count == small_queries
+
+
+def test_board_window_validates_its_limit(client):
+    board = _seed_board(client)
+    url = f"/api/boards/{board['id']}"
+    assert client.get(url, params={"cards_per_column": 0}).status_code == 422
+    assert (
+        client.get("/api/boards/999", params={"cards_per_column": 5}).status_code == 404
+    )
+
+
+def test_board_sparse_fieldsets(client):
+    board = _seed_board(client, columns=2, cards_per_column=3)
+    full = client.get(f"/api/boards/{board['id']}").json()
+    client.get(f"/api/boards/{board['id']}")  # cached
+
+    response = client.get(
+        f"/api/boards/{board['id']}",
+        params={
+            "fields[board]": "title",
+            "fields[column]": "title,position",
+            "fields[card]": "id,title,position,column_id",
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data == {
+        "title": full["title"],
+        "columns": [
+            {
+                "title": column["title"],
+                "position": column["position"],
+                "cards": [
+                    {key: card[key] for key in ("title", "position", "column_id", "id")}
+                    for card in column["cards"]
+                ],
+            }
+            for column in full["columns"]
+        ],
+    }
+    # Sparse payloads neither come from nor go into the cache.
+    assert client.get(f"/api/boards/{board['id']}").json() == full
+
+
+def test_board_sparse_fieldsets_in_windows(client):
+    board = _seed_board(client, columns=1, cards_per_column=3)
+    data = client.get(
+        f"/api/boards/{board['id']}",
+        params={"cards_per_column": 2, "fields[card]": "title"},
+    ).json()
+    column = data["columns"][0]
+    assert column["cards"] == [{"title": "Card 0"}, {"title": "Card 1"}]
+    assert column["card_count"] == 3
+    rest = client.get(
+        f"/api/columns/{column['id']}/cards",
+        params={"after": column["next_cursor"]},
+    ).json()
+    assert [card["title"] for card in rest["items"]] == ["Card 2"]
+
+
+def test_board_sparse_fieldsets_skip_unselected_columns():
+    fieldsets = loaders.Fieldsets(card=frozenset({"title"}))
+    _, _, cards, hidden = loaders._board_payload_queries(1, fieldsets)
+    assert [column.key for column in cards.selected_columns] == ["title", "column_id"]
+    assert hidden.card == {"column_id"}
+    assert "description" not in str(cards)
+
+
+def test_board_sparse_fieldsets_reject_unknown_fields(client):
+    board = _seed_board(client)
+    response = client.get(
+        f"/api/boards/{board['id']}",
+        params={"fields[card]": "title,body"},
+    )
+    assert response.status_code == 422
+    assert "body" in response.json()["detail"]
@@ -0,0 +1,125 @@
+import asyncio
+
+import fakeredis
+from app.cache import (
+    COLUMNS,
+    MemoryBoardCache,
+    RedisBoardCache,
+    create_board_cache,
+)
+from app.config import Settings
+
+
+def _redis_cache(server, **kwargs):
+    client = fakeredis.FakeAsyncRedis(server=server)
+    return RedisBoardCache(client, local_max_bytes=1024, ttl_seconds=60, **kwargs)
+
+
+async def _wait_for(predicate):
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not met")
+
+
+def test_create_board_cache_defaults_to_memory():
+    assert isinstance(create_board_cache(Settings()), MemoryBoardCache)
+
+
+def test_create_board_cache_from_redis_url():
+    cache = create_board_cache(Settings(cache_url="redis://localhost:6379/0"))
+    assert isinstance(cache, RedisBoardCache)
+
+
+def test_redis_cache_shared_between_workers():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        first, second = _redis_cache(server), _redis_cache(server)
+
+        await first.put(1, 3, b'{"id":1}')
+        await first.put(1, 3, b"[]", COLUMNS)
+        assert await second.get(1, 3) == b'{"id":1}'
+        assert await second.get(1, 3, COLUMNS) == b"[]"
+        assert await second.get(1, 4) is None
+        # Served from the local copy the second time round.
+        assert await second.get(1, 3) == b'{"id":1}'
+        return second.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["shared_hits"] == 2
+    assert stats["shared_misses"] == 1
+    assert stats["hits"] == 1
+
+
+def test_redis_cache_invalidation_reaches_other_workers():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        first, second = _redis_cache(server), _redis_cache(server)
+        await first.start()
+        await second.start()
+        try:
+            await first.put(1, 3, b"board")
+            await first.put(2, 3, b"other")
+            assert await second.get(1, 3) == b"board"
+            assert second.stats()["entries"] == 1
+
+            await first.invalidate(1)
+            await _wait_for(lambda: second.stats()["entries"] == 0)
+            assert await second.get(1, 3) is None
+            assert await second.get(2, 3) == b"other"
+            return second.stats()
+        finally:
+            await first.close()
+            await second.close()
+
+    stats = asyncio.run(scenario())
+    assert stats["invalidations"] == 1
+
+
+def test_redis_cache_entries_expire():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        cache = _redis_cache(server)
+        await cache.put(1, 1, b"board")
+        return await cache.client.ttl("kanban:board:1")
+
+    assert 0 < asyncio.run(scenario()) <= 60
+
+
+def test_redis_cache_fails_soft_while_redis_is_down():
+    async def scenario():
+        server = fakeredis.FakeServer()
+        cache = _redis_cache(server)
+        await cache.put(1, 3, b"board")
+        server.connected = False
+
+        assert await cache.get(1, 3) == b"board"  # local copy
+        assert await cache.get(2, 3) is None
+        await cache.put(2, 3, b"other")
+        await cache.invalidate(1)
+        assert await cache.get(1, 3) is None
+        return cache.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["shared_errors"] == 4
+    assert stats["shared_misses"] == 2
+
+
+def test_publish_change_announces_writes_while_redis_is_down(monkeypatch):
+    from app import changes
+    from app.events import hub
+
+    async def scenario():
+        server = fakeredis.FakeServer()
+        server.connected = False
+        monkeypatch.setattr(changes, "board_cache", _redis_cache(server))
+        subscription = hub.subscribe(1)
+        try:
+            await changes.publish_change({1: 5}, "card.created", {"id": 7})
+            return subscription.queue.get_nowait()
+        finally:
+            hub.unsubscribe(subscription)
+
+    event = asyncio.run(scenario())
+    assert (event.board_id, event.version, event.type) == (1, 5, "card.created")
@@ -145,6 +145,28 @@ def test_delete_card(client):
     assert list_resp.json() == []
 
 
+def test_create_card_column_not_found(client):
+    response = client.post(
+        "/api/cards",
+        json={"title": "Orphan", "position": 0, "column_id": 9999},
+    )
+    assert response.status_code == 404
+
+
+def test_update_card_column_not_found(client):
+    board = _create_board(client)
+    col = _create_column(client, board["id"])
+    card_resp = client.post(
+        "/api/cards",
+        json={"title": "Card", "position": 0, "column_id": col["id"]},
+    )
+    card_id = card_resp.json()["id"]
+
+    response = client.patch(f"/api/cards/{card_id}", json={"column_id": 9999})
+    assert response.status_code == 404
+    assert client.get(f"/api/cards/{col['id']}").json()[0]["id"] == card_id
+
+
 def test_delete_card_not_found(client):
     response = client.delete("/api/cards/9999")
     assert response.status_code == 404
@@ -239,3 +261,402 @@ def test_update_card_clear_due_date(client):
     response = client.patch(f"/api/cards/{card_id}", json={"due_date": None})
     assert response.status_code == 200
     assert response.json()["due_date"] is None
+
+
+def _create_card(client, column_id, title="Card", position=0):
+    resp = client.post(
+        "/api/cards",
+        json={"title": title, "position": position, "column_id": column_id},
+    )
+    assert resp.status_code == 201
+    return resp.json()
+
+
+def _card_order(client, column_id):
+    cards = client.get(f"/api/cards/{column_id}").json()
+    return [c["id"] for c in sorted(cards, key=lambda c: (c["position"], c["id"]))]
+
+
+def test_move_card_to_end_of_other_column(client):
+    board = _create_board(client)
+    col1 = _create_column(client, board["id"], title="Col 1", position=0)
+    col2 = _create_column(client, board["id"], title="Col 2", position=1)
+    card = _create_card(client, col1["id"])
+    existing = _create_card(client, col2["id"])
+
+    response = client.post(
+        f"/api/cards/{card['id']}/move",
+        json={"column_id": col2["id"]},
+    )
+    assert response.status_code == 200
+    assert response.json()["column_id"] == col2["id"]
+    assert _card_order(client, col2["id"]) == [existing["id"], card["id"]]
+    assert _card_order(client, col1["id"]) == []
+
+
+def test_move_card_to_empty_column(client):
+    board = _create_board(client)
+    col1 = _create_column(client, board["id"], title="Col 1", position=0)
+    col2 = _create_column(client, board["id"], title="Col 2", position=1)
+    card = _create_card(client, col1["id"])
+
+    response = client.post(
+        f"/api/cards/{card['id']}/move",
+        json={"column_id": col2["id"]},
+    )
+    assert response.status_code == 200
+    assert _card_order(client, col2["id"]) == [card["id"]]
+
+
+def test_move_card_between_neighbours_touches_one_row(client):
+    board = _create_board(client)
+    col = _create_column(client, board["id"])
+    a = _create_card(client, col["id"], "A", position=0)
+    b = _create_card(client, col["id"], "B", position=1024)
+    c = _create_card(client, col["id"], "C", position=2048)
+
+    response = client.post(
+        f"/api/cards/{c['id']}/move",
+        json={
+            "column_id": col["id"],
+            "after_card_id": a["id"],
+            "before_card_id": b["id"],
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["position"] == 512
+    assert _card_order(client, col["id"]) == [a["id"], c["id"], b["id"]]
+    positions = {
+        card["id"]: card["position"]
+        for card in client.get(f"/api/cards/{col['id']}").json()
+    }
+    assert positions[a["id"]] == 0
+    assert positions[b["id"]] == 1024
+
+
+def test_move_card_with_single_neighbour(client):
+    board = _create_board(client)
+    col = _create_column(client, board["id"])
+    a = _create_card(client, col["id"], "A", position=0)
+    b = _create_card(client, col["id"], "B", position=1024)
+    c = _create_card(client, col["id"], "C", position=2048)
+
+    response = client.post(
+        f"/api/cards/{c['id']}/move",
+        json={"column_id": col["id"], "before_card_id": a["id"]},
+    )
+    assert response.status_code == 200
+    assert _card_order(client, col["id"]) == [c["id"], a["id"], b["id"]]
+
+    response = client.post(
+        f"/api/cards/{c['id']}/move",
+        json={"column_id": col["id"], "after_card_id": a["id"]},
+    )
+    assert response.status_code == 200
+    assert _card_order(client, col["id"]) == [a["id"], c["id"], b["id"]]
+
+
+def test_move_card_rebalances_dense_positions(client):
+    board = _create_board(client)
+    col = _create_column(client, board["id"])
+    cards = [_create_card(client, col["id"], f"Card {i}", position=i) for i in range(4)]
+
+    response = client.post(
+        f"/api/cards/{cards[3]['id']}/move",
+        json={
+            "column_id": col["id"],
+            "after_card_id": cards[0]["id"],
+            "before_card_id": cards[1]["id"],
+        },
+    )
+    assert response.status_code == 200
+    assert _card_order(client, col["id"]) == [
+        cards[0]["id"],
+        cards[3]["id"],
+        cards[1]["id"],
+        cards[2]["id"],
+    ]
+
+
+def test_move_card_between_neighbours_sharing_a_position(client):
+    board = _create_board(client)
+    col = _create_column(client, board["id"])
+    a, b, x = (_create_card(client, col["id"], title) for title in "ABX")
+
+    response = client.post(
+        f"/api/cards/{x['id']}/move",
+        json={
+            "column_id": col["id"],
+            "after_card_id": a["id"],
+            "before_card_id": b["id"],
+        },
+    )
+    assert response.status_code == 200
+    assert _card_order(client, col["id"]) == [a["id"], x["id"], b["id"]]
+
+
+def test_move_card_next_to_one_neighbour_sharing_its_position(client):
+    board = _create_board(client)
+    for neighbour in ("after_card_id", "before_card_id"):
+        col = _create_column(client, board["id"])
+        a, b, x = (_create_card(client, col["id"], title) for title in "ABX")
+        anchor = a if neighbour == "after_card_id" else b
+
+        response = client.post(
+            f"/api/cards/{x['id']}/move",
+            json={"column_id": col["id"], neighbour: anchor["id"]},
+        )
+        assert response.status_code == 200
+        assert _card_order(client, col["id"]) == [a["id"], x["id"], b["id"]]
+
+
+def test_move_card_rejects_neighbours_sharing_a_position_out_of_order(client):
+    board = _create_board(client)
+    col = _create_column(client, board["id"])
+    a, b, x = (_create_card(client, col["id"], title) for title in "ABX")
+
+    response = client.post(
+        f"/api/cards/{x['id']}/move",
+        json={
+            "column_id": col["id"],
+            "after_card_id": b["id"],
+            "before_card_id": a["id"],
+        },
+    )
+    assert response.status_code == 409
+
+
+def test_move_card_rejects_neighbour_from_other_column(client):
+    board = _create_board(client)
+    col1 = _create_column(client, board["id"], title="Col 1", position=0)
+    col2 = _create_column(client, board["id"], title="Col 2", position=1)
+    card = _create_card(client, col1["id"])
+    other = _create_card(client, col1["id"], position=1)
+
+    response = client.post(
+        f"/api/cards/{card['id']}/move",
+        json={"column_id": col2["id"], "after_card_id": other["id"]},
+    )
+    assert response.status_code == 409
+
+
+def test_move_card_not_found(client):
+    board = _create_board(client)
+    col = _create_column(client, board["id"])
+
+    response = client.post("/api/cards/9999/move", json={"column_id": col["id"]})
+    assert response.status_code == 404
+
+    card = _create_card(client, col["id"])
+    response = client.post(f"/api/cards/{card['id']}/move", json={"column_id": 9999})
+    assert response.status_code == 404
+
+
+def test_bulk_cards_create_update_delete(client):
+    board = _create_board(client)
+    col1 = _create_column(client, board["id"], title="Col 1", position=0)
+    col2 = _create_column(client, board["id"], title="Col 2", position=1)
+    keep = _create_card(client, col1["id"], "Keep", position=0)
+    drop = _create_card(client, col1["id"], "Drop", position=1)
+
+    response = client.post(
+        "/api/cards/bulk",
+        json={
+            "operations": [
+                {
+                    "op": "create",
+                    "title": "New 1",
+                    "position": 2,
+                    "column_id": col1["id"],
+                },
+                {
+                    "op": "update",
+                    "id": keep["id"],
+                    "column_id": col2["id"],
+                    "assignee": "Alice",
+                },
+                {"op": "delete", "id": drop["id"]},
+                {
+                    "op": "create",
+                    "title": "New 2",
+                    "position": 0,
+                    "column_id": col2["id"],
+                },
+            ],
+        },
+    )
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["op"] for r in results] == ["create", "update", "delete", "create"]
+    assert results[1]["id"] == keep["id"]
+    assert results[2]["id"] == drop["id"]
+
+    col1_cards = client.get(f"/api/cards/{col1['id']}").json()
+    assert [c["id"] for c in col1_cards] == [results[0]["id"]]
+    assert col1_cards[0]["title"] == "New 1"
+
+    col2_cards = {c["id"]: c for c in client.get(f"/api/cards/{col2['id']}").json()}
+    assert set(col2_cards) == {keep["id"], results[3]["id"]}
+    assert col2_cards[keep["id"]]["assignee"] == "Alice"
+    assert col2_cards[keep["id"]]["title"] == "Keep"
+
+
+def test_bulk_cards_is_all_or_nothing(client):
+    board = _create_board(client)
+    col = _create_column(client, board["id"])
+
+    response = client.post(
+        "/api/cards/bulk",
+        json={
+            "operations": [
+                {"op": "create", "title": "New", "position": 0, "column_id": col["id"]},
+                {"op": "delete", "id": 9999},
+            ],
+        },
+    )
+    assert response.status_code == 404
+    assert client.get(f"/api/cards/{col['id']}").json() == []
+
+
+def test_bulk_cards_rejects_unknown_column(client):
+    response = client.post(
+        "/api/cards/bulk",
+        json={
+            "operations": [
+                {"op": "create", "title": "New", "position": 0, "column_id": 9999},
+            ],
+        },
+    )
+    assert response.status_code == 404
+
+
+def test_bulk_cards_rejects_invalid_operation(client):
+    response = client.post(
+        "/api/cards/bulk",
+        json={"operations": [{"op": "archive", "id": 1}]},
+    )
+    assert response.status_code == 422
+
+    response = client.post("/api/cards/bulk", json={"operations": []})
+    assert response.status_code == 422
+
+
+def test_bulk_cards_statement_count_is_constant(client, query_counter):
+    board = _create_board(client)
+    col = _create_column(client, board["id"])
+
+    def run(n):
+        query_counter.reset()
+        response = client.post(
+            "/api/cards/bulk",
+            json={
+                "operations": [
+                    {
+                        "op": "create",
+                        "title": f"Card {i}",
+                        "position": i,
+                        "column_id": col["id"],
+                    }
+                    for i in range(n)
+                ],
+            },
+        )
+        assert response.status_code == 200
+        return query_counter.count
+
+    assert run(2) == run(200)
+
+
+def _seed_assigned_cards(client):
+    first = _create_column(client, _create_board(client, "First")["id"])
+    second = _create_column(client, _create_board(client, "Second")["id"])
+    specs = [
+        (first, "Overdue A", "alice", "2026-01-03T00:00:00"),
+        (second, "Overdue B", "alice", "2026-01-01T00:00:00"),
+        (first, "Overdue C", "alice", "2026-01-02T00:00:00"),
+        (first, "Later", "alice", "2026-06-01T00:00:00"),
+        (first, "Undated", "alice", None),
+        (first, "Bob's", "bob", "2026-01-01T00:00:00"),
+    ]
+    for column, title, assignee, due_date in specs:
+        client.post(
+            "/api/cards",
+            json={
+                "title": title,
+                "position": 0,
+                "column_id": column["id"],
+                "assignee": assignee,
+                "due_date": due_date,
+            },
+        )
+    return first, second
+
+
+def test_query_cards_by_assignee_and_due_date(client):
+    _seed_assigned_cards(client)
+
+    response = client.get(
+        "/api/cards",
+        params={
+            "assignee": "alice",
+            "due_before": "2026-02-01T00:00:00Z",
+            "order": "due_date",
+        },
+    )
+    assert response.status_code == 200
+    page = response.json()
+    titles = [c["title"] for c in page["items"]]
+    assert titles == ["Overdue B", "Overdue C", "Overdue A"]
+    assert page["next_cursor"] is None
+
+
+def test_query_cards_by_board(client):
+    first, _ = _seed_assigned_cards(client)
+
+    page = client.get(
+        "/api/cards",
+        params={"board_id": first["board_id"], "assignee": "alice"},
+    ).json()
+    assert [c["title"] for c in page["items"]] == [
+        "Overdue A",
+        "Overdue C",
+        "Later",
+        "Undated",
+    ]
+
+
+def test_query_cards_paginates_with_cursor(client):
+    _seed_assigned_cards(client)
+
+    for order, expected in [
+        ("due_date", ["Overdue B", "Bob's", "Overdue C", "Overdue A", "Later"]),
+        ("id", ["Overdue A", "Overdue B", "Overdue C", "Later", "Undated", "Bob's"]),
+    ]:
+        titles, after = [], None
+        while True:
+            params = {"order": order, "limit": 2}
+            if after is not None:
+                params["after"] = after
+            page = client.get("/api/cards", params=params).json()
+            titles += [c["title"] for c in page["items"]]
+            after = page["next_cursor"]
+            if after is None:
+                break
+        assert titles == expected
+
+
+def test_query_cards_rejects_invalid_cursor(client):
+    response = client.get("/api/cards", params={"order": "due_date", "after": "bad"})
+    assert response.status_code == 422
+    assert response.json() == {"detail": "Invalid cursor"}
+
+    board = _create_board(client)
+    col = _create_column(client, board["id"])
+    for i in range(2):
+        _create_card(client, col["id"], f"Card {i}", position=i)
+    id_cursor = client.get("/api/cards", params={"limit": 1}).json()["next_cursor"]
+    response = client.get(
+        "/api/cards",
+        params={"order": "due_date", "after": id_cursor},
+    )
+    assert response.status_code == 422
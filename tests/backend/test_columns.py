@@ -91,6 +91,155 @@ def test_delete_column(client):
     assert list_resp.json() == []
 
 
+def test_delete_column_cascades_to_its_cards(client, query_counter):
+    board = _create_board(client)
+    col_ids = [
+        client.post(
+            "/api/columns",
+            json={"title": f"Col {i}", "position": i, "board_id": board["id"]},
+        ).json()["id"]
+        for i in range(2)
+    ]
+    for col_id in col_ids:
+        for pos in range(5):
+            client.post(
+                "/api/cards",
+                json={"title": f"Card {pos}", "position": pos, "column_id": col_id},
+            )
+
+    version = client.get(f"/api/boards/{board['id']}").json()["version"]
+
+    query_counter.reset()
+    assert client.delete(f"/api/columns/{col_ids[0]}").status_code == 204
+    # Look up the column and its card ids, bump the version, log, delete.
+    assert query_counter.count == 5
+
+    assert client.get(f"/api/cards/{col_ids[0]}").json() == []
+    assert len(client.get(f"/api/cards/{col_ids[1]}").json()) == 5
+    changes = client.get(
+        f"/api/boards/{board['id']}/changes",
+        params={"since": version},
+    ).json()
+    assert changes["deleted_column_ids"] == [col_ids[0]]
+    assert len(changes["deleted_card_ids"]) == 5
+
+
+def test_create_column_board_not_found(client):
+    response = client.post(
+        "/api/columns",
+        json={"title": "Orphan", "position": 0, "board_id": 9999},
+    )
+    assert response.status_code == 404
+
+
 def test_delete_column_not_found(client):
     response = client.delete("/api/columns/9999")
     assert response.status_code == 404
+
+
+def test_reorder_columns(client):
+    board = _create_board(client)
+    ids = [
+        client.post(
+            "/api/columns",
+            json={"title": f"Col {i}", "position": i, "board_id": board["id"]},
+        ).json()["id"]
+        for i in range(4)
+    ]
+    new_order = [ids[2], ids[0], ids[3], ids[1]]
+
+    response = client.put(
+        f"/api/boards/{board['id']}/columns/order",
+        json={"column_ids": new_order},
+    )
+    assert response.status_code == 200
+    assert [col["id"] for col in response.json()] == new_order
+    assert [col["position"] for col in response.json()] == [0, 1, 2, 3]
+
+    listed = client.get(f"/api/columns/{board['id']}").json()
+    assert [col["id"] for col in listed] == new_order
+
+
+def test_reorder_columns_rejects_stale_order(client):
+    board = _create_board(client)
+    ids = [
+        client.post(
+            "/api/columns",
+            json={"title": f"Col {i}", "position": i, "board_id": board["id"]},
+        ).json()["id"]
+        for i in range(3)
+    ]
+    url = f"/api/boards/{board['id']}/columns/order"
+
+    assert client.put(url, json={"column_ids": ids[:2]}).status_code == 409
+    assert client.put(url, json={"column_ids": [*ids, 9999]}).status_code == 409
+    assert (
+        client.put(url, json={"column_ids": [ids[0], ids[0], ids[1]]}).status_code
+        == 409
+    )
+
+    listed = client.get(f"/api/columns/{board['id']}").json()
+    assert [col["position"] for col in listed] == [0, 1, 2]
+
+
+def test_reorder_columns_board_not_found(client):
+    response = client.put("/api/boards/9999/columns/order", json={"column_ids": []})
+    assert response.status_code == 404
+
+
+def test_list_columns_cached_until_column_changes(client, query_counter):
+    board = _create_board(client)
+    url = f"/api/columns/{board['id']}"
+    column = client.post(
+        "/api/columns",
+        json={"title": "To Do", "position": 0, "board_id": board["id"]},
+    ).json()
+
+    first = client.get(url)
+    query_counter.reset()
+    assert client.get(url).content == first.content
+    assert query_counter.count == 1
+
+    client.patch(f"/api/columns/{column['id']}", json={"title": "Doing"})
+    assert client.get(url).json()[0]["title"] == "Doing"
+
+
+def test_list_column_cards_pages_by_position(client):
+    board = _create_board(client)
+    column = client.post(
+        "/api/columns",
+        json={"title": "To Do", "position": 0, "board_id": board["id"]},
+    ).json()
+    for position in (30, 10, 20, 10, 40):
+        client.post(
+            "/api/cards",
+            json={
+                "title": f"Card {position}",
+                "position": position,
+                "column_id": column["id"],
+            },
+        )
+    url = f"/api/columns/{column['id']}/cards"
+
+    first = client.get(url, params={"limit": 2}).json()
+    second = client.get(url, params={"limit": 2, "after": first["next_cursor"]}).json()
+    third = client.get(url, params={"limit": 2, "after": second["next_cursor"]}).json()
+
+    cards = first["items"] + second["items"] + third["items"]
+    assert [(c["position"], c["id"]) for c in cards] == sorted(
+        (c["position"], c["id"]) for c in cards
+    )
+    assert [c["position"] for c in cards] == [10, 10, 20, 30, 40]
+    assert third["next_cursor"] is None
+
+
+def test_list_column_cards_errors(client):
+    board = _create_board(client)
+    column = client.post(
+        "/api/columns",
+        json={"title": "To Do", "position": 0, "board_id": board["id"]},
+    ).json()
+    url = f"/api/columns/{column['id']}/cards"
+    assert client.get(url, params={"after": "nope"}).status_code == 422
+    assert client.get(url, params={"limit": 0}).status_code == 422
+    assert client.get("/api/columns/9999/cards").status_code == 404
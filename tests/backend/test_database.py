@@ -0,0 +1,117 @@
+import asyncio
+import os
+
+import pytest
+from app.config import Settings
+from app.database import create_async_db_engine, create_db_engine
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool, StaticPool
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_settings_defaults(monkeypatch):
+    monkeypatch.delenv("KANBAN_DATABASE_URL", raising=False)
+    assert Settings.from_env().database_url == "sqlite:///./kanban.db"
+
+
+def test_settings_from_env(monkeypatch):
+    monkeypatch.setenv("KANBAN_DATABASE_URL", "sqlite:///./other.db")
+    monkeypatch.setenv("KANBAN_DB_POOL_SIZE", "12")
+    monkeypatch.setenv("KANBAN_SQLITE_BUSY_TIMEOUT_MS", "250")
+
+    config = Settings.from_env()
+    assert config.database_url == "sqlite:///./other.db"
+    assert config.pool_size == 12
+    assert config.sqlite_busy_timeout_ms == 250
+
+
+def test_sqlite_file_engine_pragmas(tmp_path):
+    config = Settings(
+        database_url=f"sqlite:///{tmp_path / 'kanban.db'}",
+        pool_size=3,
+        sqlite_busy_timeout_ms=1234,
+        sqlite_cache_size_kib=2048,
+    )
+    engine = create_db_engine(config)
+
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.size() == 3
+    assert _pragma(engine, "journal_mode") == "wal"
+    assert _pragma(engine, "synchronous") == 1  # NORMAL
+    assert _pragma(engine, "busy_timeout") == 1234
+    assert _pragma(engine, "cache_size") == -2048
+    engine.dispose()
+
+
+def test_sqlite_memory_engine_shares_one_connection():
+    engine = create_db_engine(Settings(database_url="sqlite://"))
+
+    assert isinstance(engine.pool, StaticPool)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM t")).scalar() == 0
+    engine.dispose()
+
+
+def test_async_engine_picks_driver_from_backend(tmp_path):
+    config = Settings(database_url=f"sqlite:///{tmp_path / 'kanban.db'}")
+    engine = create_async_db_engine(config)
+
+    assert engine.url.drivername == "sqlite+aiosqlite"
+
+    async def journal_mode():
+        async with engine.connect() as conn:
+            mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+        await engine.dispose()
+        return mode
+
+    assert asyncio.run(journal_mode()) == "wal"
+
+
+def test_postgres_engines_pick_drivers_and_pool():
+    pytest.importorskip("asyncpg")
+    pytest.importorskip("psycopg2")
+    config = Settings(
+        database_url="postgresql://kanban@db.internal/kanban",
+        pool_size=7,
+    )
+
+    engine = create_db_engine(config)
+    async_engine = create_async_db_engine(config)
+
+    assert engine.url.drivername == "postgresql+psycopg2"
+    assert async_engine.url.drivername == "postgresql+asyncpg"
+    assert engine.pool.size() == async_engine.pool.size() == 7
+    engine.dispose()
+
+
+@pytest.mark.skipif(
+    not os.environ.get("KANBAN_TEST_DATABASE_URL", "").startswith("postgresql"),
+    reason="needs KANBAN_TEST_DATABASE_URL pointing at PostgreSQL",
+)
+def test_postgres_connection_settings():
+    config = Settings(
+        database_url=os.environ["KANBAN_TEST_DATABASE_URL"],
+        postgres_statement_timeout_ms=1234,
+    )
+    query = text(
+        "SELECT current_setting('application_name'), current_setting('statement_timeout')",
+    )
+    engine = create_db_engine(config)
+    with engine.connect() as conn:
+        assert conn.execute(query).one() == ("kanban", "1234ms")
+    engine.dispose()
+
+    async def async_settings():
+        async_engine = create_async_db_engine(config)
+        async with async_engine.connect() as conn:
+            row = (await conn.execute(query)).one()
+        await async_engine.dispose()
+        return row
+
+    assert asyncio.run(async_settings()) == ("kanban", "1234ms")
@@ -0,0 +1,155 @@
+import json
+import threading
+import time
+
+from app.events import BoardEvent, EventHub, hub
+
+
+def _create_board_with_column(client):
+    board = client.post("/api/boards", json={"title": "Board"}).json()
+    column = client.post(
+        "/api/columns",
+        json={"title": "To Do", "position": 0, "board_id": board["id"]},
+    ).json()
+    return board, column
+
+
+def _drain(subscription):
+    events = []
+    while not subscription.queue.empty():
+        events.append(subscription.queue.get_nowait())
+    return events
+
+
+def test_hub_delivers_only_to_board_subscribers():
+    events = EventHub(max_queue_size=10)
+    watching = events.subscribe(1)
+    other = events.subscribe(2)
+
+    events.publish(BoardEvent(1, 5, "card.created", {"id": 3}))
+
+    assert _drain(watching) == [BoardEvent(1, 5, "card.created", {"id": 3})]
+    assert _drain(other) == []
+
+
+def test_hub_ends_subscriptions_that_fall_behind():
+    events = EventHub(max_queue_size=2)
+    slow = events.subscribe(1)
+
+    for version in range(1, 4):
+        events.publish(BoardEvent(1, version, "card.updated"))
+
+    assert slow.overflowed
+    assert _drain(slow) == [None]
+    assert events.subscriber_count(1) == 0
+
+
+def test_hub_close_ends_all_subscriptions():
+    events = EventHub(max_queue_size=2)
+    subscription = events.subscribe(1)
+
+    events.close()
+
+    assert _drain(subscription) == [None]
+    assert not subscription.overflowed
+    assert events.subscriber_count(1) == 0
+
+
+def test_mutations_publish_events(client):
+    board, column = _create_board_with_column(client)
+    subscription = hub.subscribe(board["id"])
+    try:
+        card = client.post(
+            "/api/cards",
+            json={"title": "Card", "position": 0, "column_id": column["id"]},
+        ).json()
+        client.patch(f"/api/cards/{card['id']}", json={"title": "Renamed"})
+        client.post(f"/api/cards/{card['id']}/move", json={"column_id": column["id"]})
+        client.delete(f"/api/cards/{card['id']}")
+        client.patch(f"/api/columns/{column['id']}", json={"title": "Doing"})
+
+        events = _drain(subscription)
+    finally:
+        hub.unsubscribe(subscription)
+
+    assert [e.type for e in events] == [
+        "card.created",
+        "card.updated",
+        "card.moved",
+        "card.deleted",
+        "column.updated",
+    ]
+    assert [e.version for e in events] == [2, 3, 4, 5, 6]
+    assert events[1].data["title"] == "Renamed"
+    assert events[3].data == {"id": card["id"], "column_id": column["id"]}
+
+
+def test_board_events_stream(client):
+    board, column = _create_board_with_column(client)
+    body = {}
+
+    def consume():
+        with client.stream("GET", f"/api/boards/{board['id']}/events") as response:
+            body["status"] = response.status_code
+            body["text"] = response.read().decode()
+
+    reader = threading.Thread(target=consume)
+    reader.start()
+    deadline = time.monotonic() + 5
+    while hub.subscriber_count(board["id"]) == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    client.post(
+        "/api/cards",
+        json={"title": "Card", "position": 0, "column_id": column["id"]},
+    )
+    client.portal.call(hub.close)
+    reader.join(timeout=5)
+
+    assert body["status"] == 200
+    messages = [m for m in body["text"].split("\n\n") if m]
+    assert messages[0] == 'event: ready\ndata: {"version": 1}'
+    lines = messages[1].split("\n")
+    assert lines[:2] == ["id: 2", "event: card.created"]
+    payload = json.loads(lines[2].removeprefix("data: "))
+    assert payload["board_id"] == board["id"]
+    assert payload["data"]["title"] == "Card"
+
+
+def test_board_events_not_found(client):
+    response = client.get("/api/boards/9999/events")
+    assert response.status_code == 404
+
+
+def test_card_moved_event_lists_respaced_cards(client):
+    board, column = _create_board_with_column(client)
+    cards = [
+        client.post(
+            "/api/cards",
+            json={"title": f"Card {i}", "position": i, "column_id": column["id"]},
+        ).json()
+        for i in range(3)
+    ]
+    subscription = hub.subscribe(board["id"])
+    try:
+        client.post(
+            f"/api/cards/{cards[2]['id']}/move",
+            json={
+                "column_id": column["id"],
+                "after_card_id": cards[0]["id"],
+                "before_card_id": cards[1]["id"],
+            },
+        )
+        (event,) = _drain(subscription)
+    finally:
+        hub.unsubscribe(subscription)
+
+    assert event.type == "card.moved"
+    positions = {card["id"]: card["position"] for card in event.data["respaced"]}
+    listed = client.get(f"/api/cards/{column['id']}").json()
+    assert positions == {
+        card["id"]: card["position"] for card in listed if card["id"] != cards[2]["id"]
+    }
+    assert (
+        positions[cards[0]["id"]] < event.data["position"] < positions[cards[1]["id"]]
+    )
@@ -0,0 +1,102 @@
+import re
+
+
+def _server_timing(response):
+    """Parse a Server-Timing header into {name: {param: value}}."""
+    metrics = {}
+    for entry in response.headers["server-timing"].split(","):
+        name, *params = (part.strip() for part in entry.split(";"))
+        metrics[name] = dict(param.split("=", 1) for param in params)
+    return metrics
+
+
+def _sample(text, name, **labels):
+    """Value of the metric sample with exactly these labels, or None."""
+    label_text = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    match = re.search(
+        rf"^{re.escape(name)}\{{{re.escape(label_text)}\}} (\S+)$",
+        text,
+        re.MULTILINE,
+    )
+    return None if match is None else float(match.group(1))
+
+
+def test_cache_stats(client):
+    response = client.get("/api/cache/stats")
+    assert response.status_code == 200
+    assert set(response.json()) >= {"hits", "misses", "entries", "bytes"}
+
+
+def test_server_timing_reports_queries(client, query_counter):
+    board = client.post("/api/boards", json={"title": "Board"}).json()
+
+    query_counter.reset()
+    response = client.get(f"/api/boards/{board['id']}")
+
+    timing = _server_timing(response)
+    assert set(timing) == {"db", "handler", "serialize", "app"}
+    assert timing["db"]["desc"] == f'"{query_counter.count} queries"'
+    for metric in timing.values():
+        assert float(metric["dur"]) >= 0
+    assert float(timing["app"]["dur"]) >= float(timing["handler"]["dur"])
+
+
+def test_server_timing_on_errors(client):
+    response = client.get("/api/boards/999")
+    assert response.status_code == 404
+    assert "db" in _server_timing(response)
+
+
+def test_metrics_histograms_per_route(client, query_counter):
+    first = client.post("/api/boards", json={"title": "One"}).json()
+    second = client.post("/api/boards", json={"title": "Two"}).json()
+
+    query_counter.reset()
+    client.get(f"/api/boards/{first['id']}")
+    client.get(f"/api/boards/{second['id']}")
+    client.get("/api/boards/999")
+    queries = query_counter.count
+
+    response = client.get("/api/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    route = {"method": "GET", "route": "/api/boards/{board_id}"}
+
+    assert _sample(text, "kanban_requests_total", **route, status="200") == 2
+    assert _sample(text, "kanban_requests_total", **route, status="404") == 1
+    assert (
+        _sample(
+            text,
+            "kanban_requests_total",
+            method="POST",
+            route="/api/boards",
+            status="201",
+        )
+        == 2
+    )
+    assert _sample(text, "kanban_request_duration_seconds_count", **route) == 3
+    assert _sample(text, "kanban_request_queries_sum", **route) == queries
+    assert (
+        _sample(text, "kanban_request_duration_seconds_bucket", **route, le="+Inf") == 3
+    )
+    assert "# TYPE kanban_request_db_seconds histogram" in text
+    assert "# TYPE kanban_request_serialize_seconds histogram" in text
+
+
+def test_metrics_group_unmatched_paths(client):
+    client.get("/api/no-such-thing/1")
+    client.get("/api/no-such-thing/2")
+
+    text = client.get("/api/metrics").text
+    assert (
+        _sample(
+            text,
+            "kanban_requests_total",
+            method="GET",
+            route="unmatched",
+            status="404",
+        )
+        == 2
+    )
+    assert "/api/no-such-thing" not in text
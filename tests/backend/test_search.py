@@ -0,0 +1,120 @@
+from app import search
+
+
+def _create_column(client, board_title="Board"):
+    board = client.post("/api/boards", json={"title": board_title}).json()
+    return client.post(
+        "/api/columns",
+        json={"title": "To Do", "position": 0, "board_id": board["id"]},
+    ).json()
+
+
+def _create_card(client, column_id, title, description=None):
+    return client.post(
+        "/api/cards",
+        json={
+            "title": title,
+            "description": description,
+            "position": 0,
+            "column_id": column_id,
+        },
+    ).json()
+
+
+def _search(client, **params):
+    response = client.get("/api/search", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_search_ranks_matches_with_context(client):
+    column = _create_column(client, board_title="Roadmap")
+    _create_card(client, column["id"], "Fix login", "Users cannot log in on Safari")
+    best = _create_card(client, column["id"], "Login page redesign", "New login form")
+    _create_card(client, column["id"], "Write docs")
+
+    page = _search(client, q="login")
+
+    assert page["items"][0]["id"] == best["id"]
+    assert len(page["items"]) == 2
+    top = page["items"][0]
+    assert top["column_title"] == "To Do"
+    assert top["board_id"] == column["board_id"]
+    assert top["board_title"] == "Roadmap"
+    assert "<mark>" in top["snippet"]
+    assert page["next_offset"] is None
+    assert page["ranked"] is True
+
+
+def test_search_requires_every_word(client):
+    column = _create_column(client)
+    _create_card(client, column["id"], "Deploy api", "Roll out to staging")
+    _create_card(client, column["id"], "Deploy frontend")
+
+    items = _search(client, q="deploy STAGING")["items"]
+    assert [item["title"] for item in items] == ["Deploy api"]
+
+
+def test_search_treats_query_syntax_literally(client):
+    column = _create_column(client)
+    _create_card(client, column["id"], 'Quote "this" OR that')
+
+    assert len(_search(client, q='"this" OR')["items"]) == 1
+    assert _search(client, q='NOT* (")')["items"] == []
+
+
+def test_search_snippet_escapes_card_text(client):
+    column = _create_column(client)
+    _create_card(client, column["id"], "Broken <script>alert(1)</script> & co")
+
+    (item,) = _search(client, q="broken")["items"]
+    # SQLite escapes the tags; PostgreSQL's ts_headline drops them outright.
+    assert item["snippet"].startswith("<mark>Broken</mark> ")
+    assert item["snippet"].endswith(" &amp; co")
+    assert "<script>" not in item["snippet"]
+
+
+def test_search_follows_card_changes(client):
+    column = _create_column(client)
+    card = _create_card(client, column["id"], "Old title")
+
+    client.patch(f"/api/cards/{card['id']}", json={"title": "New title"})
+    assert _search(client, q="old")["items"] == []
+    assert len(_search(client, q="new")["items"]) == 1
+
+    client.delete(f"/api/cards/{card['id']}")
+    assert _search(client, q="new")["items"] == []
+
+
+def test_search_filters_by_board_and_paginates(client):
+    column = _create_column(client, board_title="First")
+    other = _create_column(client, board_title="Second")
+    for n in range(5):
+        _create_card(client, column["id"], f"Task {n}")
+    _create_card(client, other["id"], "Task elsewhere")
+
+    first = _search(client, q="task", board_id=column["board_id"], limit=3)
+    assert len(first["items"]) == 3
+    assert first["next_offset"] == 3
+    rest = _search(client, q="task", board_id=column["board_id"], limit=3, offset=3)
+    assert len(rest["items"]) == 2
+    assert rest["next_offset"] is None
+    ids = {item["id"] for item in first["items"] + rest["items"]}
+    assert len(ids) == 5
+    assert all(item["board_title"] == "First" for item in first["items"])
+
+
+def test_search_lists_broad_matches_newest_first(client, monkeypatch):
+    monkeypatch.setattr(search, "RANKED_MATCH_LIMIT", 2)
+    column = _create_column(client)
+    cards = [_create_card(client, column["id"], f"Task {n}") for n in range(3)]
+
+    page = _search(client, q="task")
+    assert page["ranked"] is False
+    assert [item["id"] for item in page["items"]] == [c["id"] for c in cards[::-1]]
+    assert page["items"][0]["snippet"] == "<mark>Task</mark> 2"
+
+
+def test_search_rejects_blank_query(client):
+    assert client.get("/api/search", params={"q": "  "}).status_code == 422
+    assert client.get("/api/search").status_code == 422